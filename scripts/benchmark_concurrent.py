@@ -0,0 +1,100 @@
+"""
+Ingestion throughput of ConcurrentDataManager per number of writer threads, and read latency on the
+published version while writers run.
+
+Each writer loads chunks of generators (with their fuels) after a simulated I/O wait per chunk, the part
+of real ingestion (file or network reads, parsing in C extensions) that overlaps across threads.
+
+Usage: python -m scripts.benchmark_concurrent [--chunks N] [--chunk-size N] [--io-ms F] [--writers N ...]
+"""
+import argparse
+import contextlib
+import io
+import threading
+import time
+
+import numpy as np
+
+from src import ObjectClass
+from src.managers.concurrent_manager import ConcurrentDataManager
+
+N_NODES = 100
+
+
+def ingest(manager, writer, n_chunks, chunk_size, io_seconds):
+    node_names = [f"node_{row % N_NODES}" for row in range(chunk_size)]
+    for chunk in range(n_chunks):
+        time.sleep(io_seconds)  # Simulated read of the next chunk
+        names = [f"gen_{writer}_{chunk}_{row}" for row in range(chunk_size)]
+        fuel_names = [f"fuel_{writer}_{chunk}_{row}" for row in range(chunk_size)]
+        manager.add_objects(ObjectClass.Generator, names)
+        manager.add_attributes(ObjectClass.Generator, names, "nominal_power", 100.0)
+        manager.add_memberships(ObjectClass.Generator, names, ObjectClass.Node, node_names)
+        manager.add_objects(ObjectClass.Fuel, fuel_names)
+        manager.add_memberships(ObjectClass.Fuel, fuel_names, ObjectClass.Generator, names)
+
+
+def read_latencies(manager, stop, latencies):
+    """Reader thread: sum a column of the published version in a loop."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        manager.published.get_attribute_column(ObjectClass.Generator, "nominal_power").sum()
+        latencies.append(time.perf_counter() - start)
+        time.sleep(0.001)
+
+
+def run(n_writers, n_chunks, chunk_size, io_seconds, backend):
+    """Return (objects per second, reader latencies) for one ingestion with `n_writers` threads."""
+    manager = ConcurrentDataManager(backend=backend)
+    with contextlib.redirect_stdout(io.StringIO()):
+        with manager:
+            manager.add_objects(ObjectClass.Node, [f"node_{row}" for row in range(N_NODES)])
+            manager.add_objects(ObjectClass.Generator, ["gen_seed"])
+            manager.add_membership(ObjectClass.Generator, "gen_seed", ObjectClass.Node, "node_0")
+            manager.publish()
+            stop, latencies = threading.Event(), []
+            reader = threading.Thread(target=read_latencies, args=(manager, stop, latencies))
+            reader.start()
+            writers = [threading.Thread(target=ingest, args=(manager, writer, n_chunks // n_writers, chunk_size, io_seconds))
+                       for writer in range(n_writers)]
+            start = time.perf_counter()
+            for thread in writers:
+                thread.start()
+            for thread in writers:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            stop.set()
+            reader.join()
+    return 2 * (n_chunks // n_writers) * n_writers * chunk_size / elapsed, np.array(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=64)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--io-ms", type=float, default=20.0)
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--backend", default="columnar", choices=ConcurrentDataManager.BACKENDS)
+    args = parser.parse_args()
+
+    idle = ConcurrentDataManager(backend=args.backend)
+    with contextlib.redirect_stdout(io.StringIO()):
+        with idle:
+            idle.add_objects(ObjectClass.Node, ["node_0"])
+    stop, idle_latencies = threading.Event(), []
+    idle_reader = threading.Thread(target=read_latencies, args=(idle, stop, idle_latencies))
+    idle_reader.start()
+    time.sleep(0.5)
+    stop.set()
+    idle_reader.join()
+    print(f"idle reader: p50 {np.percentile(idle_latencies, 50) * 1e6:.1f} us, "
+          f"p99 {np.percentile(idle_latencies, 99) * 1e6:.1f} us")
+
+    for n_writers in args.writers:
+        throughput, latencies = run(n_writers, args.chunks, args.chunk_size, args.io_ms / 1000, args.backend)
+        print(f"{n_writers:>3} writers: {throughput:10.0f} objects/s, reader p50 {np.percentile(latencies, 50) * 1e6:.1f} us, "
+              f"p99 {np.percentile(latencies, 99) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Cold import cost of the `src` package, as paid by every fresh (e.g. pool worker) process.
+
+Each run starts a new interpreter and times `import src` inside it; the `-X importtime` breakdown
+of the slowest `src` modules is printed for the last run.
+
+Usage: python -m scripts.benchmark_import_time [--runs N] [--module src]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TIMED_IMPORT = "import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+
+
+def run_interpreter(arguments):
+    environment = dict(os.environ, PYTHONPATH=REPOSITORY_ROOT, PYTHONDONTWRITEBYTECODE="")
+    return subprocess.run([sys.executable, *arguments], cwd=REPOSITORY_ROOT, env=environment,
+                          capture_output=True, text=True, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--module", default="src")
+    args = parser.parse_args()
+
+    timings = [float(run_interpreter(["-c", TIMED_IMPORT.format(module=args.module)]).stdout.strip().splitlines()[-1])
+               for _ in range(args.runs)]
+    print(f"import {args.module}: median {statistics.median(timings) * 1e3:.1f} ms, "
+          f"min {min(timings) * 1e3:.1f} ms, max {max(timings) * 1e3:.1f} ms over {args.runs} processes")
+
+    # -X importtime lines: "import time: self [us] | cumulative | imported package"
+    report = run_interpreter(["-X", "importtime", "-c", f"import {args.module}"]).stderr.splitlines()
+    rows = []
+    for line in report[1:]:
+        _, self_us, cumulative_us, module = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if module.startswith("src"):
+            rows.append((int(cumulative_us), int(self_us), module))
+    for cumulative_us, self_us, module in sorted(rows, reverse=True)[:10]:
+        print(f"  {module:<50} self {self_us / 1e3:7.2f} ms  cumulative {cumulative_us / 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Build time vs solve time of the day-ahead dispatch LP (HiGHS through SciPy).
+
+Usage: python -m scripts.benchmark_lp [--units N] [--nodes N] [--intervals N] [--no-solve]
+"""
+import argparse
+import time
+
+from scripts.benchmark_dispatch import synthetic_dispatch_data
+from src.dispatch import build_dispatch_lp
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--units", type=int, default=10_000)
+    parser.add_argument("--nodes", type=int, default=1_000)
+    parser.add_argument("--intervals", type=int, default=96)
+    parser.add_argument("--no-solve", action="store_true", help="Only time the model build.")
+    args = parser.parse_args()
+
+    data = synthetic_dispatch_data(args.units, args.nodes, args.intervals)
+    start = time.perf_counter()
+    linear_program = build_dispatch_lp(data)
+    build_time = time.perf_counter() - start
+    print(f"{args.units} units x {args.intervals} intervals: {linear_program.n_variables} variables, "
+          f"{linear_program.A_eq.shape[0]} balance rows, {linear_program.A_eq.nnz} non-zeros")
+    print(f"build: {build_time * 1e3:.1f} ms")
+    if args.no_solve:
+        return
+
+    start = time.perf_counter()
+    linear_program.solve()
+    solve_time = time.perf_counter() - start
+    print(f"solve: {solve_time * 1e3:.1f} ms (build is {build_time / solve_time:.2%} of solve time)")
+
+
+if __name__ == "__main__":
+    main()
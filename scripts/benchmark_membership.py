@@ -0,0 +1,92 @@
+"""
+Per-membership overhead of the relationship checks: registry + compiled rule tables vs the
+previous implementation, which rebuilt the subclass lookups from `AbstractObject.__subclasses__()`
+on every call (reproduced below as `legacy_*`).
+
+Usage: python -m scripts.benchmark_membership [--repeat N] [--memberships N]
+"""
+import argparse
+import timeit
+
+from src import DataManager, ObjectClass
+from src.objects.abstract_object_class import AbstractObject
+from src.managers.relationship_validator import RelationshipValidator
+
+
+def legacy_get_abstract_object_subclass(object_class_name):
+    subclass_lookup = {cls.__name__: cls for cls in AbstractObject.__subclasses__()}
+    if object_class_name not in subclass_lookup:
+        raise ValueError(f"'{object_class_name}' is not a recognized subclass of AbstractObject.")
+    return subclass_lookup[object_class_name]
+
+
+def legacy_get_object_class_name(object_class):
+    if isinstance(object_class, type) and issubclass(object_class, AbstractObject):
+        return object_class.__name__
+    if object_class in {subclass.__name__ for subclass in AbstractObject.__subclasses__()}:
+        return object_class
+    raise ValueError(f"'{object_class}' is not a valid AbstractObject subclass name.")
+
+
+def legacy_is_valid_child(parent_class, child_class):
+    parent_class = legacy_get_abstract_object_subclass(legacy_get_object_class_name(parent_class))
+    child_class = legacy_get_abstract_object_subclass(legacy_get_object_class_name(child_class))
+    return child_class in RelationshipValidator.rules.get(parent_class, {}).get("children", [])
+
+
+def legacy_is_valid_parent(child_class, parent_class):
+    child_class = legacy_get_abstract_object_subclass(legacy_get_object_class_name(child_class))
+    parent_class = legacy_get_abstract_object_subclass(legacy_get_object_class_name(parent_class))
+    allowed_parents = RelationshipValidator.rules.get(child_class, {}).get("parent", None)
+    return parent_class in allowed_parents if allowed_parents else True
+
+
+def time_per_call(statement, number, repeat):
+    """Best-of-`repeat` time of one call, in microseconds."""
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number * 1e6
+
+
+def time_add_membership(memberships, repeat):
+    """Best-of-`repeat` time of one DataManager.add_membership call, in microseconds."""
+    timings = []
+    for _ in range(repeat):
+        manager = DataManager()
+        with manager:
+            manager.add_objects(ObjectClass.Node, ["node_1"])
+            manager.add_objects(ObjectClass.Generator, [f"gen_{i}" for i in range(memberships)])
+            timings.append(timeit.timeit(
+                lambda names=iter(range(memberships)): manager.add_membership(ObjectClass.Generator,
+                                                                              f"gen_{next(names)}",
+                                                                              ObjectClass.Node,
+                                                                              "node_1"),
+                number=memberships))
+    return min(timings) / memberships * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--memberships", type=int, default=50_000)
+    args = parser.parse_args()
+
+    node, generator = ObjectClass.Node, ObjectClass.Generator
+    checks = {
+        "is_valid_child (legacy)": lambda: legacy_is_valid_child(node, generator),
+        "is_valid_child (compiled)": lambda: RelationshipValidator.is_valid_child(node, generator),
+        "is_valid_parent (legacy)": lambda: legacy_is_valid_parent(generator, node),
+        "is_valid_parent (compiled)": lambda: RelationshipValidator.is_valid_parent(generator, node),
+    }
+    timings = {}
+    for label, statement in checks.items():
+        timings[label] = time_per_call(statement, args.memberships, args.repeat)
+        print(f"{label:<30} {timings[label]:8.3f} us/call")
+
+    legacy_overhead = timings["is_valid_child (legacy)"] + timings["is_valid_parent (legacy)"]
+    compiled_overhead = timings["is_valid_child (compiled)"] + timings["is_valid_parent (compiled)"]
+    print(f"{'validation per membership':<30} {legacy_overhead:8.3f} us (legacy) -> {compiled_overhead:.3f} us "
+          f"(compiled), x{legacy_overhead / compiled_overhead:.1f}")
+    print(f"{'add_membership':<30} {time_add_membership(args.memberships, args.repeat):8.3f} us/call")
+
+
+if __name__ == "__main__":
+    main()
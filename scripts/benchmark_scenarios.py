@@ -0,0 +1,59 @@
+"""
+Scenario throughput of ScenarioRunner as the number of worker processes grows.
+
+Usage: python -m scripts.benchmark_scenarios [--units N] [--nodes N] [--intervals N] [--scenarios N] [--workers N ...]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from scripts.benchmark_dispatch import synthetic_dispatch_data
+from src.scenarios import Scenario, ScenarioRunner
+
+
+def synthetic_base(n_units, n_nodes, n_intervals):
+    """Synthetic network with one load per node and one fuel per generator, so scenarios can override them."""
+    data = synthetic_dispatch_data(n_units, n_nodes, n_intervals)
+    data.demand_profile = data.demand[:, 0] / data.demand[:, 0].max()
+    data.load = data.demand.max(axis=0)
+    data.load_node = np.arange(n_nodes)
+    data.load_names = [f"load_{i}" for i in range(n_nodes)]
+    data.fuel_price = data.marginal_cost.copy()
+    data.fuel_generator = np.arange(n_units)
+    data.fuel_names = [f"fuel_{i}" for i in range(n_units)]
+    return data
+
+
+def synthetic_scenarios(data, n_scenarios, seed=1):
+    rng = np.random.default_rng(seed)
+    for index in range(n_scenarios):
+        shocked_fuels = rng.choice(len(data.fuel_names), size=10, replace=False)
+        yield Scenario(name=f"scenario_{index}",
+                       load_scale=float(rng.uniform(0.8, 1.2)),
+                       fuel_prices={data.fuel_names[row]: float(data.fuel_price[row] * 2.0) for row in shocked_fuels})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--units", type=int, default=10_000)
+    parser.add_argument("--nodes", type=int, default=500)
+    parser.add_argument("--intervals", type=int, default=96)
+    parser.add_argument("--scenarios", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, max(1, (os.cpu_count() or 1) // 2), os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    data = synthetic_base(args.units, args.nodes, args.intervals)
+    for max_workers in args.workers:
+        with ScenarioRunner(data, max_workers=max_workers) as runner:
+            list(runner.run(synthetic_scenarios(data, max_workers)))  # Warm the workers up
+            start = time.perf_counter()
+            n_results = sum(1 for _ in runner.run(synthetic_scenarios(data, args.scenarios)))
+            elapsed = time.perf_counter() - start
+        print(f"{max_workers:>3} workers: {n_results} scenarios in {elapsed:.2f} s ({n_results / elapsed:.1f} scenarios/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Scaling benchmarks of the DataManager on synthetic networks (see scripts.synthetic_network).
+
+For each size and backend, a fresh manager is built with one call per object, attribute and membership,
+then closed (validation) and read back. Every phase is timed over `--repeat` runs (the median is reported,
+the best run is compared against a baseline), and a separate traced run measures the peak memory of the build.
+
+Usage:
+    python -m scripts.benchmark_suite [--sizes N ...] [--backends dict columnar] [--repeat N] [--output results.json]
+    python -m scripts.benchmark_suite --baseline baseline.json [--tolerance 0.25]
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from scripts.synthetic_network import (SyntheticNetwork, add_network_attributes, add_network_memberships,
+                                       add_network_objects, synthetic_network)
+from src import DataManager, ObjectClass
+
+DEFAULT_SIZES = [10 ** exponent for exponent in range(2, 6)]
+DEFAULT_TOLERANCE = 0.25
+# Phases shorter than this are too noisy to be compared against a baseline
+MIN_COMPARED_SECONDS = 1e-3
+PHASES = ("add_object", "add_attribute", "add_membership", "validation", "attribute_read", "attribute_column")
+
+
+def run_phases(network: SyntheticNetwork, backend: str) -> dict:
+    """Build, close and read a network once; return {phase: (seconds, operations)}."""
+    manager = DataManager(backend=backend)
+    timings = {}
+
+    def timed(phase, operations, function, *args):
+        start = time.perf_counter()
+        function(*args)
+        timings[phase] = (time.perf_counter() - start, operations)
+
+    manager.__enter__()
+    timed("add_object", network.n_objects, add_network_objects, manager, network)
+    timed("add_attribute", len(network.generator_names) + len(network.load_names) + len(network.fuel_names),
+          add_network_attributes, manager, network)
+    timed("add_membership", network.n_memberships, add_network_memberships, manager, network)
+    with contextlib.redirect_stdout(io.StringIO()):
+        timed("validation", network.n_objects, manager.__exit__, None, None, None)
+    timed("attribute_read", len(network.generator_names), lambda: [
+        manager.get_object_attribute(ObjectClass.Generator, object_name, "nominal_power")
+        for object_name in network.generator_names])
+    timed("attribute_column", len(network.generator_names),
+          manager.get_attribute_column, ObjectClass.Generator, "nominal_power")
+    return timings
+
+
+def peak_memory(network: SyntheticNetwork, backend: str) -> int:
+    """Peak traced memory, in bytes, of building and closing a network (excluding the network itself)."""
+    tracemalloc.start()
+    try:
+        run_phases(network, backend)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_suite(sizes, backends, repeat: int, seed: int = 0) -> dict:
+    results = []
+    for size in sizes:
+        network = synthetic_network(size, seed)
+        for backend in backends:
+            runs = [run_phases(network, backend) for _ in range(repeat)]
+            result = {"size": network.n_objects, "requested_size": size, "backend": backend, "phases": {}}
+            for phase in PHASES:
+                seconds = [run[phase][0] for run in runs]
+                operations = runs[0][phase][1]
+                median = statistics.median(seconds)
+                result["phases"][phase] = {"median_s": median,
+                                           "min_s": min(seconds),
+                                           "max_s": max(seconds),
+                                           "operations": operations,
+                                           "per_operation_us": median / max(operations, 1) * 1e6}
+            result["peak_memory_bytes"] = peak_memory(network, backend)
+            results.append(result)
+            print_result(result, file=sys.stderr)
+    return {"metadata": {"created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                         "python": platform.python_version(),
+                         "numpy": np.__version__,
+                         "platform": platform.platform(),
+                         "repeat": repeat,
+                         "seed": seed},
+            "results": results,
+            "scaling": scaling_exponents(results)}
+
+
+def scaling_exponents(results) -> dict:
+    """
+    Least-squares slope of log(time) against log(size) per backend and phase: about 1 for linear
+    scaling, 2 for quadratic (per-operation costs growing with the model).
+    """
+    exponents = {}
+    for backend in dict.fromkeys(result["backend"] for result in results):
+        backend_results = [result for result in results if result["backend"] == backend]
+        if len(backend_results) < 2:
+            continue
+        sizes = np.log([result["size"] for result in backend_results])
+        exponents[backend] = {}
+        for phase in PHASES:
+            seconds = np.log([max(result["phases"][phase]["median_s"], 1e-9) for result in backend_results])
+            exponents[backend][phase] = float(np.polyfit(sizes, seconds, 1)[0])
+        memory = np.log([result["peak_memory_bytes"] for result in backend_results])
+        exponents[backend]["peak_memory"] = float(np.polyfit(sizes, memory, 1)[0])
+    return exponents
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Return the (backend, size, metric, baseline, current) entries more than `tolerance` slower or larger."""
+    baseline_results = {(result["backend"], result["requested_size"]): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        reference = baseline_results.get((result["backend"], result["requested_size"]))
+        if reference is None:
+            continue
+        for phase in PHASES:
+            before, after = reference["phases"][phase]["min_s"], result["phases"][phase]["min_s"]
+            if max(before, after) >= MIN_COMPARED_SECONDS and after > before * (1 + tolerance):
+                regressions.append((result["backend"], result["requested_size"], phase, before, after))
+        before, after = reference["peak_memory_bytes"], result["peak_memory_bytes"]
+        if after > before * (1 + tolerance):
+            regressions.append((result["backend"], result["requested_size"], "peak_memory", before, after))
+    return regressions
+
+
+def print_result(result: dict, file=sys.stdout) -> None:
+    phases = "  ".join(f"{phase} {values['per_operation_us']:.2f}us" for phase, values in result["phases"].items())
+    print(f"{result['backend']:<9} {result['size']:>9} objects  {phases}  "
+          f"peak {result['peak_memory_bytes'] / 2 ** 20:.1f} MiB", file=file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--backends", nargs="+", default=list(DataManager.BACKENDS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare the results against this JSON file and fail on regressions.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown before a phase is flagged (default: %(default)s).")
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.backends, args.repeat, args.seed)
+    for backend, exponents in results["scaling"].items():
+        print(f"{backend:<9} scaling exponents: " + "  ".join(f"{name} {value:.2f}" for name, value in exponents.items()))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for backend, size, metric, before, after in regressions:
+            print(f"REGRESSION {backend} {size} {metric}: {before:.6g} -> {after:.6g} (x{after / before:.2f})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression beyond {args.tolerance:.0%} against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
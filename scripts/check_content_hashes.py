@@ -0,0 +1,84 @@
+"""
+Regression check of the content hashes: the same model built in different orders, on both backends and with
+its hashes read at different points of the build, must have the same root hash and an empty diff. An overlay
+(whose index starts from the index of its base) must hash like the same changes flattened into a new model.
+
+Usage: python -m scripts.check_content_hashes [--objects N] [--seed N]
+"""
+import argparse
+import contextlib
+import io
+import sys
+
+import numpy as np
+
+from src import ObjectClass
+from src.managers.data_manager import DataManager
+from src.managers.overlay_manager import OverlayDataManager
+from scripts.synthetic_network import synthetic_network, populate
+
+N_INTERVALS = 24
+
+
+def build(network, backend, series_first, read_hashes_early):
+    """Build the network, then set load series and a generator change, in the given order."""
+    manager = DataManager(backend=backend)
+    load_names = network.load_names
+    profiles = np.outer(np.arange(1, len(load_names) + 1, dtype=np.float64), np.linspace(0.5, 1.5, N_INTERVALS))
+    steps = [
+        lambda: manager.add_attribute(ObjectClass.Load, load_names[0], "load", profiles[0]),  # Creates the table
+        lambda: manager.add_attributes(ObjectClass.Load, load_names[1:3], "load", profiles[1:3]),
+        lambda: manager.add_attribute(ObjectClass.Generator, network.generator_names[0], "nominal_power", 1.0),
+    ]
+    with contextlib.redirect_stdout(io.StringIO()):
+        with manager:
+            populate(manager, network)
+            if read_hashes_early:
+                manager.content_hashes.root_hash()
+            for step in (steps if series_first else steps[::-1]):
+                step()
+                if read_hashes_early:
+                    manager.content_hashes.root_hash()
+    return manager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    network = synthetic_network(args.objects, seed=args.seed)
+    reference = build(network, "dict", series_first=True, read_hashes_early=False)
+    failures = 0
+    for backend in DataManager.BACKENDS:
+        for series_first in (True, False):
+            for read_hashes_early in (False, True):
+                manager = build(network, backend, series_first, read_hashes_early)
+                model_diff = reference.diff(manager)
+                same_root = reference.content_hashes.root_hash() == manager.content_hashes.root_hash()
+                ok = same_root and model_diff.is_empty()
+                failures += not ok
+                print(f"{backend:>8} series_first={series_first!s:<5} read_hashes_early={read_hashes_early!s:<5} "
+                      f"{'ok' if ok else f'FAILED {model_diff}'}")
+    for read_hashes_early in (False, True):
+        base = build(network, "columnar", series_first=True, read_hashes_early=False)
+        base.freeze()
+        base.content_hashes.root_hash()
+        overlay = OverlayDataManager(base)
+        with contextlib.redirect_stdout(io.StringIO()):
+            with overlay:
+                if read_hashes_early:
+                    overlay.content_hashes.root_hash()
+                overlay.add_attribute(ObjectClass.Generator, network.generator_names[1], "nominal_power", 2.0)
+                overlay.add_attribute(ObjectClass.Load, network.load_names[3], "load", np.ones(N_INTERVALS))
+            flat = overlay.flatten()
+        model_diff = flat.diff(overlay)
+        ok = flat.content_hashes.root_hash() == overlay.content_hashes.root_hash() and model_diff.is_empty()
+        failures += not ok
+        print(f"{'overlay':>8} read_hashes_early={read_hashes_early!s:<5} {'ok' if ok else f'FAILED {model_diff}'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Simulated concurrent ingestion through AsyncDataManager: producers of three kinds feed one model at once.
+
+- watcher: a file watcher, waiting for each new file (simulated I/O delay) before parsing it.
+- queue: a consumer of a local message queue, filled by a publisher task at its own pace.
+- sqlite: a reader of a SQLite dump, fetching each chunk of rows in a worker thread.
+
+Every chunk adds generators (nominal power, node membership) and their fuels. For each number of producers
+the harness reports ingestion throughput, the deepest queue seen by producers and the event-loop lag (how late
+a 1 ms ticker wakes up), the loop staying responsive while the writer thread builds and validates the model.
+The synchronous baseline runs the same producers one after the other with plain DataManager calls.
+
+Usage: python -m scripts.simulate_async_ingestion [--chunks N] [--chunk-size N] [--io-ms F] [--producers N ...]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import time
+
+import numpy as np
+
+from src import ObjectClass
+from src.managers.async_manager import AsyncDataManager, DEFAULT_MAX_QUEUE_SIZE
+from src.managers.data_manager import DataManager
+
+N_NODES = 100
+KINDS = ("watcher", "queue", "sqlite")
+
+
+def chunk_rows(producer, chunk, chunk_size):
+    """(generator names, nominal powers, node names, fuel names) of one chunk."""
+    names = [f"gen_{producer}_{chunk}_{row}" for row in range(chunk_size)]
+    powers = [float(50 + (row * 37) % 400) for row in range(chunk_size)]
+    node_names = [f"node_{(producer + row) % N_NODES}" for row in range(chunk_size)]
+    fuel_names = [f"fuel_{producer}_{chunk}_{row}" for row in range(chunk_size)]
+    return names, powers, node_names, fuel_names
+
+
+def write_sqlite_dump(path, producer, n_chunks, chunk_size):
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE generator (chunk INTEGER, name TEXT, nominal_power REAL, node TEXT, fuel TEXT)")
+        for chunk in range(n_chunks):
+            names, powers, node_names, fuel_names = chunk_rows(producer, chunk, chunk_size)
+            connection.executemany("INSERT INTO generator VALUES (?, ?, ?, ?, ?)",
+                                   [(chunk, *row) for row in zip(names, powers, node_names, fuel_names)])
+
+
+def read_sqlite_chunk(path, chunk, io_seconds):
+    time.sleep(io_seconds)  # Simulated disk latency of the dump
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute("SELECT name, nominal_power, node, fuel FROM generator WHERE chunk = ? ORDER BY rowid",
+                                  (chunk,)).fetchall()
+    return tuple(list(column) for column in zip(*rows))
+
+
+async def add_chunk(manager, names, powers, node_names, fuel_names):
+    await manager.add_objects(ObjectClass.Generator, names)
+    await manager.add_attributes(ObjectClass.Generator, names, "nominal_power", powers)
+    await manager.add_memberships(ObjectClass.Generator, names, ObjectClass.Node, node_names)
+    await manager.add_objects(ObjectClass.Fuel, fuel_names)
+    await manager.add_memberships(ObjectClass.Fuel, fuel_names, ObjectClass.Generator, names)
+
+
+async def watcher_producer(manager, producer, n_chunks, chunk_size, io_seconds, _):
+    for chunk in range(n_chunks):
+        await asyncio.sleep(io_seconds)  # Next file appears
+        await add_chunk(manager, *chunk_rows(producer, chunk, chunk_size))
+
+
+async def queue_producer(manager, producer, n_chunks, chunk_size, io_seconds, _):
+    messages = asyncio.Queue(maxsize=4)
+
+    async def publish():
+        for chunk in range(n_chunks):
+            await asyncio.sleep(io_seconds)
+            await messages.put(chunk_rows(producer, chunk, chunk_size))
+        await messages.put(None)
+
+    publisher = asyncio.create_task(publish())
+    while (message := await messages.get()) is not None:
+        await add_chunk(manager, *message)
+    await publisher
+
+
+async def sqlite_producer(manager, producer, n_chunks, chunk_size, io_seconds, dump_path):
+    for chunk in range(n_chunks):
+        await add_chunk(manager, *await asyncio.to_thread(read_sqlite_chunk, dump_path, chunk, io_seconds))
+
+
+PRODUCERS = {"watcher": watcher_producer, "queue": queue_producer, "sqlite": sqlite_producer}
+
+
+async def measure_loop_lag(stop, lags):
+    """Ticker: how late the event loop wakes up a 1 ms sleep."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def run_async(n_producers, n_chunks, chunk_size, io_seconds, backend, max_queue_size, dump_paths):
+    manager = AsyncDataManager(DataManager(backend=backend), max_queue_size=max_queue_size)
+    stop, lags = asyncio.Event(), []
+    ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        async with manager:
+            await manager.add_objects(ObjectClass.Node, [f"node_{row}" for row in range(N_NODES)])
+            await asyncio.gather(*(PRODUCERS[KINDS[producer % len(KINDS)]](
+                manager, producer, n_chunks, chunk_size, io_seconds, dump_paths[producer])
+                for producer in range(n_producers)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return 2 * n_producers * n_chunks * chunk_size / elapsed, manager.max_queue_depth, np.array(lags)
+
+
+def run_sync(n_producers, n_chunks, chunk_size, io_seconds, backend, dump_paths):
+    """Baseline: the same sources read one after the other, each chunk applied before the next read."""
+    manager = DataManager(backend=backend)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with manager:
+            manager.add_objects(ObjectClass.Node, [f"node_{row}" for row in range(N_NODES)])
+            for producer in range(n_producers):
+                for chunk in range(n_chunks):
+                    if KINDS[producer % len(KINDS)] == "sqlite":
+                        names, powers, node_names, fuel_names = read_sqlite_chunk(dump_paths[producer], chunk, io_seconds)
+                    else:
+                        time.sleep(io_seconds)
+                        names, powers, node_names, fuel_names = chunk_rows(producer, chunk, chunk_size)
+                    manager.add_objects(ObjectClass.Generator, names)
+                    manager.add_attributes(ObjectClass.Generator, names, "nominal_power", powers)
+                    manager.add_memberships(ObjectClass.Generator, names, ObjectClass.Node, node_names)
+                    manager.add_objects(ObjectClass.Fuel, fuel_names)
+                    manager.add_memberships(ObjectClass.Fuel, fuel_names, ObjectClass.Generator, names)
+    return 2 * n_producers * n_chunks * chunk_size / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=20, help="Chunks per producer")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--io-ms", type=float, default=20.0, help="Simulated I/O wait per chunk")
+    parser.add_argument("--producers", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_MAX_QUEUE_SIZE)
+    parser.add_argument("--backend", default="columnar", choices=DataManager.BACKENDS)
+    parser.add_argument("--no-sync", action="store_true", help="Skip the synchronous baseline")
+    args = parser.parse_args()
+    io_seconds = args.io_ms / 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        dump_paths = {}
+        for producer in range(max(args.producers)):
+            if KINDS[producer % len(KINDS)] == "sqlite":
+                dump_paths[producer] = os.path.join(directory, f"dump_{producer}.sqlite")
+                write_sqlite_dump(dump_paths[producer], producer, args.chunks, args.chunk_size)
+            else:
+                dump_paths[producer] = None
+
+        for n_producers in args.producers:
+            throughput, max_depth, lags = asyncio.run(run_async(
+                n_producers, args.chunks, args.chunk_size, io_seconds, args.backend, args.queue_size, dump_paths))
+            line = (f"{n_producers:>3} producers: async {throughput:10.0f} objects/s, max queue depth {max_depth:>3}, "
+                    f"loop lag p50 {np.percentile(lags, 50) * 1e3:.2f} ms, p99 {np.percentile(lags, 99) * 1e3:.2f} ms")
+            if not args.no_sync:
+                line += f" | sync {run_sync(n_producers, args.chunks, args.chunk_size, io_seconds, args.backend, dump_paths):10.0f} objects/s"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
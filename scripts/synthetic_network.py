@@ -0,0 +1,126 @@
+"""
+Synthetic day-ahead networks for benchmarks: nodes -> generators and loads, generators -> fuels.
+
+Usage: python -m scripts.synthetic_network [--objects N] [--seed N]
+"""
+import argparse
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from src import DataManager, ObjectClass
+
+MEAN_GENERATORS_PER_NODE = 4
+FUEL_SHARE = 0.8  # Share of the generators with a Fuel (renewables have none)
+
+
+@dataclass
+class SyntheticNetwork:
+    """Object names, attribute values and memberships of a synthetic network (memberships are row indexes)."""
+    node_names: List[str]
+    generator_names: List[str]
+    generator_node: np.ndarray
+    nominal_power: np.ndarray
+    load_names: List[str]
+    load_node: np.ndarray
+    load: np.ndarray
+    fuel_names: List[str]
+    fuel_generator: np.ndarray
+    price: np.ndarray
+
+    @property
+    def n_objects(self) -> int:
+        return len(self.node_names) + len(self.generator_names) + len(self.load_names) + len(self.fuel_names)
+
+    @property
+    def n_memberships(self) -> int:
+        return len(self.generator_names) + len(self.load_names) + len(self.fuel_names)
+
+
+def synthetic_network(n_objects: int, seed: int = 0) -> SyntheticNetwork:
+    """
+    Network of about `n_objects` objects with a realistic fan-out: a Poisson number of generators
+    (mean MEAN_GENERATORS_PER_NODE) and one load per node, and one fuel for FUEL_SHARE of the generators.
+    """
+    rng = np.random.default_rng(seed)
+    objects_per_node = 2 + MEAN_GENERATORS_PER_NODE * (1 + FUEL_SHARE)
+    n_nodes = max(1, round(n_objects / objects_per_node))
+    generators_per_node = rng.poisson(MEAN_GENERATORS_PER_NODE, n_nodes)
+    generator_node = np.repeat(np.arange(n_nodes), generators_per_node)
+    n_generators = len(generator_node)
+    nominal_power = rng.uniform(10.0, 500.0, n_generators)
+    node_capacity = np.bincount(generator_node, weights=nominal_power, minlength=n_nodes)
+    fuel_generator = np.flatnonzero(rng.random(n_generators) < FUEL_SHARE)
+    return SyntheticNetwork(node_names=[f"node_{i}" for i in range(n_nodes)],
+                            generator_names=[f"gen_{i}" for i in range(n_generators)],
+                            generator_node=generator_node,
+                            nominal_power=nominal_power,
+                            load_names=[f"load_{i}" for i in range(n_nodes)],
+                            load_node=np.arange(n_nodes),
+                            load=node_capacity * rng.uniform(0.3, 0.8, n_nodes),
+                            fuel_names=[f"fuel_{i}" for i in range(len(fuel_generator))],
+                            fuel_generator=fuel_generator,
+                            price=rng.uniform(5.0, 150.0, len(fuel_generator)))
+
+
+def add_network_objects(manager: DataManager, network: SyntheticNetwork) -> None:
+    """Add every object with one `add_object` call per object."""
+    for object_class, object_names in ((ObjectClass.Node, network.node_names),
+                                       (ObjectClass.Generator, network.generator_names),
+                                       (ObjectClass.Load, network.load_names),
+                                       (ObjectClass.Fuel, network.fuel_names)):
+        for object_name in object_names:
+            manager.add_object(object_class, object_name)
+
+
+def add_network_attributes(manager: DataManager, network: SyntheticNetwork) -> None:
+    """Set every attribute with one `add_attribute` call per value."""
+    for object_class, object_names, attr_name, attr_values in (
+            (ObjectClass.Generator, network.generator_names, "nominal_power", network.nominal_power),
+            (ObjectClass.Load, network.load_names, "load", network.load),
+            (ObjectClass.Fuel, network.fuel_names, "price", network.price)):
+        for object_name, attr_value in zip(object_names, attr_values.tolist()):
+            manager.add_attribute(object_class, object_name, attr_name, attr_value)
+
+
+def add_network_memberships(manager: DataManager, network: SyntheticNetwork) -> None:
+    """Attach every child to its parent with one `add_membership` call per membership."""
+    for child_class, child_names, parent_class, parent_names, parent_rows in (
+            (ObjectClass.Generator, network.generator_names, ObjectClass.Node, network.node_names, network.generator_node),
+            (ObjectClass.Load, network.load_names, ObjectClass.Node, network.node_names, network.load_node),
+            (ObjectClass.Fuel, network.fuel_names, ObjectClass.Generator, network.generator_names, network.fuel_generator)):
+        for child_name, parent_row in zip(child_names, parent_rows.tolist()):
+            manager.add_membership(child_class, child_name, parent_class, parent_names[parent_row])
+
+
+def populate(manager: DataManager, network: SyntheticNetwork) -> None:
+    """Load a network into an open manager through the batch API."""
+    manager.add_objects(ObjectClass.Node, network.node_names)
+    for object_class, object_names, attr_name, attr_values in (
+            (ObjectClass.Generator, network.generator_names, "nominal_power", network.nominal_power),
+            (ObjectClass.Load, network.load_names, "load", network.load),
+            (ObjectClass.Fuel, network.fuel_names, "price", network.price)):
+        manager.add_objects(object_class, object_names)
+        manager.add_attributes(object_class, object_names, attr_name, attr_values.tolist())
+    manager.add_memberships(ObjectClass.Generator, network.generator_names, ObjectClass.Node,
+                            [network.node_names[row] for row in network.generator_node.tolist()])
+    manager.add_memberships(ObjectClass.Load, network.load_names, ObjectClass.Node,
+                            [network.node_names[row] for row in network.load_node.tolist()])
+    manager.add_memberships(ObjectClass.Fuel, network.fuel_names, ObjectClass.Generator,
+                            [network.generator_names[row] for row in network.fuel_generator.tolist()])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    network = synthetic_network(args.objects, args.seed)
+    print(f"{network.n_objects} objects: {len(network.node_names)} nodes, {len(network.generator_names)} generators, "
+          f"{len(network.load_names)} loads, {len(network.fuel_names)} fuels; {network.n_memberships} memberships")
+
+
+if __name__ == "__main__":
+    main()
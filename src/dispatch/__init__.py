@@ -0,0 +1,3 @@
+from .dispatch_data import DispatchData, extract_dispatch_data
+from .merit_order import DispatchResult, merit_order_dispatch, solve_single_bus, solve_per_node
+from .lp_formulation import DispatchLinearProgram, build_dispatch_lp
@@ -0,0 +1,138 @@
+from src.managers.data_manager import DataManager
+from src.objects import ObjectClass
+from dataclasses import dataclass, field
+from typing import List, Optional
+import numpy as np
+import scipy.sparse as sp
+
+DEFAULT_N_INTERVALS = 24
+
+
+@dataclass
+class DispatchData:
+    """
+    Array view of a network for dispatch, with generators and nodes in a fixed integer order.
+
+    - capacity[g]: `Generator.nominal_power`.
+    - marginal_cost[g]: `Fuel.price` of the generator's fuel (the cheapest one if it has several,
+      0.0 if it has none, e.g. renewables).
+    - generator_node[g]: index in `node_names` of the generator's parent Node.
+    - demand[t, n]: total `Load.load` under node n in interval t.
+    The per-object inputs of `marginal_cost` and `demand` are kept too, so scenarios can rebuild them:
+    - load[l], load_node[l]: `Load.load` and node index of each load (-1 if it has no node); load is
+      (loads, intervals) when `Load.load` holds time series.
+    - fuel_price[f], fuel_generator[f]: `Fuel.price` and generator index of each fuel (-1 if it has no generator).
+    - demand_profile[t]: factor applied to the loads in interval t.
+    """
+    generator_names: List[str]
+    node_names: List[str]
+    capacity: np.ndarray
+    marginal_cost: np.ndarray
+    generator_node: np.ndarray
+    demand: np.ndarray
+    load_names: List[str] = field(default_factory=list)
+    load: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    load_node: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    fuel_names: List[str] = field(default_factory=list)
+    fuel_price: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    fuel_generator: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    demand_profile: Optional[np.ndarray] = None
+
+    @property
+    def n_intervals(self) -> int:
+        return self.demand.shape[0]
+
+
+def extract_dispatch_data(manager: DataManager,
+                          n_intervals: Optional[int] = None,
+                          demand_profile: Optional[np.ndarray] = None
+                          ) -> DispatchData:
+    """
+    Extract the dispatch arrays from a DataManager.
+
+    The scalar `Load.load` values are repeated over `n_intervals` (default DEFAULT_N_INTERVALS);
+    `demand_profile` (one factor per interval, overriding `n_intervals`) scales them instead, giving the
+    horizon its shape. When `Load.load` holds time series, they define the horizon and the profile
+    (if any) scales them. Capacities and fuel prices are constant over the horizon, so time series
+    of `Generator.nominal_power` or `Fuel.price` are rejected rather than silently ignored.
+    """
+    constant_series = [f"{object_class.__name__}.{attr_name}"
+                       for object_class, attr_name in ((ObjectClass.Generator, "nominal_power"), (ObjectClass.Fuel, "price"))
+                       if manager.has_time_series(object_class, attr_name)]
+    if constant_series:
+        raise ValueError(f"Dispatch uses constant capacities and fuel prices, but {constant_series} hold time series.")
+    node_names = manager.get_object_names(ObjectClass.Node)
+    node_index = {node_name: index for index, node_name in enumerate(node_names)}
+    generator_names = manager.get_object_names(ObjectClass.Generator)
+    generator_index = {generator_name: index for index, generator_name in enumerate(generator_names)}
+
+    capacity = np.array(manager.get_attribute_column(ObjectClass.Generator, "nominal_power"), dtype=np.float64)
+    generator_node = np.array([node_index[generator.parent["Node"]] if "Node" in generator.parent else -1
+                               for generator in manager.get_object_class_instances(ObjectClass.Generator)]
+                              if generator_names else [], dtype=np.int64)
+    if (generator_node < 0).any():
+        missing = [generator_names[index] for index in np.flatnonzero(generator_node < 0)[:5]]
+        raise ValueError(f"Generators without a Node cannot be dispatched: {missing}.")
+
+    fuel_names, fuel_price, fuel_generator = [], np.zeros(0), np.zeros(0, dtype=np.int64)
+    if ObjectClass.Fuel.__name__ in manager.get_added_object_classes():
+        fuel_names = manager.get_object_names(ObjectClass.Fuel)
+        fuel_price = np.array(manager.get_attribute_column(ObjectClass.Fuel, "price"), dtype=np.float64)
+        fuel_generator = np.array([generator_index[fuel.parent["Generator"]] if "Generator" in fuel.parent else -1
+                                   for fuel in manager.get_object_class_instances(ObjectClass.Fuel)], dtype=np.int64)
+
+    load_names, load, load_node = [], np.zeros(0), np.zeros(0, dtype=np.int64)
+    if ObjectClass.Load.__name__ in manager.get_added_object_classes():
+        load_names = manager.get_object_names(ObjectClass.Load)
+        if manager.has_time_series(ObjectClass.Load, "load"):
+            load = np.array(manager.get_time_series(ObjectClass.Load, "load"), dtype=np.float64)
+            n_intervals = load.shape[1] if n_intervals is None else n_intervals
+            if n_intervals != load.shape[1]:
+                raise ValueError(f"'Load.load' time series have {load.shape[1]} intervals, not {n_intervals}.")
+        else:
+            load = np.array(manager.get_attribute_column(ObjectClass.Load, "load"), dtype=np.float64)
+        load_node = np.array([node_index[load_instance.parent["Node"]] if "Node" in load_instance.parent else -1
+                              for load_instance in manager.get_object_class_instances(ObjectClass.Load)], dtype=np.int64)
+
+    demand_profile = (np.ones(n_intervals or DEFAULT_N_INTERVALS) if demand_profile is None
+                      else np.asarray(demand_profile, dtype=np.float64))
+    return DispatchData(generator_names=generator_names,
+                        node_names=node_names,
+                        capacity=capacity,
+                        marginal_cost=generator_marginal_cost(fuel_price, fuel_generator, len(generator_names)),
+                        generator_node=generator_node,
+                        demand=node_demand(load, load_node, len(node_names), demand_profile),
+                        load_names=load_names,
+                        load=load,
+                        load_node=load_node,
+                        fuel_names=fuel_names,
+                        fuel_price=fuel_price,
+                        fuel_generator=fuel_generator,
+                        demand_profile=demand_profile)
+
+
+def generator_marginal_cost(fuel_price: np.ndarray, fuel_generator: np.ndarray, n_generators: int) -> np.ndarray:
+    """Marginal cost of each generator: the price of its cheapest fuel, 0.0 for generators without fuel."""
+    marginal_cost = np.full(n_generators, np.inf)
+    has_generator = fuel_generator >= 0
+    np.minimum.at(marginal_cost, fuel_generator[has_generator], fuel_price[has_generator])
+    marginal_cost[np.isinf(marginal_cost)] = 0.0
+    return marginal_cost
+
+
+def node_demand(load: np.ndarray, load_node: np.ndarray, n_nodes: int, demand_profile: np.ndarray) -> np.ndarray:
+    """
+    (T, N) demand: the loads summed per node, scaled by the demand profile of each interval.
+    `load` holds one value per load, or one series per load ((loads, T)).
+    """
+    has_node = load_node >= 0
+    demand_profile = np.asarray(demand_profile, dtype=np.float64)
+    if load.ndim == 2:
+        if load.shape[1] != len(demand_profile):
+            raise ValueError(f"Load series have {load.shape[1]} intervals but the demand profile has {len(demand_profile)}.")
+        load_rows = np.flatnonzero(has_node)
+        incidence = sp.csr_matrix((np.ones(len(load_rows)), (load_node[load_rows], load_rows)),
+                                  shape=(n_nodes, len(load)))
+        return demand_profile[:, np.newaxis] * (incidence @ load).T
+    node_load = np.bincount(load_node[has_node], weights=load[has_node], minlength=n_nodes)
+    return demand_profile[:, np.newaxis] * node_load[np.newaxis, :]
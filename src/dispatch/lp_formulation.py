@@ -0,0 +1,148 @@
+from src.dispatch.dispatch_data import DispatchData
+from src.dispatch.merit_order import DispatchResult, DEFAULT_VALUE_OF_LOST_LOAD
+from dataclasses import dataclass
+from typing import Iterator
+import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import linprog
+
+TERMS_PER_LINE = 8  # LP-format expressions are wrapped to keep lines readable
+
+
+@dataclass
+class DispatchLinearProgram:
+    """
+    Day-ahead economic dispatch as the linear program
+
+        min  c @ x   s.t.  A_eq @ x = b_eq,  lower <= x <= upper
+
+    Variables are ordered as p[t, g] (generator output, index t * G + g) followed by
+    u[t, k] (unserved demand of zone k, index T * G + t * K + k, priced at the value of lost load).
+    Row t * K + k of A_eq is the balance of zone k in interval t.
+    """
+    c: np.ndarray
+    A_eq: sp.csr_matrix
+    b_eq: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    n_intervals: int
+    n_generators: int
+    n_zones: int
+
+    @property
+    def n_variables(self) -> int:
+        return len(self.c)
+
+    def variable_names(self) -> np.ndarray:
+        intervals, generators = np.divmod(np.arange(self.n_intervals * self.n_generators), self.n_generators)
+        unserved_intervals, zones = np.divmod(np.arange(self.n_intervals * self.n_zones), self.n_zones)
+        return np.concatenate((np.char.add(np.char.add("p_", intervals.astype(str)), np.char.add("_", generators.astype(str))),
+                               np.char.add(np.char.add("u_", unserved_intervals.astype(str)), np.char.add("_", zones.astype(str)))))
+
+    def constraint_names(self) -> np.ndarray:
+        intervals, zones = np.divmod(np.arange(len(self.b_eq)), self.n_zones)
+        return np.char.add(np.char.add("balance_", intervals.astype(str)), np.char.add("_", zones.astype(str)))
+
+    def solve(self) -> DispatchResult:
+        """Solve with the HiGHS solver bundled with SciPy; prices are the duals of the balance rows."""
+        result = linprog(self.c, A_eq=self.A_eq, b_eq=self.b_eq,
+                         bounds=np.column_stack((self.lower, self.upper)), method="highs")
+        if result.status != 0:
+            raise RuntimeError(f"Dispatch LP could not be solved: {result.message}")
+        n_dispatch = self.n_intervals * self.n_generators
+        return DispatchResult(dispatch=result.x[:n_dispatch].reshape(self.n_intervals, self.n_generators),
+                              marginal_price=result.eqlin.marginals.reshape(self.n_intervals, self.n_zones),
+                              unserved=result.x[n_dispatch:].reshape(self.n_intervals, self.n_zones))
+
+    def to_mps(self, path: str) -> None:
+        """Export the model in free MPS format."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(self._mps_lines())
+
+    def to_lp(self, path: str) -> None:
+        """Export the model in CPLEX LP format."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(self._lp_lines())
+
+    def _mps_lines(self) -> Iterator[str]:
+        variable_names = self.variable_names()
+        constraint_names = self.constraint_names()
+        A_csc = self.A_eq.tocsc()
+        yield "NAME          ECONOMIC_DISPATCH\nROWS\n N  cost\n"
+        yield from (f" E  {name}\n" for name in constraint_names)
+        yield "COLUMNS\n"
+        for column, name in enumerate(variable_names):
+            if self.c[column]:
+                yield f"    {name}  cost  {self.c[column]:.17g}\n"
+            for index in range(A_csc.indptr[column], A_csc.indptr[column + 1]):
+                yield f"    {name}  {constraint_names[A_csc.indices[index]]}  {A_csc.data[index]:.17g}\n"
+        yield "RHS\n"
+        yield from (f"    rhs  {name}  {value:.17g}\n" for name, value in zip(constraint_names, self.b_eq) if value)
+        yield "BOUNDS\n"
+        for name, lower, upper in zip(variable_names, self.lower, self.upper):
+            if lower:
+                yield f" LO bnd  {name}  {lower:.17g}\n"
+            if np.isfinite(upper):
+                yield f" UP bnd  {name}  {upper:.17g}\n"
+        yield "ENDATA\n"
+
+    def _lp_lines(self) -> Iterator[str]:
+        variable_names = self.variable_names()
+        constraint_names = self.constraint_names()
+        yield "Minimize\n cost:"
+        yield from _wrapped_terms(self.c, variable_names)
+        yield "\nSubject To\n"
+        for row, name in enumerate(constraint_names):
+            start, end = self.A_eq.indptr[row], self.A_eq.indptr[row + 1]
+            yield f" {name}:"
+            yield from _wrapped_terms(self.A_eq.data[start:end], variable_names[self.A_eq.indices[start:end]])
+            yield f" = {self.b_eq[row]:.17g}\n"
+        yield "Bounds\n"
+        for name, lower, upper in zip(variable_names, self.lower, self.upper):
+            yield f" {lower:.17g} <= {name} <= {upper:.17g}\n" if np.isfinite(upper) else f" {name} >= {lower:.17g}\n"
+        yield "End\n"
+
+
+def build_dispatch_lp(data: DispatchData,
+                      single_bus: bool = False,
+                      value_of_lost_load: float = DEFAULT_VALUE_OF_LOST_LOAD
+                      ) -> DispatchLinearProgram:
+    """
+    Build the dispatch LP of a DispatchData horizon with vectorized COO index arithmetic.
+
+    Zones are the nodes (each balanced by its own generators and loads, following the Node
+    memberships), or a single zone when `single_bus` is True. Costs come from the generators'
+    `Fuel.price` and capacity bounds from `Generator.nominal_power`.
+    """
+    n_intervals, n_generators = data.n_intervals, len(data.capacity)
+    if single_bus:
+        zone = np.zeros(n_generators, dtype=np.int64)
+        demand = data.demand.sum(axis=1, keepdims=True)
+    else:
+        zone = data.generator_node
+        demand = data.demand
+    n_zones = demand.shape[1]
+    n_dispatch, n_unserved = n_intervals * n_generators, n_intervals * n_zones
+
+    # p[t, g] enters balance row t * K + zone[g]; u[t, k] enters balance row t * K + k
+    interval_offsets = np.arange(n_intervals, dtype=np.int64)[:, np.newaxis] * n_zones
+    rows = np.concatenate(((interval_offsets + zone[np.newaxis, :]).ravel(), np.arange(n_unserved)))
+    columns = np.arange(n_dispatch + n_unserved)
+    A_eq = sp.coo_matrix((np.ones(len(columns)), (rows, columns)), shape=(n_unserved, n_dispatch + n_unserved)).tocsr()
+
+    return DispatchLinearProgram(
+        c=np.concatenate((np.tile(data.marginal_cost, n_intervals), np.full(n_unserved, value_of_lost_load))),
+        A_eq=A_eq,
+        b_eq=demand.ravel(),
+        lower=np.zeros(n_dispatch + n_unserved),
+        upper=np.concatenate((np.tile(data.capacity, n_intervals), np.maximum(demand.ravel(), 0.0))),
+        n_intervals=n_intervals,
+        n_generators=n_generators,
+        n_zones=n_zones)
+
+
+def _wrapped_terms(coefficients: np.ndarray, names: np.ndarray) -> Iterator[str]:
+    for start in range(0, len(names), TERMS_PER_LINE):
+        yield " " + " ".join(f"{'+' if coefficient >= 0 else '-'} {abs(coefficient):.17g} {name}"
+                             for coefficient, name in zip(coefficients[start:start + TERMS_PER_LINE],
+                                                          names[start:start + TERMS_PER_LINE])) + "\n"
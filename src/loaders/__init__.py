@@ -0,0 +1,2 @@
+from .readers import LoaderError, read_chunks
+from .network_loader import NetworkLoader, NetworkSource, read_manifest
@@ -0,0 +1,269 @@
+from src.managers.data_manager import DataManager, BatchValidationError
+from src.managers.relationship_validator import RelationshipValidator
+from src.loaders.readers import LoaderError, RecordChunk, read_chunks
+from src.objects.abstract_object_class import AbstractObject
+from src.utils.abstract_object_subclasses import get_abstract_object_subclass, get_object_class_name
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
+import json
+import os
+import queue
+import threading
+
+DEFAULT_CHUNK_SIZE = 10_000
+DEFAULT_MAX_PENDING_CHUNKS = 4
+_END_OF_STAGE = object()
+
+
+@dataclass
+class NetworkSource:
+    """
+    One input file holding the objects of a single class.
+
+    - `name_column` holds the object names.
+    - `column_map` maps dataclass fields to file columns ({"nominal_power": "p_max"}); mapped columns must
+      exist in the file, fields that are not mapped are read from the column of the same name, when present.
+    - `parent_class`/`parent_column` describe the membership of each object (e.g. the Node of a Generator);
+      rows with an empty parent column get no membership.
+    """
+    object_class: Union[Type[AbstractObject], str]
+    path: str
+    name_column: str = "name"
+    column_map: Dict[str, str] = field(default_factory=dict)
+    parent_class: Optional[Union[Type[AbstractObject], str]] = None
+    parent_column: str = "parent"
+    file_format: Optional[str] = None
+
+    def __post_init__(self):
+        self.object_class = get_abstract_object_subclass(get_object_class_name(self.object_class))
+        if self.parent_class is not None:
+            self.parent_class = get_abstract_object_subclass(get_object_class_name(self.parent_class))
+
+    @classmethod
+    def from_dict(cls, source: dict, base_dir: str = "") -> "NetworkSource":
+        """Build a source from a manifest entry; relative paths are resolved against `base_dir`."""
+        source = dict(source)
+        source["path"] = os.path.join(base_dir, source["path"])
+        return cls(**source)
+
+
+@dataclass
+class ParsedChunk:
+    """A chunk mapped onto dataclass fields, ready for the DataManager batch methods (rows index `object_names`)."""
+    line_numbers: List[int]
+    object_names: List[str] = field(default_factory=list)
+    attributes: Dict[str, Tuple[List[int], List[object]]] = field(default_factory=dict)  # {field: (rows, values)}
+    membership_rows: List[int] = field(default_factory=list)
+    parent_names: List[str] = field(default_factory=list)
+
+
+def read_manifest(path: str) -> List[NetworkSource]:
+    """Read a JSON manifest: a list of NetworkSource entries, with paths relative to the manifest."""
+    with open(path, encoding="utf-8") as f:
+        return [NetworkSource.from_dict(source, os.path.dirname(path)) for source in json.load(f)]
+
+
+class NetworkLoader:
+    """
+    Streams network data files into a DataManager.
+
+    Each source is a pipeline stage: a worker thread reads its file in chunks of `chunk_size` records
+    and maps them onto the dataclass fields, into a queue bounded to `max_pending_chunks`, so memory stays bounded
+    whatever the file size. Stages are ingested through the DataManager batch API in an order
+    where every parent class is loaded before its children, while the following stages read ahead
+    in parallel (up to `max_workers` files at once).
+    """
+
+    def __init__(self,
+                 manager: DataManager,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_workers: Optional[int] = None,
+                 max_pending_chunks: int = DEFAULT_MAX_PENDING_CHUNKS):
+        self.manager = manager
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.max_pending_chunks = max_pending_chunks
+
+    def load(self, sources: List[NetworkSource]) -> Dict[str, int]:
+        """Load every source into the (open) manager and return the number of objects loaded per class."""
+        if not self.manager._is_open:
+            raise RuntimeError("DataManager must be open to perform this operation.")
+        sources = order_sources(sources)
+        loaded_objects: Dict[str, int] = {}
+        stop = threading.Event()
+        stage_queues = [queue.Queue(maxsize=self.max_pending_chunks) for _ in sources]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(sources) or 1,
+                                thread_name_prefix="network-loader") as executor:
+            # Stages are submitted in ingestion order, so a bounded pool never waits on a later stage
+            for source, stage_queue in zip(sources, stage_queues):
+                executor.submit(self._read_stage, source, stage_queue, stop)
+            try:
+                for source, stage_queue in zip(sources, stage_queues):
+                    for parsed in self._consume_stage(stage_queue):
+                        self._ingest_chunk(source, parsed)
+                        class_name = source.object_class.__name__
+                        loaded_objects[class_name] = loaded_objects.get(class_name, 0) + len(parsed.object_names)
+            finally:
+                stop.set()  # Unblock readers still waiting on a full queue
+        return loaded_objects
+
+    def _read_stage(self, source: NetworkSource, stage_queue: queue.Queue, stop: threading.Event) -> None:
+        """Reader thread: read and parse the file chunk by chunk, handing chunks (or the error) to the ingesting thread."""
+        try:
+            for chunk_index, chunk in enumerate(read_chunks(source.path, self.chunk_size, source.file_format)):
+                if chunk_index == 0:
+                    self._check_columns(source, chunk)
+                if not self._put(stage_queue, self._parse_chunk(source, chunk), stop):
+                    return
+        except Exception as error:  # Re-raised by the ingesting thread
+            self._put(stage_queue, error, stop)
+            return
+        self._put(stage_queue, _END_OF_STAGE, stop)
+
+    @staticmethod
+    def _put(stage_queue: queue.Queue, item, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                stage_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _consume_stage(stage_queue: queue.Queue) -> Iterator["ParsedChunk"]:
+        while True:
+            item = stage_queue.get()
+            if item is _END_OF_STAGE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    @staticmethod
+    def _check_columns(source: NetworkSource, chunk: RecordChunk) -> None:
+        """
+        Raise a LoaderError if `column_map` names an unknown field, or if a column the source names explicitly
+        is missing from the first record (the CSV header), rather than silently keeping the defaults.
+        """
+        field_names = {class_field.name for class_field in fields(source.object_class)}
+        errors = [(None, f"'column_map' maps unknown field '{field_name}' of '{source.object_class.__name__}'.")
+                  for field_name in source.column_map if field_name not in field_names]
+        required_columns = [source.name_column, *source.column_map.values()]
+        if source.parent_class is not None:
+            required_columns.append(source.parent_column)
+        missing_columns = [column for column in dict.fromkeys(required_columns) if column not in chunk.records[0]]
+        if missing_columns:
+            errors.append((chunk.line_numbers[0], f"Missing columns {missing_columns}."))
+        if errors:
+            raise LoaderError(source.path, errors)
+
+    def _parse_chunk(self, source: NetworkSource, chunk: RecordChunk) -> "ParsedChunk":
+        """Map the records of a chunk onto the dataclass fields, reporting every unparsable row."""
+        parsed = ParsedChunk(line_numbers=chunk.line_numbers)
+        errors = []
+        mapped_fields = list(self._mapped_fields(source))
+        for row, (record, line_number) in enumerate(zip(chunk.records, chunk.line_numbers)):
+            object_name = record.get(source.name_column)
+            if object_name in (None, ""):
+                errors.append((line_number, f"Missing object name in column '{source.name_column}'."))
+            parsed.object_names.append(str(object_name))
+
+            for field_name, field_type, column in mapped_fields:
+                value = record.get(column)
+                if value in (None, ""):
+                    continue  # Keep the dataclass default
+                try:
+                    value = field_type(value) if field_type in (int, float) else value
+                except (TypeError, ValueError):
+                    errors.append((line_number, f"Column '{column}': cannot convert {value!r} to {field_type.__name__}."))
+                    continue
+                rows, values = parsed.attributes.setdefault(field_name, ([], []))
+                rows.append(row)
+                values.append(value)
+
+            if source.parent_class is not None and record.get(source.parent_column) not in (None, ""):
+                parsed.membership_rows.append(row)
+                parsed.parent_names.append(str(record[source.parent_column]))
+        if errors:
+            raise LoaderError(source.path, errors)
+        return parsed
+
+    def _ingest_chunk(self, source: NetworkSource, parsed: "ParsedChunk") -> None:
+        """
+        Feed a parsed chunk to the DataManager batch methods, reporting errors at their file lines.
+        Memberships are checked before the objects are added, so a bad chunk adds nothing.
+        """
+        object_names = parsed.object_names
+        if parsed.membership_rows:
+            self._check_memberships(source, parsed)
+        with _batch_errors_at_lines(source.path, parsed.line_numbers):
+            self.manager.add_objects(source.object_class, object_names)
+
+        for field_name, (rows, values) in parsed.attributes.items():
+            with _batch_errors_at_lines(source.path, [parsed.line_numbers[row] for row in rows]):
+                self.manager.add_attributes(source.object_class, [object_names[row] for row in rows], field_name, values)
+
+        if parsed.membership_rows:
+            rows = parsed.membership_rows
+            with _batch_errors_at_lines(source.path, [parsed.line_numbers[row] for row in rows]):
+                self.manager.add_memberships(source.object_class, [object_names[row] for row in rows],
+                                             source.parent_class, parsed.parent_names)
+
+    def _check_memberships(self, source: NetworkSource, parsed: "ParsedChunk") -> None:
+        """Raise a LoaderError for every membership of the chunk that `add_memberships` would reject."""
+        child_class, parent_class = source.object_class, source.parent_class
+        errors = []
+        if not RelationshipValidator.is_valid_child(parent_class, child_class):
+            errors.append((None, f"ObjectClass {child_class.__name__} cannot be a child of "
+                                 f"ObjectClass {parent_class.__name__}."))
+        if not RelationshipValidator.is_valid_parent(child_class, parent_class):
+            errors.append((None, f"ObjectClass {parent_class.__name__} cannot be a parent of "
+                                 f"ObjectClass {child_class.__name__}."))
+        parent_objects = self.manager.objects_database.get(parent_class.__name__, {})
+        chunk_objects = set(parsed.object_names) if parent_class == child_class else set()
+        for row, parent_name in zip(parsed.membership_rows, parsed.parent_names):
+            if parent_name not in parent_objects and parent_name not in chunk_objects:
+                errors.append((parsed.line_numbers[row], f"Parent {parent_name} must exist before setting a relationship."))
+        if errors:
+            raise LoaderError(source.path, errors)
+
+    @staticmethod
+    def _mapped_fields(source: NetworkSource):
+        """Yield (field name, field type, column) for every dataclass field read from the file."""
+        for class_field in fields(source.object_class):
+            if class_field.name in ("object_name", "parent", "children"):
+                continue
+            column = source.column_map.get(class_field.name, class_field.name)
+            if column not in (source.name_column, source.parent_column):
+                yield class_field.name, class_field.type, column
+
+
+@contextmanager
+def _batch_errors_at_lines(path: str, line_numbers: List[int]):
+    """Translate the row indexes of a BatchValidationError into the file line numbers of the rows."""
+    try:
+        yield
+    except BatchValidationError as error:
+        raise LoaderError(path, [(None if row is None else line_numbers[row], message)
+                                 for row, message in error.errors]) from error
+
+
+def order_sources(sources: List[NetworkSource]) -> List[NetworkSource]:
+    """Order the sources so that every parent class is loaded before the classes that reference it."""
+    pending = list(sources)
+    ordered: List[NetworkSource] = []
+    while pending:
+        pending_classes = {source.object_class for source in pending}
+        ready = [source for source in pending
+                 if source.parent_class is None or source.parent_class == source.object_class
+                 or source.parent_class not in pending_classes]
+        if not ready:
+            raise ValueError(f"Circular parent dependencies between {sorted(c.__name__ for c in pending_classes)}.")
+        ordered.extend(ready)
+        ready_ids = {id(source) for source in ready}
+        pending = [source for source in pending if id(source) not in ready_ids]
+    return ordered
@@ -0,0 +1,92 @@
+import csv
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+FILE_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+
+class LoaderError(ValueError):
+    """Raised when an input file cannot be read or loaded; the message points to the file and line(s)."""
+
+    def __init__(self, path: str, errors: List[tuple]):
+        self.path = path
+        self.errors = errors  # [(line_number or None, message)]
+        super().__init__("\n".join(f"{path}:{line}: {message}" if line is not None else f"{path}: {message}"
+                                   for line, message in errors))
+
+
+@dataclass
+class RecordChunk:
+    """A fixed-size chunk of parsed records, with the source line of each record (1-based)."""
+    records: List[Dict[str, object]]
+    line_numbers: List[int]
+
+
+def detect_file_format(path: str, file_format: Optional[str] = None) -> str:
+    """Return the file format ("csv", "jsonl" or "parquet"), from `file_format` or the file extension."""
+    if file_format is None:
+        file_format = FILE_FORMATS.get(os.path.splitext(path)[1].lower())
+    if file_format not in FILE_FORMATS.values():
+        raise LoaderError(path, [(None, f"Unsupported file format '{file_format}'. "
+                                        f"Expected one of {sorted(set(FILE_FORMATS.values()))}.")])
+    return file_format
+
+
+def read_chunks(path: str, chunk_size: int, file_format: Optional[str] = None) -> Iterator[RecordChunk]:
+    """Stream a CSV, JSONL or Parquet file as chunks of at most `chunk_size` records."""
+    readers = {"csv": _read_csv_chunks, "jsonl": _read_jsonl_chunks, "parquet": _read_parquet_chunks}
+    return readers[detect_file_format(path, file_format)](path, chunk_size)
+
+
+def _read_csv_chunks(path: str, chunk_size: int) -> Iterator[RecordChunk]:
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        chunk = RecordChunk([], [])
+        for record in reader:
+            if None in record:  # More values than header columns
+                raise LoaderError(path, [(reader.line_num, f"Expected {len(reader.fieldnames)} columns, "
+                                                           f"got {len(reader.fieldnames) + len(record[None])}.")])
+            chunk.records.append(record)
+            chunk.line_numbers.append(reader.line_num)
+            if len(chunk.records) == chunk_size:
+                yield chunk
+                chunk = RecordChunk([], [])
+        if chunk.records:
+            yield chunk
+
+
+def _read_jsonl_chunks(path: str, chunk_size: int) -> Iterator[RecordChunk]:
+    with open(path, encoding="utf-8") as f:
+        chunk = RecordChunk([], [])
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise LoaderError(path, [(line_number, f"Invalid JSON: {error.msg}.")]) from None
+            if not isinstance(record, dict):
+                raise LoaderError(path, [(line_number, "Each line must hold a JSON object.")])
+            chunk.records.append(record)
+            chunk.line_numbers.append(line_number)
+            if len(chunk.records) == chunk_size:
+                yield chunk
+                chunk = RecordChunk([], [])
+        if chunk.records:
+            yield chunk
+
+
+def _read_parquet_chunks(path: str, chunk_size: int) -> Iterator[RecordChunk]:
+    """Parquet support is optional and requires `pyarrow`; line numbers are 1-based row numbers."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading Parquet files requires the optional 'pyarrow' dependency.") from None
+
+    first_row = 1
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        records = batch.to_pylist()
+        yield RecordChunk(records, list(range(first_row, first_row + len(records))))
+        first_row += len(records)
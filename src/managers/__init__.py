@@ -1 +1,6 @@
-from .data_manager import DataManager
\ No newline at end of file
+def __getattr__(name: str):
+    """Import DataManager (and NumPy with it) on first use, so that importing the package stays cheap."""
+    if name == "DataManager":
+        from .data_manager import DataManager
+        return DataManager
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,139 @@
+from src.managers.data_manager import DataManager
+from src.objects.abstract_object_class import AbstractObject
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple, Type
+import asyncio
+
+DEFAULT_MAX_QUEUE_SIZE = 64
+MAX_WRITES_PER_STEP = 32  # Queued writes applied together in one hop to the writer thread
+_STOP = object()
+
+
+class AsyncDataManager:
+    """
+    Asyncio front end of a DataManager, for many concurrent producers (file watchers, message queues,
+    database dumps) within one event loop.
+
+    `async with` opens the manager and starts a single writer task; every awaitable `add_*` call puts
+    its write on a bounded queue, so producers wait (backpressure) when the writer falls behind, and
+    returns once the write is applied, raising its error if any. The writer drains the queue in order
+    and applies the writes in a dedicated thread, one at a time, so the event loop keeps serving I/O
+    while the model is built. Leaving the block waits for the queued writes, then validates in that
+    thread too (see DataManager.__exit__).
+
+    The wrapped DataManager is available as `manager`; read it once the block is left, as the writer
+    thread may be changing it before.
+    """
+
+    def __init__(self, manager: Optional[DataManager] = None, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        self.manager = manager if manager is not None else DataManager()
+        self.max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False  # Set once the writer has stopped, on close
+        self._pending_puts = 0  # Producers waiting for room in the queue
+        self.writes = 0  # Writes applied, including failed ones
+        self.max_queue_depth = 0
+
+    async def __aenter__(self):
+        self.manager.__enter__()
+        self._closed = False
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="data-manager-writer")
+        self._writer = asyncio.create_task(self._write_loop())
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Wait for the queued writes, then validate in the writer thread (raises if validation fails)."""
+        await self._queue.put(_STOP)
+        try:
+            await self._writer
+            # Fail the writes submitted while closing, releasing producers still blocked on a full queue
+            self._closed = True
+            while self._pending_puts or not self._queue.empty():
+                while not self._queue.empty():
+                    _, _, done = self._queue.get_nowait()
+                    if not done.done():
+                        done.set_exception(RuntimeError("AsyncDataManager was closed before this write was applied."))
+                await asyncio.sleep(0)
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.manager.__exit__, exc_type, exc_value, traceback)
+        finally:
+            self._executor.shutdown(wait=False)
+            self._queue = self._writer = self._executor = None
+
+    async def add_object(self, object_class: Type[AbstractObject], object_name: str) -> None:
+        await self._submit(self.manager.add_object, object_class, object_name)
+
+    async def add_objects(self, object_class: Type[AbstractObject], object_names: Iterable[str]) -> None:
+        await self._submit(self.manager.add_objects, object_class, list(object_names))
+
+    async def add_attribute(self, object_class: Type[AbstractObject], object_name: str, attr_name: str, attr_value) -> None:
+        await self._submit(self.manager.add_attribute, object_class, object_name, attr_name, attr_value)
+
+    async def add_attributes(self, object_class: Type[AbstractObject], object_names: Iterable[str], attr_name: str,
+                             attr_values) -> None:
+        await self._submit(self.manager.add_attributes, object_class, list(object_names), attr_name, attr_values)
+
+    async def add_membership(self, child_object_class: Type[AbstractObject], child_object_name: str,
+                             parent_object_class: Type[AbstractObject], parent_object_name: str) -> None:
+        await self._submit(self.manager.add_membership,
+                           child_object_class, child_object_name, parent_object_class, parent_object_name)
+
+    async def add_memberships(self, child_object_class: Type[AbstractObject], child_object_names: Iterable[str],
+                              parent_object_class: Type[AbstractObject], parent_object_names) -> None:
+        await self._submit(self.manager.add_memberships,
+                           child_object_class, list(child_object_names), parent_object_class, parent_object_names)
+
+    async def _submit(self, method, *args) -> None:
+        if self._queue is None or self._closed:
+            raise RuntimeError("AsyncDataManager must be open (async with) to perform this operation.")
+        write_queue = self._queue  # Torn down on close, possibly while this put waits
+        done = asyncio.get_running_loop().create_future()
+        self._pending_puts += 1
+        try:
+            await write_queue.put((method, args, done))
+        finally:
+            self._pending_puts -= 1
+        if self._closed and not done.done():
+            done.set_exception(RuntimeError("AsyncDataManager was closed before this write was applied."))
+        self.max_queue_depth = max(self.max_queue_depth, write_queue.qsize())
+        await done
+
+    async def _write_loop(self) -> None:
+        """Single writer: apply queued writes in order, several per hop to the writer thread."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            writes = []
+            write = await self._queue.get()
+            while True:
+                if write is _STOP:
+                    stopping = True
+                    break
+                writes.append(write)
+                if len(writes) == MAX_WRITES_PER_STEP or self._queue.empty():
+                    break
+                write = self._queue.get_nowait()
+            results = await loop.run_in_executor(self._executor, _apply_writes, writes)
+            for (_, _, done), error in zip(writes, results):
+                if not done.done():  # The producer may have been cancelled
+                    if error is None:
+                        done.set_result(None)
+                    else:
+                        done.set_exception(error)
+            self.writes += len(writes)
+
+
+def _apply_writes(writes: List[Tuple]) -> List[Optional[BaseException]]:
+    """Apply writes in order, returning the error of each (None when applied)."""
+    errors = []
+    for method, args, _ in writes:
+        try:
+            method(*args)
+        except Exception as error:
+            errors.append(error)
+        else:
+            errors.append(None)
+    return errors
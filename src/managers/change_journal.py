@@ -0,0 +1,91 @@
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import json
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ChangeRecord:
+    """
+    One successful DataManager change, covering every object of the call (a single `add_*` call
+    records one object, a batch call all of its objects).
+    """
+    sequence: int
+    operation: str
+    class_name: str
+    object_names: Tuple[str, ...]
+    attr_name: Optional[str] = None
+    values: Optional[list] = None  # Attribute values, aligned with object_names (time series as lists)
+    parent_class_name: Optional[str] = None
+    parent_names: Optional[Tuple[str, ...]] = None
+
+
+class ChangeJournal:
+    """
+    Append-only journal of the changes made to a DataManager, kept in memory and optionally appended
+    to a JSON-lines file. Enable it with `DataManager.enable_journal()`; it records the changes made
+    from then on (see DataManager.add_listener).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.records: List[ChangeRecord] = []
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8") if path is not None else None
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the latest record (0 when empty)."""
+        return len(self.records)
+
+    def records_since(self, since: int = 0) -> List[ChangeRecord]:
+        """Records appended after sequence number `since`."""
+        return self.records[since:]
+
+    def changed_objects(self, since: int = 0) -> Dict[str, List[str]]:
+        """Names of the objects added or changed after sequence number `since`, per class (memberships change the child)."""
+        changed: Dict[str, Dict[str, None]] = {}
+        for record in self.records_since(since):
+            changed.setdefault(record.class_name, {}).update(dict.fromkeys(record.object_names))
+        return {class_name: list(object_names) for class_name, object_names in changed.items()}
+
+    def __iter__(self) -> Iterator[ChangeRecord]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _append(self, **fields) -> None:
+        record = ChangeRecord(sequence=len(self.records) + 1, **fields)
+        self.records.append(record)
+        if self._file is not None:
+            self._file.write(json.dumps(asdict(record)) + "\n")
+            self._file.flush()
+
+    # Listener interface (see DataManager.add_listener)
+
+    def on_objects_added(self, class_name: str, object_names: Sequence[str]) -> None:
+        self._append(operation="add_objects", class_name=class_name, object_names=tuple(object_names))
+
+    def on_attributes_set(self, class_name: str, object_names: Sequence[str], attr_name: str, attr_values) -> None:
+        self._append(operation="set_attributes", class_name=class_name, object_names=tuple(object_names),
+                     attr_name=attr_name, values=_plain_values(attr_values))
+
+    def on_memberships_added(self,
+                             child_class_name: str,
+                             child_names: Sequence[str],
+                             parent_class_name: str,
+                             parent_names: Sequence[str]) -> None:
+        self._append(operation="add_memberships", class_name=child_class_name, object_names=tuple(child_names),
+                     parent_class_name=parent_class_name, parent_names=tuple(parent_names))
+
+
+def _plain_values(attr_values) -> list:
+    """Values as a list of Python objects (NumPy values and time series converted), detached from the caller's arrays."""
+    if isinstance(attr_values, np.ndarray) or np.ndim(attr_values) == 2:
+        return np.asarray(attr_values).tolist()
+    return [np.asarray(value).tolist() if isinstance(value, (np.ndarray, np.generic)) else value for value in attr_values]
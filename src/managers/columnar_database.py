@@ -0,0 +1,318 @@
+from src.objects.abstract_object_class import AbstractObject
+from src.objects.registry_object_subclasses import object_class_registry
+from src.utils.abstract_object_subclasses import get_abstract_object_subclass, get_object_class_index
+from collections.abc import Mapping, MutableMapping
+from dataclasses import fields
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type
+import numpy as np
+
+# Dataclass field types stored as contiguous NumPy columns; every other field is kept in a Python list.
+NUMERIC_FIELD_DTYPES = {float: np.float64, int: np.int64}
+# Fields handled by the table itself rather than stored as columns.
+STRUCTURAL_FIELDS = ("object_name", "parent", "children")
+NO_PARENT = -1
+INITIAL_CAPACITY = 16
+
+
+class ObjectRowView:
+    """
+    Lightweight view over one row of a `ClassTable`, behaving like the dataclass instance it replaces.
+
+    Attribute reads and writes go straight to the table columns. `parent` is encoded as integer
+    parent-class/parent-row columns, while `children` is derived from the parent columns of the
+    child tables: the returned dict is a fresh copy, so mutating it does not persist anything
+    (memberships are recorded by setting the child's `parent`).
+    """
+
+    __slots__ = ("_table", "_row")
+    derives_children = True  # Tells ObjectAttributesManager.set_child there is nothing to store
+
+    def __init__(self, table: "ClassTable", row: int):
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_row", row)
+
+    @property
+    def __class__(self):
+        """Report the viewed object class, so class-based checks treat the view as the object."""
+        return self._table.object_class
+
+    def __getattr__(self, attr_name: str):
+        return self._table.get_value(self._row, attr_name)
+
+    def __setattr__(self, attr_name: str, attr_value) -> None:
+        self._table.set_value(self._row, attr_name, attr_value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ObjectRowView):
+            return self._table is other._table and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._table), self._row))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{attr_name}={self._table.get_value(self._row, attr_name)!r}"
+                           for attr_name in self._table.field_names)
+        return f"{self._table.object_class.__name__}View({values})"
+
+    def to_object(self) -> AbstractObject:
+        """Materialize the row as a standalone dataclass instance."""
+        return self._table.materialize(self._row)
+
+
+class ClassTable(Mapping):
+    """
+    Struct-of-arrays storage for all objects of one AbstractObject subclass.
+
+    Maps object names to row indexes and stores numeric dataclass fields as NumPy columns,
+    other fields as Python lists, and parent links as integer parent-class/parent-row columns.
+    """
+
+    def __init__(self, database: "ColumnarObjectsDatabase", object_class: Type[AbstractObject]):
+        self.database = database
+        self.object_class = object_class
+        self.class_id = get_object_class_index(object_class)  # Parent class ids are registry indexes
+        self.names: List[str] = []
+        self._index: Optional[Dict[str, int]] = {}
+        self.field_names = [class_field.name for class_field in fields(object_class)]
+        self.defaults = vars(object_class(object_name=""))
+        self.numeric_columns: Dict[str, np.ndarray] = {}
+        self.object_columns: Dict[str, List[Any]] = {}
+        for class_field in fields(object_class):
+            if class_field.name in STRUCTURAL_FIELDS:
+                continue
+            dtype = NUMERIC_FIELD_DTYPES.get(class_field.type)
+            if dtype is not None:
+                self.numeric_columns[class_field.name] = np.empty(INITIAL_CAPACITY, dtype=dtype)
+            else:
+                self.object_columns[class_field.name] = []
+        self.parent_class_ids = np.full(INITIAL_CAPACITY, NO_PARENT, dtype=np.int32)
+        self.parent_rows = np.full(INITIAL_CAPACITY, NO_PARENT, dtype=np.int64)
+
+    @classmethod
+    def from_columns(cls,
+                     database: "ColumnarObjectsDatabase",
+                     object_class: Type[AbstractObject],
+                     names: List[str],
+                     numeric_columns: Dict[str, np.ndarray],
+                     object_columns: Dict[str, List[Any]],
+                     parent_class_ids: np.ndarray,
+                     parent_rows: np.ndarray
+                     ) -> "ClassTable":
+        """
+        Build a table around existing columns without copying them (e.g. memory-mapped arrays).
+
+        The columns are used as they are until the table grows, when they are copied into new arrays.
+        """
+        table = cls(database, object_class)
+        table.names = names
+        table._index = None  # Built on first lookup, so opening a large table stays cheap
+        table.numeric_columns.update(numeric_columns)
+        table.object_columns.update(object_columns)
+        table.parent_class_ids = parent_class_ids
+        table.parent_rows = parent_rows
+        return table
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Object name -> row index."""
+        if self._index is None:
+            self._index = dict(zip(self.names, range(len(self.names))))
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __contains__(self, object_name) -> bool:
+        return object_name in self.index
+
+    def __getitem__(self, object_name: str) -> ObjectRowView:
+        return ObjectRowView(self, self.index[object_name])
+
+    def __setitem__(self, object_name: str, obj: AbstractObject) -> None:
+        """Store a dataclass instance (or row view) as a new row, or overwrite the existing row."""
+        row = self.index.get(object_name)
+        if row is None:
+            row = self.append_row(object_name)
+        for attr_name in self.field_names:
+            if attr_name not in ("object_name", "children"):
+                self.set_value(row, attr_name, getattr(obj, attr_name))
+
+    def append_row(self, object_name: str) -> int:
+        """Append a row holding the dataclass defaults and return its index."""
+        row = len(self.names)
+        if row == len(self.parent_rows):
+            self._grow(max(2 * row, INITIAL_CAPACITY))
+        self.names.append(object_name)
+        self.index[object_name] = row
+        for attr_name, column in self.numeric_columns.items():
+            column[row] = self.defaults[attr_name]
+        for attr_name, column in self.object_columns.items():
+            column.append(self.defaults[attr_name])
+        self.parent_class_ids[row] = NO_PARENT
+        self.parent_rows[row] = NO_PARENT
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate the fixed-size columns to the given capacity (amortized doubling)."""
+        for attr_name, column in self.numeric_columns.items():
+            self.numeric_columns[attr_name] = _resized(column, capacity, 0)
+        self.parent_class_ids = _resized(self.parent_class_ids, capacity, NO_PARENT)
+        self.parent_rows = _resized(self.parent_rows, capacity, NO_PARENT)
+
+    def column(self, attr_name: str) -> np.ndarray:
+        """Return a zero-copy view of a numeric column, one value per row."""
+        if attr_name not in self.numeric_columns:
+            raise AttributeError(f"'{self.object_class.__name__}' has no numeric attribute '{attr_name}'")
+        return self.numeric_columns[attr_name][:len(self.names)]
+
+    def parent_columns(self):
+        """Return zero-copy views of the (parent class id, parent row) columns."""
+        size = len(self.names)
+        return self.parent_class_ids[:size], self.parent_rows[:size]
+
+    def get_value(self, row: int, attr_name: str):
+        if attr_name in self.numeric_columns:
+            return self.numeric_columns[attr_name][row].item()
+        if attr_name in self.object_columns:
+            return self.object_columns[attr_name][row]
+        if attr_name == "object_name":
+            return self.names[row]
+        if attr_name == "parent":
+            return self.get_parent(row)
+        if attr_name == "children":
+            return self.get_children(row)
+        raise AttributeError(f"'{self.object_class.__name__}' object has no attribute '{attr_name}'")
+
+    def set_value(self, row: int, attr_name: str, attr_value) -> None:
+        if attr_name in self.numeric_columns:
+            try:
+                self.numeric_columns[attr_name][row] = attr_value
+            except (TypeError, ValueError):
+                raise TypeError(f"Attribute '{attr_name}' of '{self.object_class.__name__}' is stored in a numeric "
+                                f"column and cannot hold {type(attr_value).__name__} values.") from None
+        elif attr_name in self.object_columns:
+            self.object_columns[attr_name][row] = attr_value
+        elif attr_name == "parent":
+            self.set_parent(row, attr_value)
+        elif attr_name == "object_name":
+            raise AttributeError("'object_name' is the row key and cannot be reassigned.")
+        elif attr_name == "children":
+            raise AttributeError("'children' is derived from the children's parent columns and cannot be assigned.")
+        else:
+            raise AttributeError(f"'{self.object_class.__name__}' object has no attribute '{attr_name}'")
+
+    def set_values(self, rows: Sequence[int], attr_name: str, attr_values: Sequence) -> None:
+        """
+        Set one attribute on several rows. Numeric values are all converted to the column dtype
+        before any is written, so a bad value leaves the column unchanged.
+        """
+        if attr_name not in self.numeric_columns:
+            for row, attr_value in zip(rows, attr_values):
+                self.set_value(row, attr_name, attr_value)
+            return
+        column = self.numeric_columns[attr_name]
+        try:
+            values = np.asarray(attr_values, dtype=column.dtype)
+        except (TypeError, ValueError):
+            bad_value = next(attr_value for attr_value in attr_values if not _fits(attr_value, column.dtype))
+            raise TypeError(f"Attribute '{attr_name}' of '{self.object_class.__name__}' is stored in a numeric "
+                            f"column and cannot hold {type(bad_value).__name__} values.") from None
+        column[np.asarray(rows, dtype=np.int64)] = values
+
+    def get_parent(self, row: int) -> Dict[str, str]:
+        parent_class_id = int(self.parent_class_ids[row])
+        if parent_class_id == NO_PARENT:
+            return {}
+        parent_table = self.database.table_by_id(parent_class_id)
+        return {parent_table.object_class.__name__: parent_table.names[self.parent_rows[row]]}
+
+    def set_parent(self, row: int, parent: Dict[str, str]) -> None:
+        if not parent:
+            self.parent_class_ids[row] = NO_PARENT
+            self.parent_rows[row] = NO_PARENT
+            return
+        if len(parent) != 1:
+            raise ValueError(f"'{self.object_class.__name__}' can only store a single parent.")
+        (parent_class_name, parent_object_name), = parent.items()
+        parent_table = self.database[parent_class_name]
+        self.parent_class_ids[row] = parent_table.class_id
+        self.parent_rows[row] = parent_table.index[parent_object_name]
+
+    def get_children(self, row: int) -> Dict[str, List[str]]:
+        """Collect {child_class_name: [object_names]} by scanning the parent columns of the other tables."""
+        children = {}
+        for child_table in self.database.values():
+            parent_class_ids, parent_rows = child_table.parent_columns()
+            child_rows = np.flatnonzero((parent_class_ids == self.class_id) & (parent_rows == row))
+            if child_rows.size:
+                children[child_table.object_class.__name__] = [child_table.names[child_row] for child_row in child_rows]
+        return children
+
+    def materialize(self, row: int) -> AbstractObject:
+        obj = self.object_class(object_name=self.names[row])
+        for attr_name in self.field_names:
+            if attr_name != "object_name":
+                setattr(obj, attr_name, self.get_value(row, attr_name))
+        return obj
+
+
+class ColumnarObjectsDatabase(MutableMapping):
+    """
+    Columnar replacement for the `{"ClassName": {"ObjectName": ObjectInstance}}` dict of DataManager.
+
+    Behaves like that dict of dicts (class name -> `ClassTable`, object name -> `ObjectRowView`)
+    so the DataManager API keeps working, while the data itself lives in per-class arrays.
+    """
+
+    def __init__(self):
+        self.tables: Dict[str, ClassTable] = {}
+
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tables)
+
+    def __getitem__(self, object_class_name: str) -> ClassTable:
+        return self.tables[object_class_name]
+
+    def __setitem__(self, object_class_name: str, objects: Mapping) -> None:
+        """Create the table of a class (if needed) and store the given {object_name: object} items."""
+        table = self.setdefault(object_class_name)
+        for object_name, obj in objects.items():
+            table[object_name] = obj
+
+    def __delitem__(self, object_class_name: str) -> None:
+        raise TypeError("Classes cannot be removed from a ColumnarObjectsDatabase.")
+
+    def setdefault(self, object_class_name: str, default: Optional[Mapping] = None) -> ClassTable:
+        """Return the table of a class, creating it (and storing `default` items) if missing."""
+        table = self.tables.get(object_class_name)
+        if table is None:
+            table = ClassTable(self, get_abstract_object_subclass(object_class_name))
+            self.tables[object_class_name] = table
+            for object_name, obj in (default or {}).items():
+                table[object_name] = obj
+        return table
+
+    def table_by_id(self, class_id: int) -> ClassTable:
+        return self.tables[object_class_registry.get_name(class_id)]
+
+
+def _resized(column: np.ndarray, capacity: int, fill_value) -> np.ndarray:
+    resized = np.full(capacity, fill_value, dtype=column.dtype)
+    resized[:len(column)] = column
+    return resized
+
+
+def _fits(value, dtype) -> bool:
+    """Whether a single value can be stored in a numeric column of the given dtype (as in `set_value`)."""
+    try:
+        np.empty(1, dtype=dtype)[0] = value
+    except (TypeError, ValueError):
+        return False
+    return True
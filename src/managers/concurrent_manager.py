@@ -0,0 +1,216 @@
+from src.managers.data_manager import DataManager
+from src.managers.columnar_database import ClassTable, ColumnarObjectsDatabase, NO_PARENT
+from src.managers.relationship_validator import RelationshipValidator
+from src.managers.time_series import TimeSeriesStore
+from src.objects.registry_object_subclasses import object_class_registry
+from src.objects.abstract_object_class import AbstractObject
+from src.utils.abstract_object_subclasses import get_object_class_name
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterable, List, Optional, Type
+import copy
+import threading
+import numpy as np
+
+
+class ConcurrentDataManager(DataManager):
+    """
+    DataManager that several threads can fill at once while others read consistent versions of it.
+
+    Writers: every `add_*` call holds the locks of the classes it touches (lock striping, acquired in
+    name order), so writers of different classes run in parallel and each call, e.g. the existence and
+    single-parent checks of `add_membership` together with the link they guard, is atomic. Closing the
+    manager waits for the in-flight calls before validating.
+
+    Readers: `publish()` copies the model class by class into a frozen DataManager (also usable as an
+    overlay base), pausing only the writers of the class being copied, and `published` returns the latest
+    copy without locking, so reads never wait for writers.
+    Closing the manager publishes the validated model. Reading the live manager directly is possible but may
+    observe a batch in progress.
+    """
+
+    def __init__(self, backend: str = "dict", full_validation: bool = False, time_series_dir: Optional[str] = None):
+        super().__init__(backend=backend, full_validation=full_validation, time_series_dir=time_series_dir)
+        self._class_locks: Dict[str, threading.RLock] = {}
+        self._class_locks_lock = threading.Lock()  # Guards the creation of class locks
+        self._listeners_lock = threading.Lock()
+        self._in_flight = 0
+        self._in_flight_condition = threading.Condition()
+        self._published: Optional[DataManager] = None
+        self._publish_lock = threading.Lock()
+        self.version = 0
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop accepting writes, wait for the in-flight ones, validate and publish."""
+        with self._in_flight_condition:
+            self._is_open = False
+            self._in_flight_condition.wait_for(lambda: self._in_flight == 0)
+        super().__exit__(exc_type, exc_value, traceback)
+        self.publish()
+
+    @property
+    def published(self) -> Optional[DataManager]:
+        """Latest published version (a frozen DataManager), or None before the first `publish()`."""
+        return self._published
+
+    def publish(self) -> DataManager:
+        """
+        Copy the current state into a new frozen DataManager and make it the published version.
+
+        Each class is copied under its own lock, child classes before their parents, so a writer only
+        waits while the class it writes is copied. A version holds every class as it was when copied;
+        memberships to parents added after their class was copied are left out of it.
+        """
+        with self._publish_lock:
+            version = DataManager(backend=self.backend)
+            copied = set()
+            while True:
+                with self._class_locks_lock:  # Classes are written only after their lock exists
+                    class_names = [class_name for class_name in self._class_locks if class_name not in copied]
+                if not class_names:
+                    break
+                for class_name in _children_first(class_names):
+                    with self._locked([class_name]):
+                        if class_name in self.objects_database:
+                            _copy_class(class_name, self.objects_database, version.objects_database)
+                            if self._time_series is not None:
+                                for table_class_name, attr_name in list(self._time_series.tables):
+                                    if table_class_name == class_name:
+                                        table = self._time_series.tables[(class_name, attr_name)]
+                                        version.time_series.add_table(class_name, attr_name, table.n_intervals,
+                                                                      data=table.view().copy())
+                    copied.add(class_name)
+            _drop_dangling_links(version.objects_database)
+            version._is_frozen = True
+            self.version += 1
+            self._published = version
+        return version
+
+    @property
+    def time_series(self) -> TimeSeriesStore:
+        if self._time_series is None:
+            with self._class_locks_lock:  # Writers of different classes may set the first series at once
+                if self._time_series is None:
+                    return DataManager.time_series.fget(self)
+        return self._time_series
+
+    def _notify(self, event: str, *args) -> None:
+        with self._listeners_lock:
+            super()._notify(event, *args)
+
+    def _class_lock(self, object_class_name: str) -> threading.RLock:
+        class_lock = self._class_locks.get(object_class_name)
+        if class_lock is None:
+            with self._class_locks_lock:
+                class_lock = self._class_locks.setdefault(object_class_name, threading.RLock())
+        return class_lock
+
+    @contextmanager
+    def _locked(self, object_class_names: Iterable[str]):
+        """Hold the locks of the given classes, acquired in name order so that writers cannot deadlock."""
+        # Locks are looked up (or created) before any is held, so that lock creation never waits on a class lock
+        class_locks = [self._class_lock(object_class_name) for object_class_name in sorted(set(object_class_names))]
+        with ExitStack() as stack:
+            for class_lock in class_locks:
+                stack.enter_context(class_lock)
+            yield
+
+    def _write(self, object_classes, method, *args):
+        """Run a write under the locks of its classes, counted as in flight so closing waits for it."""
+        object_class_names = [get_object_class_name(object_class) for object_class in object_classes]
+        with self._in_flight_condition:
+            if not self._is_open:
+                raise RuntimeError("DataManager must be open to perform this operation.")
+            self._in_flight += 1
+        try:
+            with self._locked(object_class_names):
+                return method(*args)
+        finally:
+            with self._in_flight_condition:
+                self._in_flight -= 1
+                if not self._in_flight:
+                    self._in_flight_condition.notify_all()
+
+    def add_object(self, object_class: Type[AbstractObject], object_name: str) -> None:
+        self._write([object_class], super().add_object, object_class, object_name)
+
+    def add_objects(self, object_class: Type[AbstractObject], object_names: Iterable[str]) -> None:
+        self._write([object_class], super().add_objects, object_class, object_names)
+
+    def add_attribute(self, object_class: Type[AbstractObject], object_name: str, attr_name: str, attr_value) -> None:
+        self._write([object_class], super().add_attribute, object_class, object_name, attr_name, attr_value)
+
+    def add_attributes(self, object_class: Type[AbstractObject], object_names: Iterable[str], attr_name: str,
+                       attr_values) -> None:
+        self._write([object_class], super().add_attributes, object_class, object_names, attr_name, attr_values)
+
+    def add_membership(self, child_object_class: Type[AbstractObject], child_object_name: str,
+                       parent_object_class: Type[AbstractObject], parent_object_name: str) -> None:
+        self._write([child_object_class, parent_object_class], super().add_membership,
+                    child_object_class, child_object_name, parent_object_class, parent_object_name)
+
+    def add_memberships(self, child_object_class: Type[AbstractObject], child_object_names: Iterable[str],
+                        parent_object_class: Type[AbstractObject], parent_object_names) -> None:
+        self._write([child_object_class, parent_object_class], super().add_memberships,
+                    child_object_class, child_object_names, parent_object_class, parent_object_names)
+
+
+def _children_first(class_names: List[str]) -> List[str]:
+    """Order classes so that every class comes before the classes allowed to be its parent (cycles keep their order)."""
+    pending = list(class_names)
+    ordered = []
+    while pending:
+        ready = [class_name for class_name in pending
+                 if not any(RelationshipValidator.is_valid_child(class_name, child_class_name)
+                            for child_class_name in pending if child_class_name != class_name)]
+        ready = ready or pending[:1]
+        ordered.extend(ready)
+        pending = [class_name for class_name in pending if class_name not in ready]
+    return ordered
+
+
+def _copy_class(class_name: str, objects_database, database) -> None:
+    """Copy the objects of one class into `database` (columns are copied with NumPy, dataclass instances one by one)."""
+    class_objects = objects_database[class_name]
+    if isinstance(class_objects, ClassTable):
+        size = len(class_objects)
+        parent_class_ids, parent_rows = class_objects.parent_columns()
+        database.tables[class_name] = ClassTable.from_columns(
+            database=database,
+            object_class=class_objects.object_class,
+            names=class_objects.names[:size],
+            numeric_columns={attr_name: class_objects.column(attr_name).copy()
+                             for attr_name in class_objects.numeric_columns},
+            object_columns={attr_name: column[:size] for attr_name, column in class_objects.object_columns.items()},
+            parent_class_ids=parent_class_ids.copy(),
+            parent_rows=parent_rows.copy())
+        return
+    copied_objects = {}
+    for object_name, obj in class_objects.items():
+        copied = copy.copy(obj)
+        copied.parent = dict(obj.parent)
+        copied.children = {child_class_name: list(names) for child_class_name, names in obj.children.items()}
+        copied_objects[object_name] = copied
+    database[class_name] = copied_objects
+
+
+def _drop_dangling_links(database) -> None:
+    """Remove the parent and children links to objects missing from a copy (added after their class was copied)."""
+    if isinstance(database, ColumnarObjectsDatabase):
+        for table in database.values():
+            parent_class_ids, parent_rows = table.parent_columns()
+            for parent_class_id in np.unique(parent_class_ids[parent_class_ids != NO_PARENT]).tolist():
+                parent_table = database.tables.get(object_class_registry.get_name(parent_class_id))
+                parent_size = 0 if parent_table is None else len(parent_table)
+                dangling = (parent_class_ids == parent_class_id) & (parent_rows >= parent_size)
+                parent_class_ids[dangling] = NO_PARENT
+                parent_rows[dangling] = NO_PARENT
+        return
+    for class_objects in database.values():
+        for obj in class_objects.values():
+            if obj.parent and any(parent_name not in database.get(parent_class_name, {})
+                                  for parent_class_name, parent_name in obj.parent.items()):
+                obj.parent = {}
+            for child_class_name, names in obj.children.items():
+                child_objects = database.get(child_class_name, {})
+                if any(name not in child_objects for name in names):
+                    obj.children[child_class_name] = [name for name in names if name in child_objects]
@@ -0,0 +1,195 @@
+from src.utils.abstract_object_subclasses import get_abstract_object_subclass
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set
+import hashlib
+import zlib
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.managers.data_manager import DataManager
+
+N_BUCKETS = 1024
+HASH_MODULUS = 1 << 64
+
+
+@dataclass
+class ModelDiff:
+    """Objects added, removed and changed between two models, per class name."""
+    added: Dict[str, List[str]] = field(default_factory=dict)
+    removed: Dict[str, List[str]] = field(default_factory=dict)
+    changed: Dict[str, List[str]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+class ContentHashIndex:
+    """
+    Content hashes of the objects of a DataManager, kept as a two-level hash tree per class.
+
+    Each object hashes its class, name, attribute values (time series included) and parent; children
+    are left out as they follow from the children's parents. A class spreads its objects over
+    `n_buckets` buckets by name; bucket and class hashes are the sums (mod 2**64) of their object
+    hashes, so changing one object updates them in constant time, whatever the order of changes.
+
+    Changes only mark objects as stale (see DataManager.add_listener); their hashes are recomputed
+    on the next query, so the cost of keeping the index follows the number of changed objects. Two
+    indexes are diffed by comparing class hashes, then bucket hashes of the classes that differ, then
+    object hashes of the buckets that differ. Obtain it through `DataManager.content_hashes`; the index
+    of an overlay starts from the index of its base, so it only hashes the objects the overlay changed.
+    """
+
+    def __init__(self, manager: "DataManager", n_buckets: int = N_BUCKETS, base_index: Optional["ContentHashIndex"] = None):
+        self.manager = manager
+        self.n_buckets = n_buckets
+        self._class_hashes: Dict[str, int] = {}
+        self._bucket_hashes: Dict[str, np.ndarray] = {}  # {"ClassName": uint64 array of bucket hashes}
+        self._buckets: Dict[str, List[Dict[str, int]]] = {}  # {"ClassName": [{"ObjectName": object hash}]}
+        self._shared_buckets: Dict[str, Set[int]] = {}  # Buckets still shared with `base_index`, copied on write
+        self._stale: Dict[str, Dict[str, None]] = {}
+        self._series_attr_names: Dict[str, List[str]] = {}  # Time-series attributes of each class at the last refresh
+        if base_index is not None:
+            self._seed(base_index)
+            return
+        for class_name, class_objects in manager.objects_database.items():
+            self._mark_stale(class_name, class_objects.keys())
+
+    def _seed(self, base_index: "ContentHashIndex") -> None:
+        """
+        Start from the hashes of a frozen base (see OverlayDataManager): buckets are shared until written,
+        and only the objects the overlay holds are rehashed.
+        """
+        base_index.refresh()
+        self.n_buckets = base_index.n_buckets
+        self._class_hashes = dict(base_index._class_hashes)
+        for class_name, buckets in base_index._buckets.items():
+            self._buckets[class_name] = list(buckets)
+            self._bucket_hashes[class_name] = base_index._bucket_hashes[class_name].copy()
+            self._shared_buckets[class_name] = set(range(self.n_buckets))
+        self._series_attr_names = {class_name: list(attr_names)
+                                   for class_name, attr_names in base_index._series_attr_names.items()}
+        for class_name, object_names in self.manager.changed_objects().items():
+            self._mark_stale(class_name, object_names)
+
+    def class_hash(self, class_name: str) -> int:
+        self.refresh()
+        return self._class_hashes.get(class_name, 0)
+
+    def object_hash(self, class_name: str, object_name: str) -> int:
+        self.refresh()
+        buckets = self._buckets.get(class_name)
+        if buckets is None or object_name not in buckets[self._bucket(object_name)]:
+            raise ValueError(f"Object '{object_name}' of class '{class_name}' not found in DataManager.")
+        return buckets[self._bucket(object_name)][object_name]
+
+    def root_hash(self) -> str:
+        """Hex digest of the whole model, from the class hashes."""
+        self.refresh()
+        digest = hashlib.blake2b(digest_size=16)
+        for class_name in sorted(self._class_hashes):
+            if self._class_hashes[class_name]:
+                digest.update(f"{class_name}:{self._class_hashes[class_name]:016x};".encode())
+        return digest.hexdigest()
+
+    def diff(self, other: "ContentHashIndex") -> ModelDiff:
+        """Changes that turn the model of this index into the model of `other`."""
+        self.refresh()
+        other.refresh()
+        model_diff = ModelDiff()
+        for class_name in sorted(set(self._class_hashes) | set(other._class_hashes)):
+            if self._class_hashes.get(class_name, 0) == other._class_hashes.get(class_name, 0):
+                continue
+            buckets = self._buckets.get(class_name) or [{}] * self.n_buckets
+            other_buckets = other._buckets.get(class_name) or [{}] * other.n_buckets
+            if self.n_buckets == other.n_buckets:
+                bucket_hashes = self._bucket_hashes.get(class_name, np.zeros(self.n_buckets, dtype=np.uint64))
+                other_bucket_hashes = other._bucket_hashes.get(class_name, np.zeros(other.n_buckets, dtype=np.uint64))
+                differing = np.flatnonzero(bucket_hashes != other_bucket_hashes)
+                pairs = [(buckets[bucket], other_buckets[bucket]) for bucket in differing]
+            else:
+                pairs = [({name: h for bucket in buckets for name, h in bucket.items()},
+                          {name: h for bucket in other_buckets for name, h in bucket.items()})]
+            for object_hashes, other_object_hashes in pairs:
+                for object_name, object_hash in other_object_hashes.items():
+                    if object_name not in object_hashes:
+                        model_diff.added.setdefault(class_name, []).append(object_name)
+                    elif object_hashes[object_name] != object_hash:
+                        model_diff.changed.setdefault(class_name, []).append(object_name)
+                for object_name in object_hashes:
+                    if object_name not in other_object_hashes:
+                        model_diff.removed.setdefault(class_name, []).append(object_name)
+        return model_diff
+
+    def refresh(self) -> None:
+        """
+        Recompute the hashes of the objects changed since the last query. A new time-series table changes
+        the hash input of every object of its class, so the whole class is rehashed when one appears.
+        """
+        for class_name in set(self._buckets) | set(self._stale):
+            series_attr_names = [class_field.name for class_field in fields(get_abstract_object_subclass(class_name))
+                                 if self.manager.has_time_series(class_name, class_field.name)]
+            if series_attr_names != self._series_attr_names.get(class_name, []):
+                self._series_attr_names[class_name] = series_attr_names
+                if class_name in self._buckets:
+                    self._mark_stale(class_name, self.manager.objects_database[class_name].keys())
+        stale, self._stale = self._stale, {}
+        for class_name, object_names in stale.items():
+            class_objects = self.manager.objects_database[class_name]
+            series_attr_names = self._series_attr_names.get(class_name, [])
+            buckets = self._buckets.get(class_name)
+            if buckets is None:
+                buckets = self._buckets[class_name] = [{} for _ in range(self.n_buckets)]
+                self._bucket_hashes[class_name] = np.zeros(self.n_buckets, dtype=np.uint64)
+            bucket_hashes = self._bucket_hashes[class_name]
+            shared_buckets = self._shared_buckets.get(class_name, ())
+            class_hash = self._class_hashes.get(class_name, 0)
+            for object_name in object_names:
+                bucket = self._bucket(object_name)
+                if bucket in shared_buckets:
+                    buckets[bucket] = dict(buckets[bucket])
+                    shared_buckets.discard(bucket)
+                new_hash = self._hash_object(class_name, class_objects[object_name], series_attr_names)
+                delta = new_hash - buckets[bucket].get(object_name, 0)
+                buckets[bucket][object_name] = new_hash
+                bucket_hashes[bucket] = (int(bucket_hashes[bucket]) + delta) % HASH_MODULUS
+                class_hash = (class_hash + delta) % HASH_MODULUS
+            self._class_hashes[class_name] = class_hash
+
+    def _bucket(self, object_name: str) -> int:
+        return zlib.crc32(object_name.encode()) % self.n_buckets
+
+    def _hash_object(self, class_name: str, obj, series_attr_names: Sequence[str]) -> int:
+        """64-bit hash of the object's content; numbers hash by value, so both backends agree."""
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(class_name.encode())
+        for class_field in fields(get_abstract_object_subclass(class_name)):
+            if class_field.name == "children":
+                continue
+            value = getattr(obj, class_field.name)
+            if class_field.name == "parent":
+                value = sorted(value.items())
+            elif isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_)):
+                value = float(value)
+            digest.update(f"\x1f{class_field.name}={value!r}".encode())
+        for attr_name in series_attr_names:
+            digest.update(f"\x1f{attr_name}~".encode())
+            digest.update(np.ascontiguousarray(self.manager.get_time_series(class_name, attr_name, obj.object_name)).tobytes())
+        return int.from_bytes(digest.digest(), "little")
+
+    def _mark_stale(self, class_name: str, object_names: Sequence[str]) -> None:
+        self._stale.setdefault(class_name, {}).update(dict.fromkeys(object_names))
+
+    # Listener interface (see DataManager.add_listener)
+
+    def on_objects_added(self, class_name: str, object_names: Sequence[str]) -> None:
+        self._mark_stale(class_name, object_names)
+
+    def on_attributes_set(self, class_name: str, object_names: Sequence[str], attr_name: str, attr_values) -> None:
+        self._mark_stale(class_name, object_names)
+
+    def on_memberships_added(self,
+                             child_class_name: str,
+                             child_names: Sequence[str],
+                             parent_class_name: str,
+                             parent_names: Sequence[str]) -> None:
+        self._mark_stale(child_class_name, child_names)
@@ -1,82 +1,269 @@
 from src.objects.abstract_object_class import AbstractObject
+from src.objects.registry_object_subclasses import object_class_registry
 from src.managers.relationship_validator import RelationshipValidator
 from src.managers.objects_attributes_manager import ObjectAttributesManager  # Ensure ObjectManager is imported
-from src.utils.abstract_object_subclasses import get_object_class_name, assert_abstract_object_subclass
-from typing import Optional, Type, Dict, List
+from src.managers.columnar_database import ColumnarObjectsDatabase
+from src.managers.instrumentation import instrumentation, instrumented
+from src.managers.time_series import TimeSeriesStore, assert_time_series_attribute, is_time_series_value
+from src.managers import snapshot
+from src.utils.abstract_object_subclasses import (
+    get_object_class_name,
+    get_abstract_object_subclass,
+    assert_abstract_object_subclass,
+)
+from dataclasses import fields
+from typing import Optional, Type, Dict, List, Iterable, Sequence, Tuple, Union
+import functools
+import numpy as np
 
 
 def require_open(func):
-    """Decorator to enforce that DataManager is open."""
+    """Decorator to enforce that DataManager is open (calls are recorded when instrumentation is enabled)."""
+    operation = func.__name__
 
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         if not self._is_open:
             raise RuntimeError("DataManager must be open to perform this operation.")
+        if instrumentation.enabled:
+            return instrumentation.call(operation, func, self, *args, **kwargs)
         return func(self, *args, **kwargs)
 
     return wrapper
 
+
+class BatchValidationError(ValueError):
+    """
+    Raised by the batch `add_*` methods when one or more rows are invalid.
+
+    `errors` holds every `(row_index, message)` pair found in the batch; a row index of
+    None marks an error that concerns the whole batch (e.g. a forbidden relationship).
+    """
+
+    def __init__(self, errors: List[Tuple[Optional[int], str]]):
+        self.errors = errors
+        super().__init__("\n".join(message if row is None else f"Row {row}: {message}"
+                                   for row, message in errors))
+
+
 class DataManager:
     """
     Manages objects in a structured dictionary format.
     Stores objects in collections categorized by their class name.
     Uses ObjectManager for attribute handling.
     Uses RelationshipValidator to validate parent-child relationships.
+
+    The `backend` selects how objects are stored:
+    - "dict": one dataclass instance per object (default).
+    - "columnar": per-class struct of arrays (see ColumnarObjectsDatabase); instances are returned as row views.
+
+    Objects added or changed while the manager is open are tracked, and closing it validates only
+    those objects; set `full_validation` (or call `data_validation(full=True)`) to check everything.
+
+    Numeric attributes can also hold time series (one value per interval), kept in per-class 2D arrays
+    (see TimeSeriesStore); `time_series_dir` stores them in memory-mapped files in that directory.
     """
-    def __init__(self):
-        self.objects_database: Dict[str, Dict[str, AbstractObject]] = {}  # Structure: {"ClassName": {"ObjectName": ObjectInstance}}
+
+    BACKENDS = ("dict", "columnar")
+
+    def __init__(self, backend: str = "dict", full_validation: bool = False, time_series_dir: Optional[str] = None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Expected one of {list(self.BACKENDS)}.")
+        self.backend = backend
+        # Structure: {"ClassName": {"ObjectName": ObjectInstance}}
+        self.objects_database: Dict[str, Dict[str, AbstractObject]] = {} if backend == "dict" else ColumnarObjectsDatabase()
         self._is_open = False
+        self.full_validation = full_validation
+        self._dirty_objects: Dict[str, Dict[str, None]] = {}  # Structure: {"ClassName": {"ObjectName": None}}
+        self._listeners: List[object] = []
+        self._topology = None
+        self._content_hashes = None
+        self.journal = None
+        self.time_series_dir = time_series_dir
+        self._time_series = None
+        self._is_frozen = False
 
     def __enter__(self):
         """Enter context."""
+        if self._is_frozen:
+            raise RuntimeError("DataManager is frozen and cannot be modified; make changes in an overlay().")
         self._is_open = True
         return self
 
-    def validate_object_required_parent(self) -> None:
-        """Validate that objects with required parents have valid parents."""
+    @property
+    def is_frozen(self) -> bool:
+        return self._is_frozen
+
+    def freeze(self) -> "DataManager":
+        """
+        Make the manager read-only, so overlays can be layered on it (see OverlayDataManager).
+        Pending changes are validated first.
+        """
+        if self._is_open:
+            raise RuntimeError("DataManager must be closed before it is frozen.")
+        if self._dirty_objects:
+            self.data_validation()
+        self._is_frozen = True
+        return self
+
+    def overlay(self):
+        """Return a new copy-on-write OverlayDataManager on top of this frozen manager."""
+        from src.managers.overlay_manager import OverlayDataManager
+        return OverlayDataManager(self)
+
+    def validate_object_required_parent(self, object_names: Optional[Dict[str, Iterable[str]]] = None) -> None:
+        """
+        Validate that objects with required parents have valid parents.
+
+        `object_names` ({"ClassName": [object names]}) restricts the check to the given objects;
+        by default every object is checked, one bulk pass per class.
+        """
         errors = []
+        compiled_rules = RelationshipValidator.get_compiled_rules()
 
         for object_class_name_with_required_parents in RelationshipValidator.get_object_classes_with_required_parent():
-            if object_class_name_with_required_parents in self.get_added_object_classes():
-                for object_class_instance in self.get_object_class_instances(object_class_name_with_required_parents):
-                    object_class_instance_required_parents = RelationshipValidator.get_object_class_required_parent(object_class_name_with_required_parents)
-                    object_parent_class_name = ObjectAttributesManager.get_parent_object_class_name(object_class_instance)
-                    # No parent required and no parent assigned → Valid, continue
-                    if object_class_instance_required_parents is None and (object_parent_class_name is None or not object_parent_class_name):
-                        continue
-                    object_class_instance_required_parents_name = [get_object_class_name(object_class_instance_required_parent)
-                                                                   for object_class_instance_required_parent
-                                                                   in object_class_instance_required_parents]
-
-                    # Parent required but not assigned → Error
-                    if object_class_instance_required_parents_name is not None and (object_parent_class_name is None or not object_parent_class_name):
-                        errors.append(
-                            f"Object '{object_class_instance.object_name}' of class '{object_class_name_with_required_parents}' requires a parent "
-                            f"from {object_class_instance_required_parents_name}, but none is assigned."
-                        )
-                        continue
-
-                    # Parent assigned but no parent should be there → Error
-                    if object_class_instance_required_parents_name is None and object_parent_class_name:
-                        errors.append(
-                            f"Object '{object_class_instance.object_name}' of class '{object_class_name_with_required_parents}' should not have a parent, "
-                            f"but '{object_parent_class_name[0]}' is assigned."
-                        )
-                        continue
-
-                    # Parent assigned but does not match the required parent(s) → Error
-                    if object_class_instance_required_parents_name is not None and object_parent_class_name[0] not in object_class_instance_required_parents_name:
-                        errors.append(
-                            f"Object '{object_class_instance.object_name}' of class '{object_class_name_with_required_parents}' has an invalid parent "
-                            f"'{object_parent_class_name[0]}'. Expected one of {object_class_instance_required_parents_name}."
-                        )
-
-                if errors:
-                    raise ValueError("\n".join(errors))
-
-    def data_validation(self):
-        """Perform all necessary validations before closing."""
-        self.validate_object_required_parent()
-
+            class_objects = self.objects_database.get(object_class_name_with_required_parents)
+            if not class_objects:
+                continue
+            if object_names is None:
+                checked_names = None
+            else:
+                checked_names = object_names.get(object_class_name_with_required_parents)
+                if not checked_names:
+                    continue
+            object_class_instance_required_parents_name = [
+                get_object_class_name(object_class_instance_required_parent)
+                for object_class_instance_required_parent
+                in RelationshipValidator.get_object_class_required_parent(object_class_name_with_required_parents)]
+
+            if self.backend == "columnar":
+                invalid_parents = self._find_invalid_parents_columnar(class_objects, checked_names, compiled_rules)
+            else:
+                invalid_parents = self._find_invalid_parents(class_objects, checked_names,
+                                                             set(object_class_instance_required_parents_name))
+
+            for object_name, object_parent_class_name in invalid_parents:
+                # Parent required but not assigned → Error
+                if object_parent_class_name is None:
+                    errors.append(
+                        f"Object '{object_name}' of class '{object_class_name_with_required_parents}' requires a parent "
+                        f"from {object_class_instance_required_parents_name}, but none is assigned."
+                    )
+                # Parent assigned but does not match the required parent(s) → Error
+                else:
+                    errors.append(
+                        f"Object '{object_name}' of class '{object_class_name_with_required_parents}' has an invalid parent "
+                        f"'{object_parent_class_name}'. Expected one of {object_class_instance_required_parents_name}."
+                    )
+
+        if errors:
+            raise ValueError("\n".join(errors))
+
+    @staticmethod
+    def _find_invalid_parents(class_objects: Dict[str, AbstractObject],
+                              object_names: Optional[Iterable[str]],
+                              required_parent_names: set
+                              ) -> List[Tuple[str, Optional[str]]]:
+        """Return (object_name, parent_class_name or None) for the objects whose parent is missing or not required."""
+        objects = class_objects.values() if object_names is None else (class_objects[name] for name in object_names)
+        invalid_parents = []
+        for obj in objects:
+            object_parent_class_name = next(iter(obj.parent), None)
+            if object_parent_class_name not in required_parent_names:
+                invalid_parents.append((obj.object_name, object_parent_class_name))
+        return invalid_parents
+
+    @staticmethod
+    def _find_invalid_parents_columnar(class_table,
+                                       object_names: Optional[Iterable[str]],
+                                       compiled_rules
+                                       ) -> List[Tuple[str, Optional[str]]]:
+        """Vectorized `_find_invalid_parents`: checks the parent-class column against the required-parent table."""
+        parent_class_ids, _ = class_table.parent_columns()
+        if object_names is None:
+            rows = np.arange(len(parent_class_ids))
+        else:
+            rows = np.fromiter((class_table.index[name] for name in object_names), dtype=np.int64)
+            parent_class_ids = parent_class_ids[rows]
+        has_parent = parent_class_ids >= 0
+        valid = np.zeros(len(rows), dtype=bool)
+        valid[has_parent] = compiled_rules.required_parent[class_table.class_id, parent_class_ids[has_parent]]
+        return [(class_table.names[row],
+                 object_class_registry.get_name(parent_class_id) if parent_class_id >= 0 else None)
+                for row, parent_class_id in zip(rows[~valid].tolist(), parent_class_ids[~valid].tolist())]
+
+    @instrumented
+    def data_validation(self, full: Optional[bool] = None) -> None:
+        """
+        Perform all necessary validations before closing.
+
+        Only the objects added or changed since the last successful validation are checked,
+        unless `full` is True (defaults to the `full_validation` setting of the manager).
+        """
+        if full is None:
+            full = self.full_validation
+        self.validate_object_required_parent(None if full else self._dirty_objects)
+        self._dirty_objects = {}
+
+    def _mark_dirty(self, object_class_name: str, object_names: Iterable[str]) -> None:
+        """Record objects added or changed while open, to be validated on close."""
+        self._dirty_objects.setdefault(object_class_name, {}).update(dict.fromkeys(object_names))  # Ordered set
+
+    def add_listener(self, listener) -> None:
+        """
+        Register an object notified after every successful change, through whichever of these methods it defines:
+        - on_objects_added(class_name, object_names)
+        - on_memberships_added(child_class_name, child_names, parent_class_name, parent_names)
+        - on_attributes_set(class_name, object_names, attr_name, attr_values)
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        self._listeners.remove(listener)
+
+    def _notify(self, event: str, *args) -> None:
+        for listener in self._listeners:
+            handler = getattr(listener, event, None)
+            if handler is not None:
+                handler(*args)
+
+    @property
+    def topology(self):
+        """Topology index of the model (see TopologyIndex), built on first use and kept up to date."""
+        if self._topology is None:
+            from src.managers.topology_index import TopologyIndex
+            self._topology = TopologyIndex(self)
+            self.add_listener(self._topology)
+        return self._topology
+
+    @property
+    def content_hashes(self):
+        """Content hashes of the objects (see ContentHashIndex), built on first use and kept up to date."""
+        if self._content_hashes is None:
+            from src.managers.content_hash import ContentHashIndex
+            self._content_hashes = ContentHashIndex(self)
+            self.add_listener(self._content_hashes)
+        return self._content_hashes
+
+    def diff(self, other: "DataManager"):
+        """Objects added, removed and changed from this model to `other` (see ModelDiff)."""
+        return self.content_hashes.diff(other.content_hashes)
+
+    def enable_journal(self, path: Optional[str] = None):
+        """Start recording the changes made from now on in `journal` (see ChangeJournal), also appended to `path`."""
+        if self.journal is None:
+            from src.managers.change_journal import ChangeJournal
+            self.journal = ChangeJournal(path)
+            self.add_listener(self.journal)
+        return self.journal
+
+    @property
+    def time_series(self) -> TimeSeriesStore:
+        """Time-series attributes of the model, created on first use and kept aligned with the objects."""
+        if self._time_series is None:
+            self._time_series = TimeSeriesStore(self, self.time_series_dir)
+            self.add_listener(self._time_series)
+        return self._time_series
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Perform checks before exiting context."""
@@ -84,6 +271,16 @@ class DataManager:
         self.data_validation()  # Will raise an exception if validation fails
         print("Data validation was successful.")  # Only prints if no exception occurs
 
+    def save_snapshot(self, path: str) -> str:
+        """Save the objects to a binary snapshot file and return its content hash (see src.managers.snapshot)."""
+        return snapshot.save_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path: str, mmap: bool = False, backend: str = "columnar", verify: bool = False) -> "DataManager":
+        """Open a binary snapshot as a new DataManager; `mmap=True` maps it lazily without copying it."""
+        return snapshot.load_snapshot(path, mmap=mmap, backend=backend, verify=verify)
+
+    @instrumented
     def get_object_instance(self,
                             object_class: Type[AbstractObject],
                             object_name: str
@@ -93,6 +290,7 @@ class DataManager:
         object_class_name = get_object_class_name(object_class)
         return self.objects_database.get(object_class_name).get(object_name)
 
+    @instrumented
     def get_object_class_instances(self,
                                    object_class: Type[AbstractObject]
                                    ) -> List[AbstractObject]:
@@ -104,6 +302,32 @@ class DataManager:
     def get_added_object_classes(self) -> List[str]:
         return list(self.objects_database.keys())
 
+    @instrumented
+    def get_object_names(self,
+                         object_class: Type[AbstractObject]
+                         ) -> List[str]:
+        """Return the names of all objects of a class, in insertion order."""
+        object_class_name = get_object_class_name(object_class)
+        return list(self.objects_database.get(object_class_name, {}))
+
+    @instrumented
+    def get_attribute_column(self,
+                             object_class: Type[AbstractObject],
+                             attribute_name: str
+                             ) -> np.ndarray:
+        """
+        Return one numeric attribute for every object of a class, ordered like `get_object_names`.
+
+        With the columnar backend this is a zero-copy view of the stored column (do not resize it);
+        with the dict backend the values are gathered into a new array.
+        """
+        object_class_name = get_object_class_name(object_class)
+        class_objects = self.objects_database.get(object_class_name, {})
+        if self.backend == "columnar":
+            return class_objects.column(attribute_name) if class_objects else np.empty(0)
+        return np.fromiter((ObjectAttributesManager.get_attribute(obj, attribute_name) for obj in class_objects.values()),
+                           dtype=np.float64, count=len(class_objects))
+
     @require_open
     def add_object(self,
                    object_class: Type[AbstractObject],
@@ -124,6 +348,9 @@ class DataManager:
         # Initialize and store the object
         obj: AbstractObject = object_class(object_name=object_name)
         self.objects_database[object_class_name][object_name] = obj
+        self._mark_dirty(object_class_name, (object_name,))
+        if self._listeners:
+            self._notify("on_objects_added", object_class_name, [object_name])
 
     @require_open
     def add_membership(self,
@@ -149,9 +376,16 @@ class DataManager:
         if not RelationshipValidator.is_valid_parent(child_object_instance.__class__, parent_object_instance.__class__):
             raise ValueError(f"ObjectClass {parent_object_instance.__class__.__name__} cannot be a parent of ObjectClass {child_object_instance.__class__.__name__}.")
 
+        if child_object_instance.parent:
+            raise ValueError(f"'{child_object_instance.__class__.__name__}' already has a parent and cannot be reassigned.")
+
         # Use ObjectManager to update attributes
         ObjectAttributesManager.set_child(obj=parent_object_instance, child_class=child_object_class, child_object_name=child_object_name)
         ObjectAttributesManager.set_parent(obj=child_object_instance, parent_class=parent_object_class, parent_object_name=parent_object_name)
+        self._mark_dirty(child_object_instance.__class__.__name__, (child_object_name,))
+        if self._listeners:
+            self._notify("on_memberships_added", child_object_instance.__class__.__name__, [child_object_name],
+                         parent_object_instance.__class__.__name__, [parent_object_name])
 
     @require_open
     def add_attribute(self,
@@ -161,12 +395,52 @@ class DataManager:
                       attr_value
                       ) -> None:
 
-        """Retrieve an object instance and add a property using ObjectManager."""
+        """
+        Retrieve an object instance and add a property using ObjectManager.
+
+        A 1-D sequence of numbers sets a time series (one value per interval) instead of the scalar.
+        """
         object_class_instance = self.get_object_instance(object_class, object_name)
         if object_class_instance is None:
             raise ValueError(f"Object '{object_name}' of class '{object_class.__name__}' not found in DataManager.")
-        ObjectAttributesManager.set_attribute(obj=object_class_instance, attr_name=attr_name, attr_value=attr_value)
-
+        if is_time_series_value(attr_value):
+            assert_time_series_attribute(object_class_instance.__class__.__name__, attr_name)
+            self.time_series.set_series(object_class_instance.__class__.__name__, [object_name], attr_name,
+                                        np.asarray(attr_value, dtype=np.float64)[np.newaxis, :])
+        else:
+            ObjectAttributesManager.set_attribute(obj=object_class_instance, attr_name=attr_name, attr_value=attr_value)
+        self._mark_dirty(object_class_instance.__class__.__name__, (object_name,))
+        if self._listeners:
+            self._notify("on_attributes_set", object_class_instance.__class__.__name__, [object_name], attr_name, [attr_value])
+
+    def has_time_series(self, object_class: Type[AbstractObject], attr_name: str) -> bool:
+        """Whether an attribute of a class holds time series."""
+        return self._time_series is not None and \
+            self._time_series.get_table(get_object_class_name(object_class), attr_name) is not None
+
+    @instrumented
+    def get_time_series(self,
+                        object_class: Type[AbstractObject],
+                        attr_name: str,
+                        object_name: Optional[str] = None,
+                        start: Optional[int] = None,
+                        stop: Optional[int] = None
+                        ) -> np.ndarray:
+        """
+        Return a zero-copy view of a time-series attribute: the (objects, intervals) array of the whole class
+        (rows ordered like `get_object_names`), or the series of `object_name`, over intervals [start, stop).
+        """
+        object_class_name = get_object_class_name(object_class)
+        table = self.time_series.get_table(object_class_name, attr_name)
+        if table is None:
+            raise ValueError(f"Attribute '{attr_name}' of class '{object_class_name}' has no time series.")
+        if object_name is None:
+            return table.view(start, stop)
+        if object_name not in self.objects_database.get(object_class_name, {}):
+            raise ValueError(f"Object '{object_name}' of class '{object_class_name}' not found in DataManager.")
+        return table.view()[self.time_series.rows(object_class_name, [object_name])[0], start:stop]
+
+    @instrumented
     def get_object_attribute(self,
                              object_class: Type[AbstractObject],
                              object_name: str,
@@ -178,3 +452,157 @@ class DataManager:
             raise ValueError(f"Object '{object_name}' of class '{object_class.__name__}' not found in DataManager.")
         return ObjectAttributesManager.get_attribute(obj, attribute_name)
 
+    @require_open
+    def add_objects(self,
+                    object_class: Type[AbstractObject],
+                    object_names: Iterable[str]
+                    ) -> None:
+        """
+        Initialize and add several objects of the same class in a single batch.
+
+        Duplicates (inside the batch or against the database) are checked once with set
+        operations; if any row is invalid nothing is added and every bad row is reported.
+        """
+        object_class = get_abstract_object_subclass(get_object_class_name(object_class))
+        object_class_name = object_class.__name__
+        object_names = list(object_names)
+        existing_objects = self.objects_database.get(object_class_name, {})
+
+        errors = []
+        seen = set()
+        for row, object_name in enumerate(object_names):
+            if object_name in seen:
+                errors.append((row, f"Object '{object_name}' is duplicated in the batch."))
+            elif object_name in existing_objects:
+                errors.append((row, f"Object '{object_name}' already exists in '{object_class_name}'."))
+            seen.add(object_name)
+        if errors:
+            raise BatchValidationError(errors)
+
+        class_objects = self.objects_database.setdefault(object_class_name, {})
+        for object_name in object_names:
+            class_objects[object_name] = object_class(object_name=object_name)
+        self._mark_dirty(object_class_name, object_names)
+        if self._listeners:
+            self._notify("on_objects_added", object_class_name, object_names)
+
+    @require_open
+    def add_attributes(self,
+                       object_class: Type[AbstractObject],
+                       object_names: Iterable[str],
+                       attr_name: str,
+                       attr_values
+                       ) -> None:
+        """
+        Set the same attribute on several objects of one class in a single batch.
+
+        `attr_values` is either a sequence aligned with `object_names` or a single value
+        applied to every object. A 2-D array (objects x intervals) sets time series instead.
+        The batch is applied only if every row is valid.
+        """
+        object_class = get_abstract_object_subclass(get_object_class_name(object_class))
+        object_class_name = object_class.__name__
+        object_names = list(object_names)
+        is_time_series = np.ndim(attr_values) == 2
+        if is_time_series:
+            assert_time_series_attribute(object_class_name, attr_name)
+            attr_values = np.asarray(attr_values, dtype=np.float64)
+            if len(attr_values) != len(object_names):
+                raise ValueError(f"'attr_values' has {len(attr_values)} rows but the batch has {len(object_names)} objects.")
+        else:
+            attr_values = self._broadcast_batch_values(attr_values, len(object_names), "attr_values")
+
+        if attr_name not in {class_field.name for class_field in fields(object_class)}:
+            raise AttributeError(f"'{object_class_name}' object has no attribute '{attr_name}'")
+
+        class_objects = self.objects_database.get(object_class_name, {})
+        errors = [(row, f"Object '{object_name}' of class '{object_class_name}' not found in DataManager.")
+                  for row, object_name in enumerate(object_names) if object_name not in class_objects]
+        if errors:
+            raise BatchValidationError(errors)
+
+        if is_time_series:
+            self.time_series.set_series(object_class_name, object_names, attr_name, attr_values)
+        elif self.backend == "columnar":
+            class_objects.set_values([class_objects.index[object_name] for object_name in object_names],
+                                     attr_name, attr_values)
+        else:
+            for object_name, attr_value in zip(object_names, attr_values):
+                setattr(class_objects[object_name], attr_name, attr_value)
+        self._mark_dirty(object_class_name, object_names)
+        if self._listeners:
+            self._notify("on_attributes_set", object_class_name, object_names, attr_name, attr_values)
+
+    @require_open
+    def add_memberships(self,
+                        child_object_class: Type[AbstractObject],
+                        child_object_names: Iterable[str],
+                        parent_object_class: Type[AbstractObject],
+                        parent_object_names: Union[str, Iterable[str]]
+                        ) -> None:
+        """
+        Validate and set many parent-child relationships between two classes in a single batch.
+
+        `parent_object_names` is either aligned with `child_object_names` or a single parent
+        name shared by every child. The relationship rules are checked once for the class pair,
+        existence and single-parent constraints once per batch; every bad row is reported and
+        nothing is set unless the whole batch is valid.
+        """
+        child_object_class = get_abstract_object_subclass(get_object_class_name(child_object_class))
+        parent_object_class = get_abstract_object_subclass(get_object_class_name(parent_object_class))
+        child_object_names = list(child_object_names)
+        parent_object_names = self._broadcast_batch_values(parent_object_names, len(child_object_names),
+                                                           "parent_object_names")
+
+        errors = []
+        if not RelationshipValidator.is_valid_child(parent_object_class, child_object_class):
+            errors.append((None, f"ObjectClass {child_object_class.__name__} cannot be a child of "
+                                 f"ObjectClass {parent_object_class.__name__}."))
+        if not RelationshipValidator.is_valid_parent(child_object_class, parent_object_class):
+            errors.append((None, f"ObjectClass {parent_object_class.__name__} cannot be a parent of "
+                                 f"ObjectClass {child_object_class.__name__}."))
+
+        child_objects = self.objects_database.get(child_object_class.__name__, {})
+        parent_objects = self.objects_database.get(parent_object_class.__name__, {})
+        missing_parents = {name for name in parent_object_names if name not in parent_objects}
+        missing_children = {name for name in child_object_names if name not in child_objects}
+
+        seen = set()
+        for row, (child_object_name, parent_object_name) in enumerate(zip(child_object_names, parent_object_names)):
+            if parent_object_name in missing_parents:
+                errors.append((row, f"Parent {parent_object_name} must exist before setting a relationship."))
+            if child_object_name in missing_children:
+                errors.append((row, f"Child {child_object_name} must exist before setting a relationship."))
+            elif child_object_name in seen:
+                errors.append((row, f"Child {child_object_name} is assigned more than one parent in the batch."))
+            elif child_objects[child_object_name].parent:
+                errors.append((row, f"'{child_object_class.__name__}' {child_object_name} already has a parent "
+                                    f"and cannot be reassigned."))
+            seen.add(child_object_name)
+        if errors:
+            raise BatchValidationError(errors)
+
+        children_by_parent: Dict[str, List[str]] = {}
+        for child_object_name, parent_object_name in zip(child_object_names, parent_object_names):
+            children_by_parent.setdefault(parent_object_name, []).append(child_object_name)
+            ObjectAttributesManager.set_parent(obj=child_objects[child_object_name],
+                                               parent_class=parent_object_class,
+                                               parent_object_name=parent_object_name)
+        for parent_object_name, names in children_by_parent.items():
+            ObjectAttributesManager.set_children(obj=parent_objects[parent_object_name],
+                                                 child_class=child_object_class,
+                                                 child_object_names=names)
+        self._mark_dirty(child_object_class.__name__, child_object_names)
+        if self._listeners:
+            self._notify("on_memberships_added", child_object_class.__name__, child_object_names,
+                         parent_object_class.__name__, parent_object_names)
+
+    @staticmethod
+    def _broadcast_batch_values(values, size: int, argument_name: str) -> Sequence:
+        """Return `values` as a sequence of length `size`, repeating a single str/scalar value."""
+        if isinstance(values, str) or not isinstance(values, Iterable):
+            return [values] * size
+        values = list(values)
+        if len(values) != size:
+            raise ValueError(f"'{argument_name}' has {len(values)} values but the batch has {size} objects.")
+        return values
@@ -0,0 +1,204 @@
+"""
+Instrumentation of DataManager operations.
+
+When enabled, every instrumented call records its latency and outcome in per-operation statistics:
+call and error counters, cumulative time, percentiles over the most recent calls, and the number of
+validation errors raised. Calls made by the manager itself inside a recorded call (e.g. the lookups of
+`add_membership`) are part of that call and not recorded separately. It is off by default and then costs
+a single attribute check per call.
+
+Enable it with `instrumentation.enable()` or the environment variable `EDF_INSTRUMENTATION`
+("1" to record statistics, "profile" to also profile slow calls), and read it with
+`instrumentation.snapshot()` (dict) or `instrumentation.to_prometheus()` (Prometheus text format).
+"""
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+import cProfile
+import functools
+import io
+import os
+import pstats
+import threading
+import time
+import numpy as np
+
+ENVIRONMENT_VARIABLE = "EDF_INSTRUMENTATION"
+LATENCY_WINDOW = 10_000  # Percentiles are computed over the most recent calls of each operation
+PERCENTILES = (50, 90, 99)
+DEFAULT_SLOW_CALL_SECONDS = 0.05
+DEFAULT_PROFILE_EVERY = 1
+MAX_SLOW_CALLS = 20
+PROFILE_LINES = 25
+METRIC_PREFIX = "edf_datamanager"
+
+
+@dataclass
+class OperationStats:
+    """Statistics of one operation."""
+    calls: int = 0
+    errors: int = 0
+    validation_errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def to_dict(self) -> dict:
+        latencies = np.fromiter(self.latencies, dtype=np.float64, count=len(self.latencies))
+        percentiles = np.percentile(latencies, PERCENTILES) if len(latencies) else np.zeros(len(PERCENTILES))
+        return {"calls": self.calls,
+                "errors": self.errors,
+                "validation_errors": self.validation_errors,
+                "total_seconds": self.total_seconds,
+                "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+                "max_seconds": self.max_seconds,
+                **{f"p{percentile}_seconds": float(value) for percentile, value in zip(PERCENTILES, percentiles)}}
+
+
+@dataclass
+class SlowCall:
+    """A profiled call that took longer than the slow-call threshold."""
+    operation: str
+    seconds: float
+    profile: str  # pstats report, sorted by cumulative time
+
+
+class Instrumentation:
+    """Process-wide recorder of DataManager operation statistics (use the `instrumentation` singleton)."""
+
+    def __init__(self):
+        self.enabled = False
+        self.profile_slow_calls = False
+        self.slow_call_seconds = DEFAULT_SLOW_CALL_SECONDS
+        self.profile_every = DEFAULT_PROFILE_EVERY
+        self.operations: Dict[str, OperationStats] = {}
+        self.slow_calls: Deque[SlowCall] = deque(maxlen=MAX_SLOW_CALLS)
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Marks the thread already running a recorded call
+        self._profile_counter = 0
+
+    def enable(self,
+               profile_slow_calls: bool = False,
+               slow_call_seconds: float = DEFAULT_SLOW_CALL_SECONDS,
+               profile_every: int = DEFAULT_PROFILE_EVERY) -> None:
+        """
+        Start recording. With `profile_slow_calls`, one call in `profile_every` runs under cProfile and
+        its profile is kept (in `slow_calls`) when it takes at least `slow_call_seconds`.
+        """
+        if profile_every < 1:
+            raise ValueError(f"profile_every must be at least 1, got {profile_every}.")
+        self.profile_slow_calls = profile_slow_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.profile_every = profile_every
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forget every recorded statistic and slow call."""
+        with self._lock:
+            self.operations = {}
+            self.slow_calls.clear()
+
+    def call(self, operation: str, func, *args, **kwargs):
+        """
+        Run `func` and record it as a call of `operation`. Only the outermost call of a thread is recorded:
+        the instrumented calls it makes itself (e.g. the lookups of `add_membership`) are part of its time.
+        """
+        if getattr(self._local, "in_call", False):
+            return func(*args, **kwargs)
+        profiler = None
+        if self.profile_slow_calls:
+            with self._lock:
+                self._profile_counter += 1
+                if self._profile_counter % self.profile_every == 0:
+                    profiler = cProfile.Profile()
+        self._local.in_call = True
+        start = time.perf_counter()
+        error = None
+        try:
+            if profiler is None:
+                return func(*args, **kwargs)
+            return profiler.runcall(func, *args, **kwargs)
+        except Exception as raised:
+            error = raised
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            self._local.in_call = False
+            if profiler is not None and seconds >= self.slow_call_seconds:
+                self._record_slow_call(operation, seconds, profiler)
+            self._record(operation, seconds, error)
+
+    def _record(self, operation: str, seconds: float, error: Optional[Exception]) -> None:
+        with self._lock:
+            stats = self.operations.get(operation)
+            if stats is None:
+                stats = self.operations[operation] = OperationStats()
+            stats.calls += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.latencies.append(seconds)
+            if error is not None:
+                stats.errors += 1
+                if isinstance(error, ValueError):
+                    stats.validation_errors += _count_validation_errors(error)
+
+    def _record_slow_call(self, operation: str, seconds: float, profiler: cProfile.Profile) -> None:
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(PROFILE_LINES)
+        with self._lock:
+            self.slow_calls.append(SlowCall(operation=operation, seconds=seconds, profile=report.getvalue()))
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Statistics of every recorded operation, as {operation: {metric: value}}."""
+        with self._lock:
+            return {operation: stats.to_dict() for operation, stats in self.operations.items()}
+
+    def to_prometheus(self) -> str:
+        """Statistics in the Prometheus text exposition format (latencies as summaries)."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        for metric, kind, key, description in (
+                ("calls_total", "counter", "calls", "Number of calls."),
+                ("errors_total", "counter", "errors", "Number of calls that raised."),
+                ("validation_errors_total", "counter", "validation_errors", "Number of validation errors raised.")):
+            lines += [f"# HELP {METRIC_PREFIX}_{metric} {description}", f"# TYPE {METRIC_PREFIX}_{metric} {kind}"]
+            lines += [f'{METRIC_PREFIX}_{metric}{{operation="{operation}"}} {stats[key]}'
+                      for operation, stats in snapshot.items()]
+        metric = f"{METRIC_PREFIX}_call_seconds"
+        lines += [f"# HELP {metric} Call latency in seconds.", f"# TYPE {metric} summary"]
+        for operation, stats in snapshot.items():
+            lines += [f'{metric}{{operation="{operation}",quantile="{percentile / 100:g}"}} '
+                      f'{stats[f"p{percentile}_seconds"]:.9g}' for percentile in PERCENTILES]
+            lines += [f'{metric}_sum{{operation="{operation}"}} {stats["total_seconds"]:.9g}',
+                      f'{metric}_count{{operation="{operation}"}} {stats["calls"]}']
+        return "\n".join(lines) + "\n"
+
+
+def _count_validation_errors(error: ValueError) -> int:
+    """Batch errors carry their rows; other validation errors list one error per message line."""
+    errors = getattr(error, "errors", None)
+    if errors is not None:
+        return len(errors)
+    return max(1, len(str(error).splitlines()))
+
+
+def instrumented(func):
+    """Decorator recording the calls of a DataManager method when instrumentation is enabled."""
+    operation = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not instrumentation.enabled:
+            return func(*args, **kwargs)
+        return instrumentation.call(operation, func, *args, **kwargs)
+
+    return wrapper
+
+
+instrumentation = Instrumentation()
+_setting = os.environ.get(ENVIRONMENT_VARIABLE, "").strip().lower()
+if _setting in ("1", "true", "yes", "on", "profile"):
+    instrumentation.enable(profile_slow_calls=_setting == "profile")
@@ -22,6 +22,8 @@ class ObjectAttributesManager:
     @staticmethod
     def set_child(obj: AbstractObject, child_class: Type[AbstractObject], child_object_name: str):
         """Add a child object and store it as {class_name: [object_names]}."""
+        if getattr(type(obj), "derives_children", False):
+            return  # Children are derived from the child's parent link (see ObjectRowView)
         child_class_name = child_class.__name__
 
         if child_class_name not in obj.children:
@@ -29,6 +31,13 @@ class ObjectAttributesManager:
 
         obj.children[child_class_name].append(child_object_name)
 
+    @staticmethod
+    def set_children(obj: AbstractObject, child_class: Type[AbstractObject], child_object_names: List[str]):
+        """Add several child objects of the same class, extending {class_name: [object_names]}."""
+        if getattr(type(obj), "derives_children", False):
+            return
+        obj.children.setdefault(child_class.__name__, []).extend(child_object_names)
+
     @staticmethod
     def set_parent(obj: AbstractObject, parent_class: Type[AbstractObject], parent_object_name: str):
         """Set a single parent object, ensuring only one parent is stored."""
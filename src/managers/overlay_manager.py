@@ -0,0 +1,339 @@
+from src.managers.data_manager import DataManager
+from src.managers.columnar_database import STRUCTURAL_FIELDS
+from src.managers.time_series import TimeSeriesTable, assert_time_series_attribute
+from src.objects.abstract_object_class import AbstractObject
+from src.utils.abstract_object_subclasses import get_abstract_object_subclass, get_object_class_name
+from collections.abc import Mapping, MutableMapping
+from dataclasses import fields
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+import numpy as np
+
+
+class OverlayClassObjects(MutableMapping):
+    """
+    Objects of one class seen through an overlay: the overlay's own objects (new ones and
+    copy-on-write copies of changed base objects) take precedence over the base objects.
+    """
+
+    def __init__(self, base_objects: Optional[Mapping]):
+        self.base_objects = base_objects if base_objects is not None else {}
+        self.objects: Dict[str, AbstractObject] = {}
+        self.new_names: Dict[str, None] = {}  # Ordered set of the objects that are not in the base
+
+    def __len__(self) -> int:
+        return len(self.base_objects) + len(self.new_names)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base_objects
+        yield from self.new_names
+
+    def __contains__(self, object_name) -> bool:
+        return object_name in self.objects or object_name in self.base_objects
+
+    def __getitem__(self, object_name: str) -> AbstractObject:
+        obj = self.objects.get(object_name)
+        return obj if obj is not None else self.base_objects[object_name]
+
+    def __setitem__(self, object_name: str, obj: AbstractObject) -> None:
+        if object_name not in self.base_objects:
+            self.new_names[object_name] = None
+        self.objects[object_name] = obj
+
+    def __delitem__(self, object_name: str) -> None:
+        raise TypeError("Objects cannot be removed from an overlay.")
+
+    def make_writable(self, object_name: str, copy_object) -> None:
+        """Copy a base object into the overlay before it is changed."""
+        if object_name not in self.objects and object_name in self.base_objects:
+            self.objects[object_name] = copy_object(self.base_objects[object_name])
+
+
+class OverlayObjectsDatabase(MutableMapping):
+    """`{"ClassName": {"ObjectName": ObjectInstance}}` view of an overlay, resolving unchanged objects to the base."""
+
+    def __init__(self, base_database: Mapping):
+        self.base_database = base_database
+        self.classes: Dict[str, OverlayClassObjects] = {}
+
+    def __len__(self) -> int:
+        return len(self.base_database) + sum(1 for class_name in self.classes if class_name not in self.base_database)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base_database
+        yield from (class_name for class_name in self.classes if class_name not in self.base_database)
+
+    def __contains__(self, object_class_name) -> bool:
+        return object_class_name in self.classes or object_class_name in self.base_database
+
+    def __getitem__(self, object_class_name: str) -> OverlayClassObjects:
+        class_objects = self.classes.get(object_class_name)
+        if class_objects is None:
+            class_objects = self.classes[object_class_name] = OverlayClassObjects(self.base_database[object_class_name])
+        return class_objects
+
+    def __setitem__(self, object_class_name: str, objects: Mapping) -> None:
+        class_objects = self.setdefault(object_class_name)
+        for object_name, obj in objects.items():
+            class_objects[object_name] = obj
+
+    def __delitem__(self, object_class_name: str) -> None:
+        raise TypeError("Classes cannot be removed from an overlay.")
+
+    def setdefault(self, object_class_name: str, default: Optional[Mapping] = None) -> OverlayClassObjects:
+        """Return the objects of a class, creating the class (and storing `default` items) if missing."""
+        if object_class_name in self:
+            return self[object_class_name]
+        class_objects = self.classes[object_class_name] = OverlayClassObjects(None)
+        for object_name, obj in (default or {}).items():
+            class_objects[object_name] = obj
+        return class_objects
+
+
+class OverlayTimeSeries:
+    """
+    Time-series attributes of an overlay: per-object series set in the overlay, resolved against the
+    base tables. A scalar set on an attribute holding time series overrides the object's series too.
+    """
+
+    def __init__(self, overlay: "OverlayDataManager"):
+        self.overlay = overlay
+        self.series: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}  # {(class, attribute): {object: series}}
+
+    def n_intervals(self, class_name: str, attr_name: str) -> Optional[int]:
+        if self.overlay.base.has_time_series(class_name, attr_name):
+            return self.overlay.base.get_time_series(class_name, attr_name).shape[1]
+        object_series = self.series.get((class_name, attr_name))
+        return len(next(iter(object_series.values()))) if object_series else None
+
+    def attribute_names(self, class_name: str) -> List[str]:
+        attr_names = dict.fromkeys(attr_name for table_class_name, attr_name in self.series if table_class_name == class_name)
+        base_series = self.overlay.base._time_series
+        if base_series is not None:
+            attr_names.update(dict.fromkeys(base_series.attribute_names(class_name)))
+        return list(attr_names)
+
+    def set_series(self, class_name: str, object_names: Sequence[str], attr_name: str, values: np.ndarray) -> None:
+        assert_time_series_attribute(class_name, attr_name)
+        values = np.array(values, dtype=np.float64)  # Own copy, whose rows are stored as views
+        n_intervals = self.n_intervals(class_name, attr_name)
+        if n_intervals is not None and values.shape[1] != n_intervals:
+            raise ValueError(f"Time series of '{class_name}.{attr_name}' have {n_intervals} intervals, "
+                             f"got {values.shape[1]}.")
+        self.series.setdefault((class_name, attr_name), {}).update(zip(object_names, values))
+
+    def get_series(self, class_name: str, attr_name: str, object_name: str) -> np.ndarray:
+        object_series = self.series.get((class_name, attr_name), {})
+        if object_name in object_series:
+            return object_series[object_name]
+        if object_name in self.overlay.base.objects_database.get(class_name, {}) and \
+                self.overlay.base.has_time_series(class_name, attr_name):
+            return self.overlay.base.get_time_series(class_name, attr_name, object_name)
+        return np.full(self.n_intervals(class_name, attr_name),
+                       float(getattr(self.overlay.objects_database[class_name][object_name], attr_name)))
+
+    def merged(self, class_name: str, attr_name: str) -> np.ndarray:
+        """(objects, intervals) array of the whole class, combining the base table and the overlay series."""
+        object_names = self.overlay.get_object_names(class_name)
+        n_base = len(self.overlay.base.objects_database.get(class_name, {}))
+        merged = np.empty((len(object_names), self.n_intervals(class_name, attr_name)))
+        if self.overlay.base.has_time_series(class_name, attr_name):
+            merged[:n_base] = self.overlay.base.get_time_series(class_name, attr_name)
+        else:
+            merged[:n_base] = self.overlay.base.get_attribute_column(class_name, attr_name)[:, np.newaxis]
+        for row in range(n_base, len(object_names)):
+            merged[row] = self.get_series(class_name, attr_name, object_names[row])
+        for object_name, values in self.series.get((class_name, attr_name), {}).items():
+            merged[self.overlay.object_row(class_name, object_name)] = values
+        return merged
+
+    def get_table(self, class_name: str, attr_name: str) -> Optional[TimeSeriesTable]:
+        """A standalone table holding the merged series (a copy), e.g. to save a snapshot of the overlay."""
+        if self.n_intervals(class_name, attr_name) is None:
+            return None
+        merged = self.merged(class_name, attr_name)
+        return TimeSeriesTable(class_name, attr_name, merged.shape[1], data=merged)
+
+    # Listener interface (see DataManager.add_listener)
+
+    def on_attributes_set(self, class_name: str, object_names: Sequence[str], attr_name: str, attr_values) -> None:
+        if np.ndim(attr_values) != 1:
+            return
+        n_intervals = self.n_intervals(class_name, attr_name)
+        if n_intervals is not None:
+            self.set_series(class_name, object_names, attr_name,
+                            np.repeat(np.asarray(attr_values, dtype=np.float64)[:, np.newaxis], n_intervals, axis=1))
+
+
+class OverlayDataManager(DataManager):
+    """
+    Copy-on-write view of a frozen DataManager, for what-if scenarios (a price shock, a tripped unit, ...).
+
+    An overlay is created in constant time and stores only what it changes: new objects, copies of the
+    base objects whose attributes or memberships change, and time series set on it. Reads resolve to
+    the base for everything else (unchanged objects are the base instances: treat them as read-only).
+    Closing an overlay validates only its changed objects. `flatten()` merges it into a new DataManager,
+    which can itself be frozen and overlaid.
+    """
+
+    def __init__(self, base: DataManager):
+        if not base.is_frozen:
+            raise RuntimeError("The base DataManager must be frozen (freeze()) before it is overlaid.")
+        super().__init__(backend="dict", full_validation=base.full_validation)
+        self.base = base
+        self.objects_database = OverlayObjectsDatabase(base.objects_database)
+        self._time_series = OverlayTimeSeries(self)
+        self.add_listener(self._time_series)
+
+    def changed_objects(self) -> Dict[str, List[str]]:
+        """Names of the objects held by the overlay (new or changed), per class."""
+        return {class_name: list(class_objects.objects)
+                for class_name, class_objects in self.objects_database.classes.items() if class_objects.objects}
+
+    @property
+    def content_hashes(self):
+        """Content hashes seeded from the index of the base (see ContentHashIndex), rehashing only changed objects."""
+        if self._content_hashes is None:
+            from src.managers.content_hash import ContentHashIndex
+            self._content_hashes = ContentHashIndex(self, base_index=self.base.content_hashes)
+            self.add_listener(self._content_hashes)
+        return self._content_hashes
+
+    def object_row(self, object_class, object_name: str) -> int:
+        """Row of an object in `get_object_names` order (base objects first, then the overlay's new ones)."""
+        object_class_name = get_object_class_name(object_class)
+        class_objects = self.objects_database[object_class_name]
+        if object_name in class_objects.new_names:
+            return len(class_objects.base_objects) + list(class_objects.new_names).index(object_name)
+        return self.base.topology.object_id(object_class_name, object_name)
+
+    # Copy-on-write: objects about to change are copied into the overlay first
+
+    def add_attribute(self, object_class: Type[AbstractObject], object_name: str, attr_name: str, attr_value) -> None:
+        if self._is_open:
+            self._copy_on_write(object_class, [object_name])
+        super().add_attribute(object_class, object_name, attr_name, attr_value)
+
+    def add_attributes(self, object_class: Type[AbstractObject], object_names: Iterable[str], attr_name: str,
+                       attr_values) -> None:
+        object_names = list(object_names)
+        if self._is_open:
+            self._copy_on_write(object_class, object_names)
+        super().add_attributes(object_class, object_names, attr_name, attr_values)
+
+    def add_membership(self, child_object_class: Type[AbstractObject], child_object_name: str,
+                       parent_object_class: Type[AbstractObject], parent_object_name: str) -> None:
+        if self._is_open:
+            self._copy_on_write(child_object_class, [child_object_name])
+            self._copy_on_write(parent_object_class, [parent_object_name])
+        super().add_membership(child_object_class, child_object_name, parent_object_class, parent_object_name)
+
+    def add_memberships(self, child_object_class: Type[AbstractObject], child_object_names: Iterable[str],
+                        parent_object_class: Type[AbstractObject], parent_object_names) -> None:
+        child_object_names = list(child_object_names)
+        parent_object_names = self._broadcast_batch_values(parent_object_names, len(child_object_names),
+                                                           "parent_object_names")
+        if self._is_open:
+            self._copy_on_write(child_object_class, child_object_names)
+            self._copy_on_write(parent_object_class, dict.fromkeys(parent_object_names))
+        super().add_memberships(child_object_class, child_object_names, parent_object_class, parent_object_names)
+
+    def _copy_on_write(self, object_class, object_names: Iterable[str]) -> None:
+        object_class_name = get_object_class_name(object_class)
+        if object_class_name not in self.base.objects_database:
+            return
+        class_objects = self.objects_database[object_class_name]
+        for object_name in object_names:
+            class_objects.make_writable(object_name, self._copy_base_object)
+
+    def _copy_base_object(self, obj: AbstractObject) -> AbstractObject:
+        """Standalone dataclass copy of a base object (or columnar row view), with its own parent/children."""
+        object_class = obj.__class__
+        copy = object_class(object_name=obj.object_name)
+        for class_field in fields(object_class):
+            if class_field.name not in STRUCTURAL_FIELDS:
+                setattr(copy, class_field.name, getattr(obj, class_field.name))
+        copy.parent = dict(obj.parent)
+        if getattr(type(obj), "derives_children", False):
+            # Row views derive children by scanning every table; the base topology index answers directly
+            children = {child_class_name: self.base.topology.children(object_class, obj.object_name, child_class_name)
+                        for child_class_name in self.base.get_added_object_classes()}
+            copy.children = {child_class_name: names for child_class_name, names in children.items() if names}
+        else:
+            copy.children = {child_class_name: list(names) for child_class_name, names in obj.children.items()}
+        return copy
+
+    # Reads combining the overlay and the base
+
+    def get_attribute_column(self, object_class: Type[AbstractObject], attribute_name: str) -> np.ndarray:
+        """Return one numeric attribute for every object of a class (a new array: the base column, patched)."""
+        object_class_name = get_object_class_name(object_class)
+        if object_class_name not in self.objects_database:
+            return np.empty(0)
+        class_objects = self.objects_database[object_class_name]
+        column = np.empty(len(class_objects))
+        n_base = len(class_objects.base_objects)
+        if n_base:
+            column[:n_base] = self.base.get_attribute_column(object_class_name, attribute_name)
+        for row, object_name in enumerate(class_objects.new_names, start=n_base):
+            column[row] = getattr(class_objects.objects[object_name], attribute_name)
+        for object_name, obj in class_objects.objects.items():
+            if object_name not in class_objects.new_names:
+                column[self.object_row(object_class_name, object_name)] = getattr(obj, attribute_name)
+        return column
+
+    def has_time_series(self, object_class: Type[AbstractObject], attr_name: str) -> bool:
+        object_class_name = get_object_class_name(object_class)
+        return (object_class_name, attr_name) in self.time_series.series or \
+            self.base.has_time_series(object_class_name, attr_name)
+
+    def get_time_series(self,
+                        object_class: Type[AbstractObject],
+                        attr_name: str,
+                        object_name: Optional[str] = None,
+                        start: Optional[int] = None,
+                        stop: Optional[int] = None
+                        ) -> np.ndarray:
+        """
+        Return a time-series attribute, by object or for the whole class, over intervals [start, stop).
+        Unchanged data is a zero-copy view of the base; a class whose series changed is merged into a new array.
+        """
+        object_class_name = get_object_class_name(object_class)
+        if not self.has_time_series(object_class_name, attr_name):
+            raise ValueError(f"Attribute '{attr_name}' of class '{object_class_name}' has no time series.")
+        if object_name is not None:
+            if object_name not in self.objects_database.get(object_class_name, {}):
+                raise ValueError(f"Object '{object_name}' of class '{object_class_name}' not found in DataManager.")
+            return self.time_series.get_series(object_class_name, attr_name, object_name)[start:stop]
+        class_objects = self.objects_database[object_class_name]
+        if (object_class_name, attr_name) not in self.time_series.series and not class_objects.new_names:
+            return self.base.get_time_series(object_class_name, attr_name, start=start, stop=stop)
+        return self.time_series.merged(object_class_name, attr_name)[:, start:stop]
+
+    def flatten(self, backend: Optional[str] = None, time_series_dir: Optional[str] = None) -> DataManager:
+        """Merge the overlay and its base into a new, independent DataManager (closed and validated)."""
+        flat = DataManager(backend=backend or self.base.backend, full_validation=self.full_validation,
+                           time_series_dir=time_series_dir)
+        with flat:
+            class_names = self.get_added_object_classes()
+            for class_name in class_names:
+                flat.add_objects(class_name, self.get_object_names(class_name))
+            for class_name in class_names:
+                object_names = self.get_object_names(class_name)
+                objects = [self.objects_database[class_name][object_name] for object_name in object_names]
+                for class_field in fields(get_abstract_object_subclass(class_name)):
+                    if class_field.name not in STRUCTURAL_FIELDS:
+                        flat.add_attributes(class_name, object_names, class_field.name,
+                                            [getattr(obj, class_field.name) for obj in objects])
+                memberships: Dict[str, Tuple[List[str], List[str]]] = {}
+                for obj in objects:
+                    for parent_class_name, parent_object_name in obj.parent.items():
+                        child_names, parent_names = memberships.setdefault(parent_class_name, ([], []))
+                        child_names.append(obj.object_name)
+                        parent_names.append(parent_object_name)
+                for parent_class_name, (child_names, parent_names) in memberships.items():
+                    flat.add_memberships(class_name, child_names, parent_class_name, parent_names)
+            for class_name in class_names:
+                for attr_name in self.time_series.attribute_names(class_name):
+                    flat.add_attributes(class_name, self.get_object_names(class_name), attr_name,
+                                        self.get_time_series(class_name, attr_name))
+        return flat
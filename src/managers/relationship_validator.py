@@ -1,9 +1,38 @@
 from src.objects import ObjectClass, AbstractObject
+from src.objects.registry_object_subclasses import object_class_registry
 from src.utils.abstract_object_subclasses import (
     get_object_class_name,
     get_abstract_object_subclass,
+    get_object_class_index,
 )
-from typing import Type, Union
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Type, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass(frozen=True)
+class CompiledRelationshipRules:
+    """
+    `RelationshipValidator.rules` compiled into integer-indexed boolean tables.
+
+    Rows and columns follow the ObjectClassRegistry indexes:
+    - allowed_child[parent, child]: child class may be attached to parent class.
+    - allowed_parent[child, parent]: parent class may be assigned to child class
+      (a class without parent restrictions accepts every parent).
+    - required_parent[child, parent]: parent class is one of the required parents of child class.
+    - requires_parent[child]: child class has a non-empty required_parent rule.
+    The `*_rows` fields hold the same tables as nested lists, which are faster for scalar lookups.
+    """
+    registry_version: int
+    allowed_child: "np.ndarray"
+    allowed_parent: "np.ndarray"
+    required_parent: "np.ndarray"
+    requires_parent: "np.ndarray"
+    allowed_child_rows: list
+    allowed_parent_rows: list
+    required_parent_rows: list
 
 
 class RelationshipValidator:
@@ -31,21 +60,62 @@ class RelationshipValidator:
              "required_parent": ()},
     }
 
+    _compiled_rules = None
+
+    @classmethod
+    def compile_rules(cls) -> CompiledRelationshipRules:
+        """
+        Compile `rules` into integer-indexed lookup tables.
+
+        The result is cached and rebuilt automatically when a new AbstractObject subclass is
+        registered; call this again explicitly after editing `rules` in place.
+        """
+        import numpy as np  # Imported on first use, so that importing the package stays cheap
+
+        size = len(object_class_registry)
+        allowed_child = np.zeros((size, size), dtype=bool)
+        allowed_parent = np.ones((size, size), dtype=bool)
+        required_parent = np.zeros((size, size), dtype=bool)
+        for object_class, rule in cls.rules.items():
+            object_class_index = get_object_class_index(object_class)
+            for child_class in rule.get("children", ()):
+                allowed_child[object_class_index, get_object_class_index(child_class)] = True
+            if rule.get("parent"):
+                allowed_parent[object_class_index, :] = False
+                for parent_class in rule["parent"]:
+                    allowed_parent[object_class_index, get_object_class_index(parent_class)] = True
+            for parent_class in rule.get("required_parent") or ():
+                required_parent[object_class_index, get_object_class_index(parent_class)] = True
+
+        cls._compiled_rules = CompiledRelationshipRules(registry_version=object_class_registry.version,
+                                                        allowed_child=allowed_child,
+                                                        allowed_parent=allowed_parent,
+                                                        required_parent=required_parent,
+                                                        requires_parent=required_parent.any(axis=1),
+                                                        allowed_child_rows=allowed_child.tolist(),
+                                                        allowed_parent_rows=allowed_parent.tolist(),
+                                                        required_parent_rows=required_parent.tolist())
+        return cls._compiled_rules
+
+    @classmethod
+    def get_compiled_rules(cls) -> CompiledRelationshipRules:
+        """Return the compiled lookup tables, recompiling them if the class registry changed."""
+        compiled_rules = cls.__dict__.get("_compiled_rules")
+        if compiled_rules is None or compiled_rules.registry_version != object_class_registry.version:
+            compiled_rules = cls.compile_rules()
+        return compiled_rules
+
     @classmethod
     def is_valid_child(cls, parent_class: Union[Type[AbstractObject], str], child_class: Union[Type[AbstractObject], str]) -> bool:
         """Check if the child type is allowed for the given parent type."""
-        parent_class = get_abstract_object_subclass(get_object_class_name(parent_class))
-        child_class = get_abstract_object_subclass(get_object_class_name(child_class))
-        allowed_children = cls.rules.get(parent_class, {}).get("children", [])
-        return child_class in allowed_children
+        allowed_child = cls.get_compiled_rules().allowed_child_rows
+        return allowed_child[get_object_class_index(parent_class)][get_object_class_index(child_class)]
 
     @classmethod
     def is_valid_parent(cls, child_class: Union[Type[AbstractObject], str], parent_class: Union[Type[AbstractObject], str]) -> bool:
         """Check if the parent type is allowed for the given child type."""
-        child_class = get_abstract_object_subclass(get_object_class_name(child_class))
-        parent_class = get_abstract_object_subclass(get_object_class_name(parent_class))
-        allowed_parents = cls.rules.get(child_class, {}).get("parent", None)
-        return parent_class in allowed_parents if allowed_parents else True
+        allowed_parent = cls.get_compiled_rules().allowed_parent_rows
+        return allowed_parent[get_object_class_index(child_class)][get_object_class_index(parent_class)]
 
     @classmethod
     def get_object_classes_with_required_parent(cls):
@@ -61,7 +131,5 @@ class RelationshipValidator:
     @classmethod
     def has_required_parent(cls, object_class: Union[Type[AbstractObject], str], parent_class: Union[Type[AbstractObject], str]) -> bool:
         """Check if the given object class requires the specified parent class."""
-        object_class = get_abstract_object_subclass(get_object_class_name(object_class))
-        parent_class = get_abstract_object_subclass(get_object_class_name(parent_class))
-        required_parents = cls.rules.get(object_class, {}).get("required_parent", [])
-        return parent_class in required_parents
+        required_parent = cls.get_compiled_rules().required_parent_rows
+        return required_parent[get_object_class_index(object_class)][get_object_class_index(parent_class)]
@@ -0,0 +1,254 @@
+"""
+Binary snapshots of a DataManager.
+
+File layout (little-endian):
+    MAGIC (8 bytes) | header length (uint64) | header (UTF-8 JSON) | padding | data section
+
+The header describes, per class, where its arrays live in the data section (64-byte aligned):
+- names: the object names joined by NUL into one UTF-8 blob (an interned name table);
+- numeric: one column per numeric dataclass field;
+- parent_class / parent_row: integer-encoded parent links (children are derived from them);
+- objects: non-numeric dataclass fields, stored as JSON in the header;
+- time_series: one (objects x intervals) array per time-series attribute.
+Parent class ids index the header "class_names", so snapshots do not depend on the registry order.
+"""
+from src.managers.columnar_database import ClassTable, ColumnarObjectsDatabase, NO_PARENT
+from src.managers.objects_attributes_manager import ObjectAttributesManager
+from src.objects.registry_object_subclasses import object_class_registry
+from src.utils.abstract_object_subclasses import get_abstract_object_subclass, get_object_class_index
+from typing import TYPE_CHECKING, Dict, List
+import hashlib
+import json
+import os
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.managers.data_manager import DataManager
+
+MAGIC = b"EDFSNAP1"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+NAME_SEPARATOR = "\0"
+
+
+def save_snapshot(manager: "DataManager", path: str) -> str:
+    """
+    Write the objects of a manager to `path` and return the content hash of the snapshot.
+
+    If the manager is closed with every change validated, the hash is also recorded as the
+    validated hash, which lets `load_snapshot` skip re-validation.
+    """
+    class_names = manager.get_added_object_classes()
+    database = manager.objects_database
+    if not isinstance(database, ColumnarObjectsDatabase):
+        database = _to_columnar_database(database)
+    class_ids = {class_name: class_id for class_id, class_name in enumerate(class_names)}
+    time_series = manager._time_series
+    arrays: List[np.ndarray] = []
+    classes_header = []
+    # Registry index -> header class id
+    registry_to_header = np.full(len(object_class_registry), NO_PARENT, dtype=np.int32)
+    for class_name, class_id in class_ids.items():
+        registry_to_header[get_object_class_index(class_name)] = class_id
+
+    for class_name in class_names:
+        table = database[class_name]
+        names = table.names
+        if any(NAME_SEPARATOR in name for name in names):
+            raise ValueError(f"Object names of '{class_name}' cannot contain NUL characters.")
+        parent_class_ids, parent_rows = table.parent_columns()
+        parent_class = np.full(len(names), NO_PARENT, dtype=np.int32)
+        has_parent = parent_class_ids >= 0
+        parent_class[has_parent] = registry_to_header[parent_class_ids[has_parent]]
+
+        series_names = time_series.attribute_names(class_name) if time_series is not None else []
+        class_header = {"name": class_name,
+                        "rows": len(names),
+                        "names": _add_array(arrays, np.frombuffer(NAME_SEPARATOR.join(names).encode("utf-8"), dtype=np.uint8)),
+                        "numeric": {attr_name: _add_array(arrays, table.column(attr_name))
+                                    for attr_name in table.numeric_columns},
+                        "objects": {attr_name: column[:len(names)] for attr_name, column in table.object_columns.items()},
+                        "parent_class": _add_array(arrays, parent_class),
+                        "parent_row": _add_array(arrays, np.ascontiguousarray(parent_rows, dtype=np.int64)),
+                        "time_series": {attr_name: _add_array(arrays, time_series.get_table(class_name, attr_name).view())
+                                        for attr_name in series_names}}
+        classes_header.append(class_header)
+
+    offset = 0
+    for array_header, array in zip(_iter_array_headers(classes_header), arrays):
+        array_header.update(offset=offset, dtype=array.dtype.str, shape=list(array.shape))
+        offset += _aligned(array.nbytes)
+
+    content_hash = _content_hash(classes_header, arrays)
+    is_validated = not manager._is_open and not manager._dirty_objects
+    header = json.dumps({"version": FORMAT_VERSION,
+                         "class_names": class_names,
+                         "classes": classes_header,
+                         "content_hash": content_hash,
+                         "validated_hash": content_hash if is_validated else None}).encode("utf-8")
+
+    # Write to a temporary file and rename, so a snapshot mapped from `path` (possibly the source of
+    # these arrays) keeps its file until it is released, and readers never see a partial snapshot
+    temporary_file = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_file, "wb") as f:
+            f.write(MAGIC)
+            f.write(np.uint64(len(header)).tobytes())
+            f.write(header)
+            f.write(b"\0" * (_aligned(f.tell()) - f.tell()))
+            for array in arrays:
+                f.write(array.tobytes())
+                f.write(b"\0" * (_aligned(array.nbytes) - array.nbytes))
+        os.replace(temporary_file, path)
+    except BaseException:
+        if os.path.exists(temporary_file):
+            os.remove(temporary_file)
+        raise
+    return content_hash
+
+
+def load_snapshot(path: str,
+                  mmap: bool = False,
+                  backend: str = "columnar",
+                  verify: bool = False
+                  ) -> "DataManager":
+    """
+    Open a snapshot as a new (closed) DataManager.
+
+    - mmap: map the file copy-on-write instead of reading it; columns are views of the mapping, paged in
+      lazily, and later edits never reach the file. Requires the columnar backend.
+    - backend: "columnar" (default) or "dict", which materializes one dataclass instance per object.
+    - verify: recompute the content hash and reject a snapshot that does not match it.
+
+    A snapshot saved from a validated state is trusted as validated; otherwise every object is marked
+    for validation on the next close.
+    """
+    from src.managers.data_manager import DataManager
+
+    if mmap and backend != "columnar":
+        raise ValueError("Memory-mapped snapshots require the columnar backend.")
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"'{path}' is not a DataManager snapshot.")
+        header_length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+        header = json.loads(f.read(header_length).decode("utf-8"))
+    if header["version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {header['version']}.")
+
+    data_offset = _aligned(len(MAGIC) + 8 + header_length)
+    if mmap:
+        data = np.memmap(path, dtype=np.uint8, mode="c", offset=data_offset)
+    else:
+        data = np.fromfile(path, dtype=np.uint8, offset=data_offset)
+
+    def read_array(array_header) -> np.ndarray:
+        dtype = np.dtype(array_header["dtype"])
+        count = int(np.prod(array_header["shape"]))
+        start = array_header["offset"]
+        return data[start:start + count * dtype.itemsize].view(dtype).reshape(array_header["shape"])
+
+    if verify:
+        arrays = [read_array(array_header) for array_header in _iter_array_headers(header["classes"])]
+        if _content_hash(header["classes"], arrays) != header["content_hash"]:
+            raise ValueError(f"Snapshot '{path}' is corrupted: content hash mismatch.")
+
+    # Header class id -> registry index
+    header_to_registry = np.array([get_object_class_index(class_name) for class_name in header["class_names"]],
+                                  dtype=np.int32)
+    database = ColumnarObjectsDatabase()
+    for class_header in header["classes"]:
+        names_blob = read_array(class_header["names"]).tobytes().decode("utf-8")
+        names = names_blob.split(NAME_SEPARATOR) if class_header["rows"] else []
+        parent_class = read_array(class_header["parent_class"])
+        has_parent = parent_class >= 0
+        parent_class_ids = np.full(len(names), NO_PARENT, dtype=np.int32)
+        parent_class_ids[has_parent] = header_to_registry[parent_class[has_parent]]
+        database.tables[class_header["name"]] = ClassTable.from_columns(
+            database=database,
+            object_class=get_abstract_object_subclass(class_header["name"]),
+            names=names,
+            numeric_columns={attr_name: read_array(array_header)
+                             for attr_name, array_header in class_header["numeric"].items()},
+            object_columns=class_header["objects"],
+            parent_class_ids=parent_class_ids,
+            parent_rows=read_array(class_header["parent_row"]))
+
+    manager = DataManager(backend=backend)
+    manager.objects_database = database if backend == "columnar" else _to_dict_database(database)
+    for class_header in header["classes"]:
+        for attr_name, array_header in class_header.get("time_series", {}).items():
+            manager.time_series.add_table(class_header["name"], attr_name, array_header["shape"][1],
+                                          data=read_array(array_header))
+    if header["validated_hash"] is None or header["validated_hash"] != header["content_hash"]:
+        for class_name, class_objects in manager.objects_database.items():
+            manager._mark_dirty(class_name, class_objects)
+    return manager
+
+
+def _to_columnar_database(objects_database: Dict[str, Dict]) -> ColumnarObjectsDatabase:
+    """Columnar copy of a dict-backend database, used to encode it."""
+    database = ColumnarObjectsDatabase()
+    for class_name, class_objects in objects_database.items():
+        table = database.setdefault(class_name)
+        for object_name, obj in class_objects.items():
+            row = table.append_row(object_name)
+            for attr_name in table.field_names:
+                if attr_name not in ("object_name", "parent", "children"):
+                    table.set_value(row, attr_name, getattr(obj, attr_name))
+    for class_name, class_objects in objects_database.items():
+        table = database[class_name]
+        for row, obj in enumerate(class_objects.values()):
+            if obj.parent:
+                table.set_parent(row, obj.parent)
+    return database
+
+
+def _to_dict_database(database: ColumnarObjectsDatabase) -> Dict[str, Dict]:
+    """Materialize a columnar database as {"ClassName": {"ObjectName": ObjectInstance}}, rebuilding children."""
+    objects_database = {}
+    for class_name, table in database.items():
+        class_objects = {}
+        for object_name in table.names:
+            obj = table.object_class(object_name=object_name)
+            row = table.index[object_name]
+            for attr_name in table.field_names:
+                if attr_name not in ("object_name", "parent", "children"):
+                    setattr(obj, attr_name, table.get_value(row, attr_name))
+            class_objects[object_name] = obj
+        objects_database[class_name] = class_objects
+    for class_name, table in database.items():
+        parent_class_ids, parent_rows = table.parent_columns()
+        for row in np.flatnonzero(parent_class_ids >= 0).tolist():
+            parent_class = get_abstract_object_subclass(object_class_registry.get_name(int(parent_class_ids[row])))
+            parent_object_name = database[parent_class.__name__].names[parent_rows[row]]
+            child = objects_database[class_name][table.names[row]]
+            ObjectAttributesManager.set_parent(obj=child, parent_class=parent_class, parent_object_name=parent_object_name)
+            ObjectAttributesManager.set_child(obj=objects_database[parent_class.__name__][parent_object_name],
+                                              child_class=table.object_class, child_object_name=child.object_name)
+    return objects_database
+
+
+def _add_array(arrays: List[np.ndarray], array: np.ndarray) -> dict:
+    arrays.append(np.ascontiguousarray(array))
+    return {}  # Filled with offset/dtype/shape once every array is known
+
+
+def _iter_array_headers(classes_header: List[dict]):
+    """Yield the array headers in the order their arrays are stored."""
+    for class_header in classes_header:
+        yield class_header["names"]
+        yield from class_header["numeric"].values()
+        yield class_header["parent_class"]
+        yield class_header["parent_row"]
+        yield from class_header.get("time_series", {}).values()
+
+
+def _content_hash(classes_header: List[dict], arrays: List[np.ndarray]) -> str:
+    content_hash = hashlib.sha256(json.dumps(classes_header, sort_keys=True).encode("utf-8"))
+    for array in arrays:
+        content_hash.update(memoryview(np.ascontiguousarray(array)).cast("B"))
+    return content_hash.hexdigest()
+
+
+def _aligned(size: int) -> int:
+    return -(-size // ALIGNMENT) * ALIGNMENT
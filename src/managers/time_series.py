@@ -0,0 +1,173 @@
+from src.utils.abstract_object_subclasses import get_abstract_object_subclass
+from dataclasses import fields
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+import os
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.managers.data_manager import DataManager
+
+TIME_SERIES_FIELD_TYPES = (float, int)
+INITIAL_CAPACITY = 16
+FILE_EXTENSION = ".f64"
+
+
+class TimeSeriesTable:
+    """
+    One time-series attribute of a class (e.g. `Load.load`): a (objects x intervals) float64 array whose
+    rows follow the object order of the class, held in memory or in a memory-mapped file.
+    """
+
+    def __init__(self,
+                 class_name: str,
+                 attr_name: str,
+                 n_intervals: int,
+                 path: Optional[str] = None,
+                 data: Optional[np.ndarray] = None):
+        self.class_name = class_name
+        self.attr_name = attr_name
+        self.n_intervals = n_intervals
+        self.path = path
+        if data is not None:
+            self.size = len(data)
+            self.data = data
+        else:
+            self.size = 0
+            self.data = self._allocate(INITIAL_CAPACITY)
+
+    def view(self, start: Optional[int] = None, stop: Optional[int] = None) -> np.ndarray:
+        """Zero-copy (objects, intervals) view of the table, optionally restricted to an interval window."""
+        return self.data[:self.size, start:stop]
+
+    def append_rows(self, values: np.ndarray) -> None:
+        """Append one row per object, broadcasting `values` ((rows,) scalars or (rows, intervals))."""
+        size = self.size + len(values)
+        if size > len(self.data):
+            self._grow(max(size, 2 * len(self.data)))
+        self.data[self.size:size] = values if np.ndim(values) == 2 else np.asarray(values)[:, np.newaxis]
+        self.size = size
+
+    def set_rows(self, rows: np.ndarray, values: np.ndarray) -> None:
+        self.data[rows] = values if np.ndim(values) == 2 else np.asarray(values)[:, np.newaxis]
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self.path is None:
+            return np.zeros((capacity, self.n_intervals), dtype=np.float64)
+        try:
+            f = open(self.path, "x+b")  # Never truncate the series of another table (or a live memory map)
+        except FileExistsError:
+            raise FileExistsError(f"Time-series file '{self.path}' already exists; use a separate time_series_dir "
+                                  f"for each DataManager.") from None
+        with f:
+            f.truncate(capacity * self.n_intervals * 8)
+        return np.memmap(self.path, dtype=np.float64, mode="r+", shape=(capacity, self.n_intervals))
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate to `capacity` rows (amortized doubling); views taken before growing no longer follow the table."""
+        if self.path is not None and isinstance(self.data, np.memmap) and self.data.filename == os.path.abspath(self.path):
+            self.data.flush()
+            with open(self.path, "r+b") as f:
+                f.truncate(capacity * self.n_intervals * 8)
+            self.data = np.memmap(self.path, dtype=np.float64, mode="r+", shape=(capacity, self.n_intervals))
+            return
+        data = self._allocate(capacity)
+        data[:self.size] = self.data[:self.size]
+        self.data = data
+
+
+class TimeSeriesStore:
+    """
+    Time-series attributes of a DataManager, one `TimeSeriesTable` per (class, attribute).
+
+    A table is created by the first series set on an attribute, its rows starting from the scalar
+    values of the objects broadcast over every interval; later objects get the attribute default,
+    and a scalar set through `add_attribute(s)` fills the object's row with that value. With a
+    `directory`, tables are memory-mapped files in it (`<Class>.<attribute>.f64`), so horizons larger
+    than memory are paged in on demand. Existing files are never overwritten, so each manager needs its own
+    directory.
+
+    Obtain it through `DataManager.time_series`; it follows the manager through its change listeners.
+    """
+
+    def __init__(self, manager: "DataManager", directory: Optional[str] = None):
+        self.manager = manager
+        self.directory = directory
+        self.tables: Dict[Tuple[str, str], TimeSeriesTable] = {}
+        self._rows: Dict[str, Dict[str, int]] = {}  # {"ClassName": {"ObjectName": row}}, for classes with tables
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def get_table(self, class_name: str, attr_name: str) -> Optional[TimeSeriesTable]:
+        return self.tables.get((class_name, attr_name))
+
+    def attribute_names(self, class_name: str) -> List[str]:
+        """Names of the time-series attributes of a class."""
+        return [attr_name for table_class_name, attr_name in self.tables if table_class_name == class_name]
+
+    def set_series(self, class_name: str, object_names: Sequence[str], attr_name: str, values: np.ndarray) -> None:
+        """Set the (len(object_names), intervals) series of existing objects, creating the table if needed."""
+        values = np.asarray(values, dtype=np.float64)
+        table = self.tables.get((class_name, attr_name))
+        if table is None:
+            table = self.add_table(class_name, attr_name, values.shape[1])
+        if values.shape[1] != table.n_intervals:
+            raise ValueError(f"Time series of '{class_name}.{attr_name}' have {table.n_intervals} intervals, "
+                             f"got {values.shape[1]}.")
+        table.set_rows(self.rows(class_name, object_names), values)
+
+    def add_table(self, class_name: str, attr_name: str, n_intervals: int,
+                  data: Optional[np.ndarray] = None) -> TimeSeriesTable:
+        """
+        Create the table of an attribute, from `data` (used without copying, e.g. a snapshot mapping)
+        or from the current scalar values of the objects.
+        """
+        assert_time_series_attribute(class_name, attr_name)
+        path = None if self.directory is None else os.path.join(self.directory, f"{class_name}.{attr_name}{FILE_EXTENSION}")
+        table = TimeSeriesTable(class_name, attr_name, n_intervals, path=path, data=data)
+        if data is None:
+            table.append_rows(self.manager.get_attribute_column(class_name, attr_name))
+        self.tables[(class_name, attr_name)] = table
+        return table
+
+    def rows(self, class_name: str, object_names: Sequence[str]) -> np.ndarray:
+        class_rows = self._rows.get(class_name)
+        if class_rows is None:
+            object_names_in_order = self.manager.get_object_names(class_name)
+            class_rows = self._rows[class_name] = dict(zip(object_names_in_order, range(len(object_names_in_order))))
+        return np.fromiter((class_rows[object_name] for object_name in object_names), dtype=np.int64,
+                           count=len(object_names))
+
+    # Listener interface (see DataManager.add_listener)
+
+    def on_objects_added(self, class_name: str, object_names: Sequence[str]) -> None:
+        class_rows = self._rows.get(class_name)
+        if class_rows is not None:
+            first_row = len(class_rows)
+            class_rows.update(zip(object_names, range(first_row, first_row + len(object_names))))
+        for (table_class_name, attr_name), table in self.tables.items():
+            if table_class_name == class_name:
+                default = _field_default(class_name, attr_name)
+                table.append_rows(np.full(len(object_names), default, dtype=np.float64))
+
+    def on_attributes_set(self, class_name: str, object_names: Sequence[str], attr_name: str, attr_values) -> None:
+        table = self.tables.get((class_name, attr_name))
+        if table is not None and np.ndim(attr_values) == 1:  # Scalars; series are set through set_series
+            table.set_rows(self.rows(class_name, object_names), np.asarray(attr_values, dtype=np.float64))
+
+
+def is_time_series_value(attr_value) -> bool:
+    """A 1-D sequence of numbers (one value per interval) is a time series."""
+    return not isinstance(attr_value, (str, bytes, dict)) and np.ndim(attr_value) == 1
+
+
+def assert_time_series_attribute(class_name: str, attr_name: str) -> None:
+    """Raise if the attribute is not a numeric dataclass field of the class."""
+    field_types = {class_field.name: class_field.type for class_field in fields(get_abstract_object_subclass(class_name))}
+    if attr_name not in field_types:
+        raise AttributeError(f"'{class_name}' object has no attribute '{attr_name}'")
+    if field_types[attr_name] not in TIME_SERIES_FIELD_TYPES:
+        raise TypeError(f"Attribute '{attr_name}' of '{class_name}' is not numeric and cannot hold a time series.")
+
+
+def _field_default(class_name: str, attr_name: str) -> float:
+    return float(getattr(get_abstract_object_subclass(class_name)(object_name=""), attr_name))
@@ -0,0 +1,301 @@
+from src.managers.columnar_database import ClassTable, INITIAL_CAPACITY, NO_PARENT
+from src.objects.registry_object_subclasses import object_class_registry
+from src.utils.abstract_object_subclasses import get_object_class_name
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Type, Union
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.managers.data_manager import DataManager
+
+# Memberships added after a CSR build are kept in per-parent delta lists until they exceed this share of the CSR
+DELTA_REBUILD_RATIO = 0.25
+MIN_DELTA_BEFORE_REBUILD = 1024
+
+ClassArgument = Union[Type, str]
+AGGREGATIONS = ("sum", "mean", "count", "min", "max")
+
+
+class _ClassIndex:
+    """Integer ids of the objects of one class (their insertion order) and their parent links."""
+
+    def __init__(self, class_name: str):
+        self.class_name = class_name
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.parent_class_names: List[str] = []  # Parent class id -> class name
+        self._parent_class = np.full(INITIAL_CAPACITY, NO_PARENT, dtype=np.int32)
+        self._parent_id = np.full(INITIAL_CAPACITY, NO_PARENT, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def parent_class(self) -> np.ndarray:
+        return self._parent_class[:len(self.names)]
+
+    @property
+    def parent_id(self) -> np.ndarray:
+        return self._parent_id[:len(self.names)]
+
+    def add(self, object_names: Sequence[str]) -> None:
+        size = len(self.names) + len(object_names)
+        if size > len(self._parent_id):
+            capacity = max(size, 2 * len(self._parent_id))
+            self._parent_class = _resized(self._parent_class, capacity)
+            self._parent_id = _resized(self._parent_id, capacity)
+        first_id = len(self.names)
+        self.names.extend(object_names)
+        self.ids.update(zip(object_names, range(first_id, size)))
+
+    def parent_class_id(self, parent_class_name: str) -> int:
+        if parent_class_name not in self.parent_class_names:
+            self.parent_class_names.append(parent_class_name)
+        return self.parent_class_names.index(parent_class_name)
+
+
+@dataclass
+class _Adjacency:
+    """CSR adjacency of one (parent class, child class) relation, plus the memberships added since it was built."""
+    indptr: np.ndarray
+    indices: np.ndarray
+    delta: Dict[int, List[int]]
+    delta_size: int = 0
+
+
+class TopologyIndex:
+    """
+    Integer-indexed topology of a DataManager model.
+
+    Objects get integer ids (their insertion order in the class, the order of `get_object_names` and
+    `get_attribute_column`). Every child stores its parent as (parent class id, parent id) arrays,
+    giving O(1) reverse lookups, and each parent -> child relation (e.g. Node -> Generator,
+    Generator -> Fuel) is a CSR adjacency built on first use. The index listens to the manager:
+    new objects and memberships are applied incrementally, new memberships going to small per-parent
+    delta lists that are merged into the CSR only once they grow large, so no query rescans the model.
+
+    Obtain it through `DataManager.topology`.
+    """
+
+    def __init__(self, manager: "DataManager"):
+        self.manager = manager
+        self.classes: Dict[str, _ClassIndex] = {}
+        self._adjacency: Dict[Tuple[str, str], _Adjacency] = {}
+        for class_name in manager.get_added_object_classes():
+            self.on_objects_added(class_name, manager.get_object_names(class_name))
+        for class_name, class_objects in manager.objects_database.items():
+            if isinstance(class_objects, ClassTable):
+                self._add_table_parents(class_name, class_objects)
+                continue
+            child_names, parent_class_names, parent_names = [], [], []
+            for obj in class_objects.values():
+                for parent_class_name, parent_name in obj.parent.items():
+                    child_names.append(obj.object_name)
+                    parent_class_names.append(parent_class_name)
+                    parent_names.append(parent_name)
+            for parent_class_name in dict.fromkeys(parent_class_names):
+                rows = [row for row, name in enumerate(parent_class_names) if name == parent_class_name]
+                self.on_memberships_added(class_name, [child_names[row] for row in rows],
+                                          parent_class_name, [parent_names[row] for row in rows])
+
+    # Listener interface (see DataManager.add_listener)
+
+    def on_objects_added(self, class_name: str, object_names: Sequence[str]) -> None:
+        self._class_index(class_name).add(list(object_names))
+
+    def on_memberships_added(self,
+                             child_class_name: str,
+                             child_names: Sequence[str],
+                             parent_class_name: str,
+                             parent_names: Sequence[str]) -> None:
+        child_index = self._class_index(child_class_name)
+        parent_index = self._class_index(parent_class_name)
+        child_ids = np.fromiter((child_index.ids[name] for name in child_names), dtype=np.int64, count=len(child_names))
+        parent_ids = np.fromiter((parent_index.ids[name] for name in parent_names), dtype=np.int64,
+                                 count=len(parent_names))
+        if (child_index.parent_class[child_ids] != NO_PARENT).any():
+            # Reassigned children would leave stale entries in the CSR of their previous parent class
+            self._drop_adjacencies(child_class_name)
+        child_index._parent_class[child_ids] = child_index.parent_class_id(parent_class_name)
+        child_index._parent_id[child_ids] = parent_ids
+
+        adjacency = self._adjacency.get((parent_class_name, child_class_name))
+        if adjacency is None:
+            return  # Built from the parent arrays on first use
+        for parent_id, child_id in zip(parent_ids.tolist(), child_ids.tolist()):
+            adjacency.delta.setdefault(parent_id, []).append(child_id)
+        adjacency.delta_size += len(child_ids)
+        if adjacency.delta_size > max(MIN_DELTA_BEFORE_REBUILD, DELTA_REBUILD_RATIO * len(adjacency.indices)):
+            del self._adjacency[(parent_class_name, child_class_name)]
+
+    # Queries
+
+    def object_id(self, object_class: ClassArgument, object_name: str) -> int:
+        """Integer id of an object."""
+        class_index = self._get_class_index(object_class)
+        if object_name not in class_index.ids:
+            raise ValueError(f"Object '{object_name}' of class '{class_index.class_name}' not found in DataManager.")
+        return class_index.ids[object_name]
+
+    def object_names(self, object_class: ClassArgument, object_ids) -> List[str]:
+        """Names of the given object ids."""
+        names = self._get_class_index(object_class).names
+        return [names[object_id] for object_id in np.asarray(object_ids).tolist()]
+
+    def csr(self, parent_class: ClassArgument, child_class: ClassArgument) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        CSR adjacency (indptr, indices) of a relation, covering every membership: the children ids of
+        parent p are indices[indptr[p]:indptr[p + 1]].
+        """
+        parent_class_name, child_class_name = get_object_class_name(parent_class), get_object_class_name(child_class)
+        adjacency = self._adjacency.get((parent_class_name, child_class_name))
+        if adjacency is not None and (adjacency.delta_size
+                                      or len(adjacency.indptr) != len(self.classes[parent_class_name]) + 1):
+            del self._adjacency[(parent_class_name, child_class_name)]
+        adjacency = self._get_adjacency(parent_class_name, child_class_name)
+        return adjacency.indptr, adjacency.indices
+
+    def child_ids(self, parent_class: ClassArgument, parent_name: str, child_class: ClassArgument) -> np.ndarray:
+        """Ids of the children of one class under a parent."""
+        parent_class_name, child_class_name = get_object_class_name(parent_class), get_object_class_name(child_class)
+        parent_id = self.object_id(parent_class_name, parent_name)
+        adjacency = self._get_adjacency(parent_class_name, child_class_name)
+        child_ids = adjacency.indices[adjacency.indptr[parent_id]:adjacency.indptr[parent_id + 1]] \
+            if parent_id + 1 < len(adjacency.indptr) else np.zeros(0, dtype=np.int64)
+        if parent_id in adjacency.delta:
+            child_ids = np.concatenate((child_ids, adjacency.delta[parent_id]))
+        return child_ids
+
+    def children(self, parent_class: ClassArgument, parent_name: str, child_class: ClassArgument) -> List[str]:
+        """Names of the children of one class under a parent (e.g. the Generators of a Node)."""
+        return self.object_names(child_class, self.child_ids(parent_class, parent_name, child_class))
+
+    def parent(self, child_class: ClassArgument, child_name: str) -> Optional[Tuple[str, str]]:
+        """(parent class name, parent name) of an object, or None."""
+        child_index = self._get_class_index(child_class)
+        child_id = self.object_id(child_class, child_name)
+        parent_class_id = int(child_index.parent_class[child_id])
+        if parent_class_id == NO_PARENT:
+            return None
+        parent_class_name = child_index.parent_class_names[parent_class_id]
+        return parent_class_name, self.classes[parent_class_name].names[child_index.parent_id[child_id]]
+
+    def descendants(self, object_class: ClassArgument, object_name: str, path: Sequence[ClassArgument]) -> List[str]:
+        """
+        Names of the objects reached by following `path` down from an object, e.g. the Fuels of the
+        Generators of a Node: `descendants(Node, "node_1", [Generator, Fuel])`.
+        """
+        current_class = get_object_class_name(object_class)
+        current_ids = np.array([self.object_id(current_class, object_name)], dtype=np.int64)
+        for child_class in path:
+            child_class = get_object_class_name(child_class)
+            indptr, indices = self.csr(current_class, child_class)
+            current_ids = current_ids[current_ids + 1 < len(indptr)]
+            starts, ends = indptr[current_ids], indptr[current_ids + 1]
+            current_ids = indices[_ranges(starts, ends)]
+            current_class = child_class
+        return self.object_names(current_class, current_ids)
+
+    def child_counts(self, parent_class: ClassArgument, child_class: ClassArgument) -> np.ndarray:
+        """Number of children of one class under every parent, indexed by parent id."""
+        return self.aggregate(parent_class, child_class, how="count")
+
+    def childless(self, parent_class: ClassArgument, child_class: ClassArgument) -> List[str]:
+        """Names of the parents without any child of a class (e.g. the Nodes without Load)."""
+        return self.object_names(parent_class, np.flatnonzero(self.child_counts(parent_class, child_class) == 0))
+
+    def aggregate(self,
+                  parent_class: ClassArgument,
+                  child_class: ClassArgument,
+                  attr_name: Optional[str] = None,
+                  how: str = "sum") -> np.ndarray:
+        """
+        Group-by of a numeric child attribute per parent, indexed by parent id (e.g. the total
+        `nominal_power` of the Generators of every Node). `how` is one of sum, mean, count, min, max;
+        parents without children get 0 (sum, count) or NaN (mean, min, max).
+        """
+        if how not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation '{how}'. Expected one of {list(AGGREGATIONS)}.")
+        parent_class_name, child_class_name = get_object_class_name(parent_class), get_object_class_name(child_class)
+        n_parents = len(self._get_class_index(parent_class_name))
+        child_index = self._get_class_index(child_class_name)
+        is_member = child_index.parent_class == child_index.parent_class_id(parent_class_name)
+        parent_ids = child_index.parent_id[is_member]
+        counts = np.bincount(parent_ids, minlength=n_parents).astype(np.float64)
+        if how == "count":
+            return counts
+        if attr_name is None:
+            raise ValueError(f"Aggregation '{how}' requires an attribute name.")
+        values = np.asarray(self.manager.get_attribute_column(child_class_name, attr_name), dtype=np.float64)[is_member]
+        if how in ("sum", "mean"):
+            totals = np.bincount(parent_ids, weights=values, minlength=n_parents)
+            if how == "sum":
+                return totals
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return totals / counts
+        result = np.full(n_parents, np.inf if how == "min" else -np.inf)
+        (np.minimum if how == "min" else np.maximum).at(result, parent_ids, values)
+        result[counts == 0] = np.nan
+        return result
+
+    def aggregate_by_name(self, parent_class: ClassArgument, child_class: ClassArgument,
+                          attr_name: Optional[str] = None, how: str = "sum") -> Dict[str, float]:
+        """`aggregate` as a {parent name: value} dict."""
+        values = self.aggregate(parent_class, child_class, attr_name, how)
+        return dict(zip(self._get_class_index(parent_class).names, values.tolist()))
+
+    # Internals
+
+    def _class_index(self, class_name: str) -> _ClassIndex:
+        class_index = self.classes.get(class_name)
+        if class_index is None:
+            class_index = self.classes[class_name] = _ClassIndex(class_name)
+        return class_index
+
+    def _get_class_index(self, object_class: ClassArgument) -> _ClassIndex:
+        return self._class_index(get_object_class_name(object_class))
+
+    def _add_table_parents(self, class_name: str, table: ClassTable) -> None:
+        """Copy the parent columns of a columnar table, translating registry class ids into local ones."""
+        class_index = self.classes[class_name]
+        parent_class_ids, parent_rows = table.parent_columns()
+        for registry_id in np.unique(parent_class_ids[parent_class_ids != NO_PARENT]).tolist():
+            rows = parent_class_ids == registry_id
+            class_index._parent_class[:len(class_index)][rows] = \
+                class_index.parent_class_id(object_class_registry.get_name(registry_id))
+            class_index._parent_id[:len(class_index)][rows] = parent_rows[rows]
+
+    def _drop_adjacencies(self, child_class_name: str) -> None:
+        for key in [key for key in self._adjacency if key[1] == child_class_name]:
+            del self._adjacency[key]
+
+    def _get_adjacency(self, parent_class_name: str, child_class_name: str) -> _Adjacency:
+        adjacency = self._adjacency.get((parent_class_name, child_class_name))
+        if adjacency is None:
+            child_index = self._class_index(child_class_name)
+            n_parents = len(self._class_index(parent_class_name))
+            is_member = child_index.parent_class == child_index.parent_class_id(parent_class_name)
+            child_ids = np.flatnonzero(is_member)
+            parent_ids = child_index.parent_id[child_ids]
+            order = np.argsort(parent_ids, kind="stable")
+            indptr = np.zeros(n_parents + 1, dtype=np.int64)
+            np.cumsum(np.bincount(parent_ids, minlength=n_parents), out=indptr[1:])
+            adjacency = _Adjacency(indptr=indptr, indices=child_ids[order], delta={})
+            self._adjacency[(parent_class_name, child_class_name)] = adjacency
+        return adjacency
+
+
+def _ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenation of arange(start, end) for every pair, without a Python loop."""
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+    return np.arange(total, dtype=np.int64) + offsets
+
+
+def _resized(array: np.ndarray, capacity: int) -> np.ndarray:
+    resized = np.full(capacity, NO_PARENT, dtype=array.dtype)
+    resized[:len(array)] = array
+    return resized
@@ -1,4 +1,3 @@
 from .abstract_object_class import AbstractObject
-from src.utils.object_classes_loader import generate_object_class
-generate_object_class() # Ensure object_class.py is always updated
-from src.objects.object_class import ObjectClass
+from . import specific_object_classes  # Defining the classes registers them in object_class_registry
+from .object_class import ObjectClass
@@ -1,8 +1,13 @@
 from abc import ABC
 from dataclasses import dataclass, field
+from src.objects.registry_object_subclasses import object_class_registry
 
 @dataclass
 class AbstractObject(ABC):
     object_name: str  # Required attribute for all subclasses
     parent: dict = field(default_factory=dict)  # Stores references to parent objects
     children: dict = field(default_factory=dict)  # Stores references to child objects
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        object_class_registry.register(cls)  # Keeps name <-> class resolution O(1)
@@ -1,15 +1,24 @@
-class ObjectClass:
-    """Auto-generated class for specific object access."""
+from src.objects.registry_object_subclasses import object_class_registry
 
-    from src.objects.specific_object_classes import Fuel
-    Fuel = Fuel
 
-    from src.objects.specific_object_classes import Generator
-    Generator = Generator
+class _ObjectClassNamespace(type):
+    """Metaclass resolving `ObjectClass.<Name>` through the object class registry."""
 
-    from src.objects.specific_object_classes import Load
-    Load = Load
+    def __getattr__(cls, object_class_name: str):
+        object_class = object_class_registry.get(object_class_name)
+        if object_class is None:
+            raise AttributeError(f"ObjectClass has no object class '{object_class_name}'.")
+        return object_class
 
-    from src.objects.specific_object_classes import Node
-    Node = Node
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | set(object_class_registry.names()))
 
+
+class ObjectClass(metaclass=_ObjectClassNamespace):
+    """
+    Namespace for specific object access (e.g. `ObjectClass.Node`).
+
+    Attributes are looked up lazily in the registry, so every AbstractObject subclass is available
+    as soon as it is defined, without generating code at import time. Static typing is provided by
+    the `object_class.pyi` stub (see `src.utils.object_classes_loader`).
+    """
@@ -0,0 +1,12 @@
+# source-sha256: 08f441fa2f6d352ab5c560f138b1a0616645d16837937fbc841d50ad24d483aa
+# Auto-generated by src.utils.object_classes_loader, do not edit.
+from typing import ClassVar, Type
+from src.objects.specific_object_classes import Fuel, Generator, Load, Node
+
+class ObjectClass:
+    """Auto-generated typing stub for specific object access."""
+
+    Fuel: ClassVar[Type[Fuel]]
+    Generator: ClassVar[Type[Generator]]
+    Load: ClassVar[Type[Load]]
+    Node: ClassVar[Type[Node]]
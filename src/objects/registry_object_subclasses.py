@@ -0,0 +1,66 @@
+from typing import Dict, List, Optional, Type
+
+
+class ObjectClassRegistry:
+    """
+    Registry of the AbstractObject subclasses, giving O(1) name <-> class <-> index resolution.
+
+    Subclasses register themselves from `AbstractObject.__init_subclass__`, so the registry is
+    built once at class definition time instead of scanning `__subclasses__()` on every lookup.
+    Every registration bumps `version`, which lets derived lookup tables (e.g. the compiled
+    relationship rules) detect that they are stale.
+    """
+
+    def __init__(self):
+        self._classes_by_name: Dict[str, Type] = {}
+        self._index_by_name: Dict[str, int] = {}
+        self._index_by_key: Dict[object, int] = {}  # Keyed by both class objects and class names
+        self._names: List[str] = []
+        self.version = 0
+
+    def register(self, object_class: Type) -> None:
+        """Register a subclass. Redefining a class name replaces the class but keeps its index."""
+        object_class_name = object_class.__name__
+        if object_class_name not in self._index_by_name:
+            self._index_by_name[object_class_name] = len(self._names)
+            self._names.append(object_class_name)
+        self._classes_by_name[object_class_name] = object_class
+        self._index_by_key[object_class_name] = self._index_by_name[object_class_name]
+        self._index_by_key[object_class] = self._index_by_name[object_class_name]
+        self.version += 1
+
+    def __contains__(self, object_class_name: str) -> bool:
+        return object_class_name in self._classes_by_name
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def get(self, object_class_name: str) -> Optional[Type]:
+        """Return the class registered under a name, or None."""
+        return self._classes_by_name.get(object_class_name)
+
+    def get_index(self, object_class_name: str) -> Optional[int]:
+        """Return the integer index of a class name, or None."""
+        return self._index_by_name.get(object_class_name)
+
+    def lookup_index(self, object_class) -> Optional[int]:
+        """Return the index of a registered class object or class name in a single dict lookup, or None."""
+        try:
+            return self._index_by_key.get(object_class)
+        except TypeError:  # Unhashable input
+            return None
+
+    def get_name(self, index: int) -> str:
+        """Return the class name stored at an integer index."""
+        return self._names[index]
+
+    def names(self) -> List[str]:
+        """Return all registered class names, ordered by index."""
+        return list(self._names)
+
+    def classes(self) -> Dict[str, Type]:
+        """Return a {class_name: class} copy of the registry."""
+        return dict(self._classes_by_name)
+
+
+object_class_registry = ObjectClassRegistry()
@@ -0,0 +1,2 @@
+from .shared_arrays import SharedArrays
+from .scenario_runner import Scenario, ScenarioResult, ScenarioRunner
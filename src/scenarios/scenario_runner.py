@@ -0,0 +1,188 @@
+from src.dispatch.dispatch_data import DispatchData, generator_marginal_cost, node_demand
+from src.dispatch.merit_order import merit_order_dispatch, DEFAULT_VALUE_OF_LOST_LOAD
+from src.scenarios.shared_arrays import SharedArrays, ArrayLayout
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, Optional
+import multiprocessing
+import os
+import numpy as np
+
+SHARED_FIELDS = ("capacity", "generator_node", "load", "load_node", "fuel_price", "fuel_generator", "demand_profile")
+
+
+@dataclass
+class Scenario:
+    """
+    A what-if variant of the base network, expressed as small deltas.
+
+    - load_scale: factor applied to every `Load.load`.
+    - loads: {load name: new `Load.load`} (applied before `load_scale`); when the base loads are time
+      series, a value is either one value per interval or a scalar held over every interval.
+    - fuel_prices: {fuel name: new `Fuel.price`}.
+    """
+    name: str
+    load_scale: float = 1.0
+    loads: Dict[str, float] = field(default_factory=dict)
+    fuel_prices: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class ScenarioDelta:
+    """A Scenario resolved to integer rows of the base arrays; this is all that is sent to a worker."""
+    name: str
+    load_scale: float
+    load_rows: np.ndarray
+    load_values: np.ndarray
+    fuel_rows: np.ndarray
+    fuel_values: np.ndarray
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Outcome of one scenario: marginal_price[t, zone], unserved[t, zone], the dispatch cost of each
+    interval, and the full dispatch[t, g] only when the runner keeps it.
+    """
+    name: str
+    marginal_price: np.ndarray
+    unserved: np.ndarray
+    cost: np.ndarray
+    dispatch: Optional[np.ndarray] = None
+
+
+class ScenarioRunner:
+    """
+    Evaluates many scenarios of one base network on a process pool.
+
+    The base network arrays are published once in shared memory; every worker attaches to them when
+    it starts and applies each scenario as a delta on private copies of the (small) load and fuel
+    arrays, then runs the merit-order dispatch. At most `max_in_flight` scenarios are submitted at a
+    time and results are yielded as soon as they finish, in completion order.
+
+    Use as a context manager, so the shared memory block is freed:
+
+        with ScenarioRunner(extract_dispatch_data(manager)) as runner:
+            for result in runner.run(scenarios):
+                ...
+    """
+
+    def __init__(self,
+                 base_data: DispatchData,
+                 max_workers: Optional[int] = None,
+                 max_in_flight: Optional[int] = None,
+                 single_bus: bool = False,
+                 keep_dispatch: bool = False,
+                 value_of_lost_load: float = DEFAULT_VALUE_OF_LOST_LOAD,
+                 mp_context: Optional[str] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.max_workers
+        self.options = {"single_bus": single_bus, "keep_dispatch": keep_dispatch,
+                        "value_of_lost_load": value_of_lost_load, "n_nodes": len(base_data.node_names)}
+        self.load_index = {load_name: row for row, load_name in enumerate(base_data.load_names)}
+        self.fuel_index = {fuel_name: row for row, fuel_name in enumerate(base_data.fuel_names)}
+        self.load_intervals = base_data.load.shape[1] if np.ndim(base_data.load) == 2 else None
+        arrays = {array_name: getattr(base_data, array_name) for array_name in SHARED_FIELDS}
+        if arrays["demand_profile"] is None:  # Optional in hand-made DispatchData: loads apply as they are
+            arrays["demand_profile"] = np.ones(base_data.n_intervals)
+        self.shared_arrays = SharedArrays.publish(arrays)
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                            mp_context=multiprocessing.get_context(mp_context),
+                                            initializer=_attach_worker,
+                                            initargs=(self.shared_arrays.name, self.shared_arrays.layout, self.options))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Shut the pool down and free the shared memory block."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.shared_arrays.close()
+
+    def resolve(self, scenario: Scenario) -> ScenarioDelta:
+        """Translate the object names of a scenario into rows of the base arrays."""
+        unknown = [name for name in scenario.loads if name not in self.load_index]
+        unknown += [name for name in scenario.fuel_prices if name not in self.fuel_index]
+        if unknown:
+            raise ValueError(f"Scenario '{scenario.name}' overrides unknown objects: {unknown}.")
+        return ScenarioDelta(name=scenario.name,
+                             load_scale=scenario.load_scale,
+                             load_rows=np.fromiter((self.load_index[name] for name in scenario.loads), dtype=np.int64),
+                             load_values=self._load_values(scenario),
+                             fuel_rows=np.fromiter((self.fuel_index[name] for name in scenario.fuel_prices), dtype=np.int64),
+                             fuel_values=np.fromiter(scenario.fuel_prices.values(), dtype=np.float64))
+
+    def _load_values(self, scenario: Scenario) -> np.ndarray:
+        """Load overrides as (loads,) values, or (loads, intervals) series when the base loads are time series."""
+        if self.load_intervals is None:
+            series = [name for name, value in scenario.loads.items() if np.ndim(value) != 0]
+            if series:
+                raise ValueError(f"Scenario '{scenario.name}' sets time series on {series}, but the base loads are scalars.")
+            return np.fromiter(scenario.loads.values(), dtype=np.float64, count=len(scenario.loads))
+        load_values = np.empty((len(scenario.loads), self.load_intervals))
+        for row, (name, value) in enumerate(scenario.loads.items()):
+            if np.ndim(value) != 0 and len(value) != self.load_intervals:
+                raise ValueError(f"Scenario '{scenario.name}' sets {len(value)} intervals on '{name}', "
+                                 f"the base has {self.load_intervals}.")
+            load_values[row] = value
+        return load_values
+
+    def run(self, scenarios: Iterable[Scenario]) -> Iterator[ScenarioResult]:
+        """Evaluate the scenarios, yielding each result as soon as it is available."""
+        scenarios = iter(scenarios)
+        in_flight = set()
+        while True:
+            for scenario in scenarios:
+                in_flight.add(self.executor.submit(_evaluate_scenario, self.resolve(scenario)))
+                if len(in_flight) >= self.max_in_flight:
+                    break
+            if not in_flight:
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+# Worker process state, set once by `_attach_worker`
+_worker_arrays: Optional[SharedArrays] = None
+_worker_options: dict = {}
+
+
+def _attach_worker(shm_name: str, layout: ArrayLayout, options: dict) -> None:
+    global _worker_arrays, _worker_options
+    _worker_arrays = SharedArrays.attach(shm_name, layout)
+    _worker_options = options
+
+
+def _evaluate_scenario(delta: ScenarioDelta) -> ScenarioResult:
+    """Apply a scenario delta to the shared base arrays and dispatch it (runs in a worker)."""
+    base = _worker_arrays
+    load = base["load"]
+    if len(delta.load_rows) or delta.load_scale != 1.0:
+        load = load.copy()
+        if len(delta.load_rows):
+            load[delta.load_rows] = delta.load_values
+        if delta.load_scale != 1.0:
+            load *= delta.load_scale
+    fuel_price = base["fuel_price"]
+    if len(delta.fuel_rows):
+        fuel_price = fuel_price.copy()
+        fuel_price[delta.fuel_rows] = delta.fuel_values
+
+    capacity = base["capacity"]
+    marginal_cost = generator_marginal_cost(fuel_price, base["fuel_generator"], len(capacity))
+    demand = node_demand(load, base["load_node"], _worker_options["n_nodes"], base["demand_profile"])
+    if _worker_options["single_bus"]:
+        zone, demand = np.zeros(len(capacity), dtype=np.int64), demand.sum(axis=1, keepdims=True)
+    else:
+        zone = base["generator_node"]
+
+    result = merit_order_dispatch(capacity, marginal_cost, zone, demand, _worker_options["value_of_lost_load"])
+    return ScenarioResult(name=delta.name,
+                          marginal_price=result.marginal_price,
+                          unserved=result.unserved,
+                          cost=result.dispatch @ marginal_cost,
+                          dispatch=result.dispatch if _worker_options["keep_dispatch"] else None)
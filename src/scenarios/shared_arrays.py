@@ -0,0 +1,61 @@
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+import numpy as np
+
+ALIGNMENT = 64  # Cache-line aligned array offsets
+
+# Layout entry: (array name, dtype string, shape, byte offset in the block)
+ArrayLayout = List[Tuple[str, str, Tuple[int, ...], int]]
+
+
+class SharedArrays:
+    """
+    Publishes a set of NumPy arrays in a single `multiprocessing.shared_memory` block.
+
+    The owner creates the block and copies the arrays once; other processes attach to it with
+    `SharedArrays.attach(name, layout)` and get read-only views, without copying or pickling the data.
+    Attaching processes are expected to be multiprocessing children, which share the owner's resource tracker.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, layout: ArrayLayout, owner: bool):
+        self.shm = shm
+        self.layout = layout
+        self.owner = owner
+        self.arrays: Dict[str, np.ndarray] = {}
+        for array_name, dtype, shape, offset in layout:
+            array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+            array.flags.writeable = owner
+            self.arrays[array_name] = array
+
+    @classmethod
+    def publish(cls, arrays: Dict[str, np.ndarray]) -> "SharedArrays":
+        """Create a shared memory block holding a copy of `arrays`."""
+        layout: ArrayLayout = []
+        size = 0
+        for array_name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            layout.append((array_name, array.dtype.str, array.shape, size))
+            size += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+        shared_arrays = cls(shared_memory.SharedMemory(create=True, size=max(size, 1)), layout, owner=True)
+        for array_name, array in arrays.items():
+            shared_arrays.arrays[array_name][...] = array
+        return shared_arrays
+
+    @classmethod
+    def attach(cls, shm_name: str, layout: ArrayLayout) -> "SharedArrays":
+        """Attach to a block published by another process (read-only views)."""
+        return cls(shared_memory.SharedMemory(name=shm_name), layout, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def __getitem__(self, array_name: str) -> np.ndarray:
+        return self.arrays[array_name]
+
+    def close(self) -> None:
+        """Release the views and the mapping; the owner also frees the block."""
+        self.arrays = {}
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
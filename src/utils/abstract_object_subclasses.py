@@ -1,4 +1,5 @@
 from src.objects.abstract_object_class import AbstractObject
+from src.objects.registry_object_subclasses import object_class_registry
 from typing import Optional, Type
 
 def get_object_class_name(object_class: Optional[Type[AbstractObject] | str]) -> str:
@@ -18,8 +19,7 @@ def get_object_class_name(object_class: Optional[Type[AbstractObject] | str]) ->
     if isinstance(object_class, type) and issubclass(object_class, AbstractObject):
         return object_class.__name__
     elif isinstance(object_class, str):
-        subclass_names = {subclass.__name__ for subclass in AbstractObject.__subclasses__()}
-        if object_class in subclass_names:
+        if object_class in object_class_registry:
             return object_class
         raise ValueError(f"'{object_class}' is not a valid AbstractObject subclass name.")
     else:
@@ -38,12 +38,34 @@ def get_abstract_object_subclass (object_class_name: str) -> Type[AbstractObject
     Raises:
         ValueError: If the class name does not correspond to a valid subclass.
     """
-    subclass_lookup = {cls.__name__: cls for cls in AbstractObject.__subclasses__()}
+    subclass = object_class_registry.get(object_class_name)
 
-    if object_class_name not in subclass_lookup:
+    if subclass is None:
         raise ValueError(f"'{object_class_name}' is not a recognized subclass of AbstractObject.")
 
-    return subclass_lookup[object_class_name]
+    return subclass
+
+def get_object_class_index(object_class: Type[AbstractObject] | str) -> int:
+    """
+    Retrieve the registry index of a subclass of AbstractObject.
+
+    Args:
+        object_class (Type[AbstractObject] | str): The subclass or its name.
+
+    Returns:
+        int: The stable integer index used by the compiled lookup tables.
+
+    Raises:
+        ValueError: If the class is not a registered subclass.
+        TypeError: If the input is neither a subclass nor a string.
+    """
+    object_class_index = object_class_registry.lookup_index(object_class)
+    if object_class_index is not None:
+        return object_class_index
+    object_class_index = object_class_registry.get_index(get_object_class_name(object_class))
+    if object_class_index is None:
+        raise ValueError(f"'{object_class}' is not a recognized subclass of AbstractObject.")
+    return object_class_index
 
 def assert_abstract_object_subclass(object_class: Type[AbstractObject] | str) -> None:
     """
@@ -1,35 +1,77 @@
-import importlib.util
+"""
+Build step generating the `object_class.pyi` typing stub for `ObjectClass`.
+
+At runtime `ObjectClass` resolves classes through the registry, so nothing here runs on import.
+Run it explicitly after editing `specific_object_classes.py`:
+
+    python -m src.utils.object_classes_loader [--force]
+
+The stub records the SHA-256 of its source; when the source is unchanged the stub is not rewritten.
+"""
+import argparse
+import ast
+import hashlib
 import os
-import inspect
+import re
+from typing import List, Optional
+
+HASH_HEADER = "# source-sha256: "
+
+def find_class_names(module_path: str) -> List[str]:
+    """Return the names of the classes defined at the top level of a module, without importing it."""
+    with open(module_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=module_path)
+    return sorted(node.name for node in tree.body if isinstance(node, ast.ClassDef))
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
 
-def load_classes(module_path, module_name):
-    """Dynamically load all classes from a module."""
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+def read_recorded_hash(stub_path: str) -> Optional[str]:
+    """Return the source hash recorded in an existing stub, or None."""
+    if not os.path.exists(stub_path):
+        return None
+    with open(stub_path, encoding="utf-8") as f:
+        match = re.match(re.escape(HASH_HEADER) + r"([0-9a-f]{64})", f.readline())
+    return match.group(1) if match else None
 
-    return {
-        name: cls for name, cls in inspect.getmembers(module, inspect.isclass)
-        if cls.__module__ == module_name
-    }
+def generate_object_class(force: bool = False) -> bool:
+    """
+    Generate `object_class.pyi` with all specific object classes.
 
-def generate_object_class():
-    """Generate `object_class.py` with all specific object classes."""
+    Returns:
+        bool: True if the stub was written, False if it was already up to date.
+    """
     base_dir = os.path.dirname(os.path.dirname(__file__))
     module_path = os.path.join(base_dir, "objects", "specific_object_classes.py")
     module_name = "src.objects.specific_object_classes"
+    output_file = os.path.join(os.path.dirname(module_path), "object_class.pyi")
 
-    class_dict = load_classes(module_path, module_name)
-    output_file = os.path.join(os.path.dirname(module_path), "object_class.py")
+    source_hash = hash_file(module_path)
+    if not force and read_recorded_hash(output_file) == source_hash:
+        return False
 
-    with open(output_file, "w") as f:
-        f.write('class ObjectClass:\n    """Auto-generated class for specific object access."""\n\n')
-        for class_name in class_dict:
-            f.write(f"    from src.objects.specific_object_classes import {class_name}\n")
-            f.write(f"    {class_name} = {class_name}\n\n")
+    class_names = find_class_names(module_path)
+    lines = [f"{HASH_HEADER}{source_hash}",
+             "# Auto-generated by src.utils.object_classes_loader, do not edit.",
+             "from typing import ClassVar, Type",
+             f"from {module_name} import {', '.join(class_names)}",
+             "",
+             "class ObjectClass:",
+             '    """Auto-generated typing stub for specific object access."""',
+             ""]
+    lines += [f"    {class_name}: ClassVar[Type[{class_name}]]" for class_name in class_names]
 
-    print(f"ObjectClass structure saved in {output_file}")
+    # Write to a temporary file and rename, so concurrent builds never expose a partial stub
+    temporary_file = f"{output_file}.{os.getpid()}.tmp"
+    with open(temporary_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(temporary_file, output_file)
+    return True
 
-# Run automatically if executed directly
 if __name__ == "__main__":
-    generate_object_class()
+    parser = argparse.ArgumentParser(description="Generate the ObjectClass typing stub.")
+    parser.add_argument("--force", action="store_true", help="Rewrite the stub even if the source is unchanged.")
+    written = generate_object_class(force=parser.parse_args().force)
+    print("ObjectClass stub updated." if written else "ObjectClass stub already up to date.")